@@ -7,6 +7,7 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QGuiApplication, QIcon
 from PySide6.QtWidgets import QApplication
 
+from app.services.manage_dir_cache import ManageDirCacheStore
 from app.services.paths import icon_path
 from app.services.ui_scaling import UIScalingService
 from app.ui.main_window import MainWindow
@@ -35,6 +36,7 @@ def main() -> int:
         active_scale_mode=resolved_mode,
         auto_connect_on_launch=True,
         check_updates_on_launch=True,
+        manage_dir_cache_store=None if "--no-dir-cache" in sys.argv[1:] else ManageDirCacheStore(),
     )
     if icon_file.exists():
         window.setWindowIcon(app.windowIcon())
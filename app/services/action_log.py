@@ -1,13 +1,20 @@
 from __future__ import annotations
 
-import json
+import os
+import queue
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from app.services import json_codec
 from app.services.paths import user_data_dir
 
 
+def _json_line(payload: dict[str, Any]) -> bytes:
+    return json_codec.dumps(payload, sort_keys=True)
+
+
 class ActionLogService:
     """Append-only structured action log for key operator workflows."""
 
@@ -17,18 +24,125 @@ class ActionLogService:
         self.log_path = log_path.expanduser()
 
     def log_event(self, action: str, **fields: Any) -> None:
+        self._append_json_line(self._build_payload(action, fields))
+
+    @staticmethod
+    def _build_payload(action: str, fields: dict[str, Any]) -> dict[str, Any]:
         payload: dict[str, Any] = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "action": action,
         }
         payload.update(fields)
-        self._append_json_line(payload)
+        return payload
 
     def _append_json_line(self, payload: dict[str, Any]) -> None:
+        self._write_lines([_json_line(payload)])
+
+    def _write_lines(self, lines: list[bytes]) -> None:
+        if not lines:
+            return
         try:
             self.log_path.parent.mkdir(parents=True, exist_ok=True)
-            with self.log_path.open("a", encoding="utf-8") as handle:
-                handle.write(json.dumps(payload, sort_keys=True) + "\n")
+            with self.log_path.open("ab") as handle:
+                handle.write(b"\n".join(lines) + b"\n")
         except OSError:
             # Logging must never break user workflows.
             return
+
+
+class BufferedActionLog(ActionLogService):
+    """Action log that queues events and appends them from a background writer.
+
+    Call sites keep using ``log_event``; the disk write happens off the UI
+    thread, batching up to ``BATCH_SIZE`` events or ``BATCH_WINDOW_SECONDS``.
+    """
+
+    BATCH_SIZE = 64
+    BATCH_WINDOW_SECONDS = 0.05
+
+    def __init__(self, log_path: Path | None = None) -> None:
+        super().__init__(log_path)
+        self._queue: queue.Queue[dict[str, Any] | None] = queue.Queue()
+        self._writer_lock = threading.Lock()
+        self._writer: threading.Thread | None = None
+        self._fd: int | None = None
+
+    def _append_json_line(self, payload: dict[str, Any]) -> None:
+        self._ensure_writer()
+        self._queue.put(payload)
+
+    def _ensure_writer(self) -> None:
+        with self._writer_lock:
+            if self._writer is not None and self._writer.is_alive():
+                return
+            self._writer = threading.Thread(
+                target=self._writer_loop,
+                name="action-log-writer",
+                daemon=True,
+            )
+            self._writer.start()
+
+    def _writer_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch = [item]
+            try:
+                while item is not None and len(batch) < self.BATCH_SIZE:
+                    try:
+                        item = self._queue.get(timeout=self.BATCH_WINDOW_SECONDS)
+                    except queue.Empty:
+                        break
+                    batch.append(item)
+                self._write_lines([_json_line(payload) for payload in batch if payload is not None])
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if batch[-1] is None:
+                return
+
+    def _write_lines(self, lines: list[bytes]) -> None:
+        # Only the writer thread gets here: keep the log open in append mode
+        # and hand each batch to the kernel as a single write.
+        if not lines:
+            return
+        data = b"\n".join(lines) + b"\n"
+        try:
+            if self._fd is None:
+                self.log_path.parent.mkdir(parents=True, exist_ok=True)
+                self._fd = os.open(
+                    self.log_path,
+                    os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0),
+                    0o644,
+                )
+            view = memoryview(data)
+            while view:
+                written = os.write(self._fd, view)
+                view = view[written:]
+        except OSError:
+            # Logging must never break user workflows; reopen on the next batch.
+            self._close_fd()
+
+    def _close_fd(self) -> None:
+        if self._fd is None:
+            return
+        try:
+            os.close(self._fd)
+        except OSError:
+            pass
+        self._fd = None
+
+    def flush(self) -> None:
+        """Block until every queued event has been written."""
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.join()
+
+    def close(self) -> None:
+        """Write pending events and stop the writer thread."""
+        writer = self._writer
+        if writer is None or not writer.is_alive():
+            return
+        self._queue.put(None)
+        writer.join(timeout=2.0)
+        self._writer = None
+        if not writer.is_alive():
+            self._close_fd()
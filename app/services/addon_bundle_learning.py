@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 from app.domain.models import ImportedMachineProfile
+from app.services import json_codec
 from app.services.paths import user_bundles_dir
 
 
@@ -110,10 +110,7 @@ class AddonBundleLearningService:
                 "output_files": output_files,
             }
             addon_json_path = addons_dir / f"{addon_id}.json"
-            addon_json_path.write_text(
-                json.dumps(addon_payload, indent=2, sort_keys=False) + "\n",
-                encoding="utf-8",
-            )
+            addon_json_path.write_bytes(json_codec.dumps(addon_payload, indent=True) + b"\n")
             created.append(addon_json_path)
 
         return created
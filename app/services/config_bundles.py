@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Iterable
 
 from pydantic import ValidationError
 
 from app.domain.models import AddonProfile, BoardProfile
+from app.services import json_codec
 from app.services.paths import bundle_roots as default_bundle_roots
 
 
@@ -54,8 +54,8 @@ class BundleCatalogService:
     @staticmethod
     def _read_json_file(path: Path) -> dict | None:
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
+            data = json_codec.loads(path.read_bytes())
+        except (OSError, json_codec.JSONDecodeError):
             return None
         if not isinstance(data, dict):
             return None
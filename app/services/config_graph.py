@@ -2,13 +2,17 @@ from __future__ import annotations
 
 import posixpath
 import re
+from collections import deque
 from pathlib import PurePosixPath
+from typing import Collection
 
 
 class ConfigGraphService:
+    # Matched with finditer over the whole file; [^\S\n] keeps each match
+    # inside a single line.
     _INCLUDE_PATTERN = re.compile(
-        r"^\s*\[include\s+([^\]]+)\]\s*(?:[#;].*)?$",
-        re.IGNORECASE,
+        r"^[^\S\n]*\[include[^\S\n]+([^\]\n]+)\][^\S\n]*(?:[#;][^\n]*)?$",
+        re.IGNORECASE | re.MULTILINE,
     )
 
     @staticmethod
@@ -39,10 +43,10 @@ class ConfigGraphService:
     def resolve_includes(self, file_path: str, content: str) -> list[str]:
         normalized_file = self._normalize_path(file_path)
         includes: list[str] = []
-        for raw_line in (content or "").splitlines():
-            match = self._INCLUDE_PATTERN.match(raw_line)
-            if not match:
-                continue
+        text = content or ""
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        for match in self._INCLUDE_PATTERN.finditer(text):
             resolved = self._expand_relative_path(normalized_file, match.group(1))
             if resolved:
                 includes.append(resolved)
@@ -88,6 +92,84 @@ class ConfigGraphService:
             graph[normalized_root] = []
         return graph
 
+    def find_cycles(self, graph: dict[str, list[str]], known: Collection[str]) -> list[list[str]]:
+        """Return one closed include path per cycle, ignoring edges to files outside ``known``.
+
+        Iterative Tarjan SCC: one pass over the graph, with no recursion depth
+        limit on long include chains. Each strongly connected component is
+        reported as the shortest real include path from its first-visited
+        file back to itself.
+        """
+        index: dict[str, int] = {}
+        lowlink: dict[str, int] = {}
+        stack: list[str] = []
+        on_stack: set[str] = set()
+        cycles: list[list[str]] = []
+
+        for start in graph:
+            if start in index:
+                continue
+            index[start] = lowlink[start] = len(index)
+            stack.append(start)
+            on_stack.add(start)
+            work = [(start, iter(graph.get(start, ())))]
+            while work:
+                node, children = work[-1]
+                descended = False
+                for child in children:
+                    if child not in known:
+                        continue
+                    if child not in index:
+                        index[child] = lowlink[child] = len(index)
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(graph.get(child, ()))))
+                        descended = True
+                        break
+                    if child in on_stack:
+                        lowlink[node] = min(lowlink[node], index[child])
+                if descended:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] != index[node]:
+                    continue
+                component: list[str] = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                if len(component) > 1 or node in graph.get(node, ()):
+                    cycles.append(self._closed_include_path(graph, node, set(component)))
+        return cycles
+
+    @staticmethod
+    def _closed_include_path(graph: dict[str, list[str]], root: str, members: set[str]) -> list[str]:
+        # Breadth-first over edges inside the component, so every hop in the
+        # returned path is an include that actually exists.
+        parents: dict[str, str] = {}
+        queue = deque([root])
+        seen = {root}
+        while queue:
+            node = queue.popleft()
+            for child in graph.get(node, ()):
+                if child == root:
+                    path = [node]
+                    while path[-1] != root:
+                        path.append(parents[path[-1]])
+                    path.reverse()
+                    return [*path, root]
+                if child in members and child not in seen:
+                    seen.add(child)
+                    parents[child] = node
+                    queue.append(child)
+        return [root, root]
+
     def flatten_graph(self, graph: dict[str, list[str]], root_file: str) -> list[str]:
         root = self._normalize_path(root_file)
         order: list[str] = []
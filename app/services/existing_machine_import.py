@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import io
 import posixpath
 import re
 import zipfile
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 from app.domain.models import ImportSuggestion, ImportedMachineProfile, ProjectConfig
 from app.services.board_registry import (
@@ -23,6 +24,9 @@ class ExistingMachineImportService:
     SECTION_PATTERN = re.compile(r"^\s*\[([^\]]+)\]\s*(?:[#;].*)?$")
     KEY_VALUE_PATTERN = re.compile(r"^\s*([A-Za-z0-9_.-]+)\s*[:=]\s*(.*)$")
     INCLUDE_PATTERN = re.compile(r"^\s*\[include\s+([^\]]+)\]\s*(?:[#;].*)?$", re.IGNORECASE)
+    PRINTER_SECTION_PATTERN = re.compile(r"^\s*\[printer\]\s*(?:[#;].*)?$", re.MULTILINE)
+    UNSAFE_NAME_PATTERN = re.compile(r"[^A-Za-z0-9_. -]+")
+    EXTRA_Z_STEPPER_PATTERN = re.compile(r"stepper_z\d+")
     HIGH_CONFIDENCE_THRESHOLD = 0.85
 
     def __init__(
@@ -54,9 +58,9 @@ class ExistingMachineImportService:
                 continue
         return raw.decode("utf-8", errors="replace")
 
-    def _read_zip_files(self, path: Path) -> dict[str, str]:
+    def _read_zip_files(self, source: Path | IO[bytes]) -> dict[str, str]:
         files: dict[str, str] = {}
-        with zipfile.ZipFile(path, "r") as archive:
+        with zipfile.ZipFile(source, "r") as archive:
             for info in archive.infolist():
                 if info.is_dir():
                     continue
@@ -70,10 +74,13 @@ class ExistingMachineImportService:
 
     def _read_folder_files(self, folder: Path) -> dict[str, str]:
         files: dict[str, str] = {}
+        # rglob yields folder-prefixed paths, so slicing the prefix off the
+        # string avoids building a relative Path per file.
+        prefix_length = len(str(folder / "_")) - 1
         for file_path in sorted(folder.rglob("*")):
             if not file_path.is_file():
                 continue
-            relative = self._normalize_path(str(file_path.relative_to(folder)))
+            relative = self._normalize_path(str(file_path)[prefix_length:])
             if not relative:
                 continue
             files[relative] = self._read_text_file(file_path)
@@ -82,7 +89,7 @@ class ExistingMachineImportService:
     @staticmethod
     def _make_profile_name(path: Path) -> str:
         name = path.stem if path.is_file() else path.name
-        clean = re.sub(r"[^A-Za-z0-9_. -]+", "_", name).strip()
+        clean = ExistingMachineImportService.UNSAFE_NAME_PATTERN.sub("_", name).strip()
         return clean or "Imported Machine"
 
     def _detect_root_file(self, files: dict[str, str]) -> str:
@@ -93,7 +100,7 @@ class ExistingMachineImportService:
                 return candidate
 
         for path, content in normalized.items():
-            if re.search(r"^\s*\[printer\]\s*(?:[#;].*)?$", content, flags=re.MULTILINE):
+            if self.PRINTER_SECTION_PATTERN.search(content):
                 return path
 
         for path, content in normalized.items():
@@ -331,7 +338,7 @@ class ExistingMachineImportService:
         z_stepper_count = sum(
             1
             for section_name in merged_sections.keys()
-            if section_name == "stepper_z" or re.fullmatch(r"stepper_z\d+", section_name)
+            if section_name == "stepper_z" or self.EXTRA_Z_STEPPER_PATTERN.fullmatch(section_name)
         )
         x_max = self._as_float(merged_sections.get("stepper_x", {}).get("position_max"))
         if x_max is None:
@@ -612,30 +619,8 @@ class ExistingMachineImportService:
                     continue
                 warnings.append(f"{source}: include target not found: {target}")
 
-        stack: list[str] = []
-        visiting: set[str] = set()
-        visited: set[str] = set()
-
-        def dfs(node: str) -> None:
-            if node in visited:
-                return
-            if node in visiting:
-                cycle_start = stack.index(node) if node in stack else 0
-                cycle = " -> ".join(stack[cycle_start:] + [node])
-                warnings.append(f"Include cycle detected: {cycle}")
-                return
-            visiting.add(node)
-            stack.append(node)
-            for child in include_graph.get(node, []):
-                if child in include_graph:
-                    dfs(child)
-            stack.pop()
-            visiting.remove(node)
-            visited.add(node)
-
-        for root in include_graph.keys():
-            if root not in visited:
-                dfs(root)
+        for cycle in self.graph_service.find_cycles(include_graph, include_graph):
+            warnings.append(f"Include cycle detected: {' -> '.join(cycle)}")
 
         return list(dict.fromkeys(warnings))
 
@@ -925,6 +910,18 @@ class ExistingMachineImportService:
             files=files,
         )
 
+    def import_zip_bytes(self, data: bytes, name: str = "") -> ImportedMachineProfile:
+        try:
+            files = self._read_zip_files(io.BytesIO(data))
+        except zipfile.BadZipFile as exc:
+            raise ExistingMachineImportError(f"Invalid ZIP archive: {exc}") from exc
+        clean = self.UNSAFE_NAME_PATTERN.sub("_", name).strip()
+        return self._analyze_files(
+            source_name=clean or "Imported Machine",
+            source_kind="zip",
+            files=files,
+        )
+
     def import_folder(self, path: str) -> ImportedMachineProfile:
         folder_path = Path(path).expanduser()
         if not folder_path.exists() or not folder_path.is_dir():
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from zipfile import ZIP_DEFLATED, ZipFile
 
@@ -7,13 +8,28 @@ from app.domain.models import RenderedPack
 
 
 class ExportService:
+    EXPORT_WRITE_WORKERS = 4
+
     def export_folder(self, pack: RenderedPack, path: str) -> None:
         out_dir = Path(path)
         out_dir.mkdir(parents=True, exist_ok=True)
-        for name, contents in pack.files.items():
-            target = out_dir / name
-            target.parent.mkdir(parents=True, exist_ok=True)
-            target.write_text(contents, encoding="utf-8")
+        targets = [(out_dir / name, contents) for name, contents in pack.files.items()]
+        # Create each directory once up front, then overlap the independent
+        # file writes; they are bound by filesystem latency, not CPU.
+        for parent in {target.parent for target, _ in targets} - {out_dir}:
+            parent.mkdir(parents=True, exist_ok=True)
+        if len(targets) <= 1:
+            for target, contents in targets:
+                target.write_text(contents, encoding="utf-8")
+            return
+        workers = min(self.EXPORT_WRITE_WORKERS, len(targets))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(target.write_text, contents, encoding="utf-8")
+                for target, contents in targets
+            ]
+            for future in futures:
+                future.result()
 
     def export_zip(self, pack: RenderedPack, path: str) -> None:
         out_path = Path(path)
@@ -21,4 +37,3 @@ class ExportService:
         with ZipFile(out_path, "w", compression=ZIP_DEFLATED) as archive:
             for name, contents in pack.files.items():
                 archive.writestr(name, contents)
-
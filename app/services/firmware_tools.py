@@ -226,13 +226,18 @@ class FirmwareToolsService:
         seen_sections: Counter[str] = Counter()
         seen_keys: defaultdict[str, Counter[str]] = defaultdict(Counter)
         has_include_section = False
+        # Bound once: the loop below runs these matchers for every line.
+        match_include = self.INCLUDE_SECTION_PATTERN.match
+        match_section = self.SECTION_PATTERN.match
+        match_colon = self.KEY_VALUE_COLON_PATTERN.match
+        match_equals = self.KEY_VALUE_EQUALS_PATTERN.match
 
         for line_number, raw_line in enumerate(lines, start=1):
             stripped = raw_line.strip()
             if not stripped or stripped.startswith(("#", ";")):
                 continue
 
-            include_match = self.INCLUDE_SECTION_PATTERN.match(raw_line)
+            include_match = match_include(raw_line)
             if include_match:
                 has_include_section = True
                 include_target = include_match.group(1).strip()
@@ -250,7 +255,7 @@ class FirmwareToolsService:
                     )
                 continue
 
-            section_match = self.SECTION_PATTERN.match(raw_line)
+            section_match = match_section(raw_line)
             if section_match:
                 current_section = section_match.group(1).strip()
                 lowered_section = current_section.lower()
@@ -277,8 +282,8 @@ class FirmwareToolsService:
             if raw_line[:1].isspace():
                 continue
 
-            colon_match = self.KEY_VALUE_COLON_PATTERN.match(stripped)
-            equals_match = self.KEY_VALUE_EQUALS_PATTERN.match(stripped)
+            colon_match = match_colon(stripped)
+            equals_match = None if colon_match else match_equals(stripped)
             if colon_match:
                 key = colon_match.group(1).strip().lower()
                 value = colon_match.group(2).strip()
@@ -400,32 +405,7 @@ class FirmwareToolsService:
         graph: dict[str, list[str]],
         existing: set[str],
     ) -> list[str]:
-        cycles: list[str] = []
-        visiting: set[str] = set()
-        visited: set[str] = set()
-        stack: list[str] = []
-
-        def dfs(node: str) -> None:
-            if node in visited:
-                return
-            if node in visiting:
-                if node in stack:
-                    start = stack.index(node)
-                    cycles.append(" -> ".join(stack[start:] + [node]))
-                return
-            visiting.add(node)
-            stack.append(node)
-            for child in graph.get(node, []):
-                if child in existing:
-                    dfs(child)
-            stack.pop()
-            visiting.remove(node)
-            visited.add(node)
-
-        for node in graph.keys():
-            if node not in visited:
-                dfs(node)
-        return list(dict.fromkeys(cycles))
+        return [" -> ".join(cycle) for cycle in self.graph_service.find_cycles(graph, existing)]
 
     def _collect_cross_file_conflicts(
         self,
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 import re
-from typing import Literal
+from typing import Iterable, Iterator, Literal
 
 
 SECTION_PATTERN = re.compile(r"^\s*\[([^\]]+)\]\s*(?:[#;].*)?$")
@@ -70,9 +70,22 @@ class KlipperDocument:
         return out
 
 
-def parse_klipper_config(text: str) -> KlipperDocument:
-    lines = (text or "").splitlines()
-    doc = KlipperDocument(has_trailing_newline=(text or "").endswith("\n"))
+def _stream_lines(source: Iterable[str], doc: KlipperDocument) -> Iterator[str]:
+    # Lines arrive one at a time (file handles, StringIO, log tails), so the
+    # trailing-newline flag is tracked as they go instead of joining them first.
+    for raw_line in source:
+        line = raw_line.rstrip("\r\n")
+        doc.has_trailing_newline = line != raw_line
+        yield line
+
+
+def parse_klipper_config(text: str | Iterable[str]) -> KlipperDocument:
+    if text is None or isinstance(text, str):
+        lines: Iterable[str] = (text or "").splitlines()
+        doc = KlipperDocument(has_trailing_newline=(text or "").endswith("\n"))
+    else:
+        doc = KlipperDocument(has_trailing_newline=False)
+        lines = _stream_lines(text, doc)
     current_section: KlipperSection | None = None
     current_target = doc.preamble
     last_key_value: KlipperKeyValue | None = None
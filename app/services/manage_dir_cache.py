@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any
+
+from app.services import json_codec
+from app.services.paths import user_data_dir
+
+
+class ManageDirCacheStore:
+    """Persist Manage Printer directory listings between launches."""
+
+    MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+
+    def __init__(self, storage_path: Path | None = None) -> None:
+        self.storage_path = storage_path or (user_data_dir() / "cache" / "manage_dir_cache.json")
+
+    def load(self) -> dict[str, dict[str, Any]]:
+        if not self.storage_path.exists():
+            return {}
+        try:
+            raw = json_codec.loads(self.storage_path.read_bytes())
+        except (OSError, json_codec.JSONDecodeError):
+            return {}
+        listings = raw.get("listings") if isinstance(raw, dict) else None
+        if not isinstance(listings, dict):
+            return {}
+
+        cutoff = time.time() - self.MAX_AGE_SECONDS
+        cleaned: dict[str, dict[str, Any]] = {}
+        for raw_key, payload in listings.items():
+            key = str(raw_key).strip()
+            if not key or not isinstance(payload, dict):
+                continue
+            listing = payload.get("listing")
+            saved_at = payload.get("saved_at")
+            if not isinstance(listing, dict) or not isinstance(saved_at, (int, float)):
+                continue
+            if saved_at < cutoff or not isinstance(listing.get("entries"), list):
+                continue
+            cleaned[key] = listing
+        return cleaned
+
+    def save(self, listings: dict[str, dict[str, Any]]) -> None:
+        saved_at = time.time()
+        payload = {
+            "listings": {
+                key: {"saved_at": saved_at, "listing": listing}
+                for key, listing in listings.items()
+            }
+        }
+        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        self.storage_path.write_bytes(json_codec.dumps(payload))
+
+    def clear(self) -> None:
+        try:
+            self.storage_path.unlink()
+        except FileNotFoundError:
+            return
@@ -1,17 +1,20 @@
 from __future__ import annotations
 
+from functools import lru_cache
 import os
 import sys
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def app_root() -> Path:
     if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
         return Path(sys._MEIPASS) / "app"  # type: ignore[attr-defined]
     return Path(__file__).resolve().parents[1]
 
 
-def _asset_candidates() -> list[Path]:
+@lru_cache(maxsize=1)
+def _asset_candidates() -> tuple[Path, ...]:
     candidates: list[Path] = []
     if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
         meipass = Path(sys._MEIPASS)  # type: ignore[attr-defined]
@@ -25,7 +28,7 @@ def _asset_candidates() -> list[Path]:
             Path(__file__).resolve().parents[1] / "assets",
         ]
     )
-    return candidates
+    return tuple(candidates)
 
 
 def _resolve_asset(name: str) -> Path:
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 from jsonschema import Draft202012Validator
 
 from app.domain.models import Preset, PresetSummary
+from app.services import json_codec
 from app.services.paths import presets_dir as default_presets_dir
 from app.services.paths import schemas_dir as default_schemas_dir
 
@@ -30,8 +30,7 @@ class PresetCatalogService:
 
     @staticmethod
     def _read_json(path: Path) -> dict:
-        with path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        return json_codec.loads(path.read_bytes())
 
     def _iter_preset_files(self) -> list[Path]:
         explicit_index = self.preset_root / "index.json"
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 from app.domain.models import ProjectConfig
+from app.services import json_codec
 
 
 class ProjectStoreService:
@@ -115,13 +115,10 @@ class ProjectStoreService:
         target.parent.mkdir(parents=True, exist_ok=True)
         payload = project.model_dump(mode="json")
         payload["schema_version"] = self.CURRENT_SCHEMA_VERSION
-        target.write_text(
-            json.dumps(payload, indent=2, sort_keys=True),
-            encoding="utf-8",
-        )
+        target.write_bytes(json_codec.dumps(payload, indent=True, sort_keys=True))
 
     def load(self, path: str) -> ProjectConfig:
-        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        data = json_codec.loads(Path(path).read_bytes())
         if not isinstance(data, dict):
             raise ValueError("Project file payload must be an object.")
         schema_version = data.get("schema_version")
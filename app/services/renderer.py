@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import os
 from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, StrictUndefined
+from jinja2 import BytecodeCache, Environment, FileSystemBytecodeCache, FileSystemLoader, StrictUndefined
 
 from app.domain.models import Preset, ProjectConfig, RenderedPack
 from app.services.board_registry import (
@@ -57,9 +58,19 @@ class ConfigRenderService:
             lstrip_blocks=True,
             keep_trailing_newline=True,
             undefined=StrictUndefined,
+            bytecode_cache=self._bytecode_cache(),
         )
         self.graph_service = ConfigGraphService()
 
+    @staticmethod
+    def _bytecode_cache() -> BytecodeCache | None:
+        configured = (os.getenv("KLIPPCONFIG_JINJA_BYTECODE_CACHE") or "").strip()
+        if not configured:
+            return None
+        cache_dir = Path(configured).expanduser()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return FileSystemBytecodeCache(directory=str(cache_dir))
+
     @staticmethod
     def _coerce_override(value: Any, default: Any) -> Any:
         if value is None:
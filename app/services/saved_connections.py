@@ -1,13 +1,17 @@
 from __future__ import annotations
 
-import json
+import os
+import tempfile
 from pathlib import Path
 from typing import Any
 
+from app.services import json_codec
+
 
 class SavedConnectionService:
     def __init__(self, storage_path: Path | None = None) -> None:
         self.storage_path = storage_path or self._default_storage_path()
+        self._cache: tuple[tuple[int, int], dict[str, Any]] | None = None
 
     @staticmethod
     def _default_storage_path() -> Path:
@@ -42,7 +46,32 @@ class SavedConnectionService:
             "default_connection_name": default_name,
         }
 
+    def _store_signature(self) -> tuple[int, int] | None:
+        try:
+            stat_result = self.storage_path.stat()
+        except OSError:
+            return None
+        return (stat_result.st_mtime_ns, stat_result.st_size)
+
+    @staticmethod
+    def _copy_store(store: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "profiles": {name: dict(profile) for name, profile in store["profiles"].items()},
+            "preferences": dict(store["preferences"]),
+        }
+
     def _read_store(self) -> dict[str, Any]:
+        # Reparse only when the file changed on disk; callers get a copy they
+        # are free to mutate before writing back.
+        signature = self._store_signature()
+        if signature is None:
+            self._cache = None
+            return self._parse_store()
+        if self._cache is None or self._cache[0] != signature:
+            self._cache = (signature, self._parse_store())
+        return self._copy_store(self._cache[1])
+
+    def _parse_store(self) -> dict[str, Any]:
         payload: dict[str, Any] = {
             "profiles": {},
             "preferences": self._normalize_preferences(None),
@@ -50,8 +79,8 @@ class SavedConnectionService:
         if not self.storage_path.exists():
             return payload
         try:
-            raw = json.loads(self.storage_path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
+            raw = json_codec.loads(self.storage_path.read_bytes())
+        except (OSError, json_codec.JSONDecodeError):
             return payload
         profiles = raw.get("profiles") if isinstance(raw, dict) else None
         if not isinstance(profiles, dict):
@@ -79,10 +108,23 @@ class SavedConnectionService:
             "preferences": preferences,
         }
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-        self.storage_path.write_text(
-            json.dumps(payload, indent=2, sort_keys=True),
-            encoding="utf-8",
+        # Stream into a sibling temp file and swap it in, so a crash mid-write
+        # never leaves a truncated store behind.
+        handle = tempfile.NamedTemporaryFile(
+            "wb",
+            dir=self.storage_path.parent,
+            prefix=f".{self.storage_path.name}.",
+            suffix=".tmp",
+            delete=False,
         )
+        try:
+            with handle:
+                handle.write(json_codec.dumps(payload, indent=True, sort_keys=True))
+            os.replace(handle.name, self.storage_path)
+        except BaseException:
+            Path(handle.name).unlink(missing_ok=True)
+            raise
+        self._cache = None
 
     def list_names(self) -> list[str]:
         store = self._read_store()
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 from app.domain.models import ImportedMachineProfile
+from app.services import json_codec
 from app.services.paths import user_data_dir
 
 
@@ -15,8 +15,8 @@ class SavedMachineProfileService:
         if not self.storage_path.exists():
             return {}
         try:
-            raw = json.loads(self.storage_path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
+            raw = json_codec.loads(self.storage_path.read_bytes())
+        except (OSError, json_codec.JSONDecodeError):
             return {}
         profiles = raw.get("profiles") if isinstance(raw, dict) else None
         if not isinstance(profiles, dict):
@@ -33,10 +33,7 @@ class SavedMachineProfileService:
     def _write_store(self, profiles: dict[str, dict]) -> None:
         payload = {"profiles": profiles}
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-        self.storage_path.write_text(
-            json.dumps(payload, indent=2, sort_keys=True),
-            encoding="utf-8",
-        )
+        self.storage_path.write_bytes(json_codec.dumps(payload, indent=True, sort_keys=True))
 
     def list_names(self) -> list[str]:
         return sorted(self._read_store().keys(), key=str.casefold)
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import codecs
+import io
 import posixpath
 import shlex
+import socket
 import stat
+import tarfile
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 
 from app.domain.models import RenderedPack
 
@@ -20,11 +28,30 @@ class SSHDeployError(Exception):
 
 
 class SSHDeployService:
+    POOL_IDLE_TIMEOUT_SECONDS = 300.0
+    POOL_KEEPALIVE_SECONDS = 30
+    SFTP_CHANNEL_TIMEOUT_SECONDS = 30.0
+    FETCH_CHUNK_BYTES = 256 * 1024
+    TRANSPORT_WINDOW_BYTES = 2**27 - 1
+    TRANSPORT_REKEY_BYTES = 2**40
+    TAR_MISSING_EXIT_CODE = 127
+    DOWNLOAD_SMALL_FILE_BYTES = 64 * 1024
+    DOWNLOAD_SMALL_FILE_BATCH = 32
+
     def __init__(self) -> None:
         if paramiko is None:
             raise SSHDeployError(
                 "Missing dependency 'paramiko'. Install project dependencies and retry."
             )
+        self._pool: dict[tuple[str, int, str, str | None], tuple["paramiko.SSHClient", float]] = {}
+        self._pool_lock = threading.Lock()
+        # One in-flight connect per pool key; other callers for that key wait on it.
+        self._pool_connecting: dict[tuple[str, int, str, str | None], threading.Event] = {}
+        self._sftp_sessions: dict["paramiko.SSHClient", "paramiko.SFTPClient"] = {}
+        self._sftp_op_locks: dict["paramiko.SSHClient", threading.Lock] = {}
+        self._sftp_lock = threading.Lock()
+        self._remote_homes: dict["paramiko.SSHClient", str] = {}
+        self.compress = True
 
     @staticmethod
     def _create_client() -> "paramiko.SSHClient":
@@ -47,6 +74,7 @@ class SSHDeployService:
             "port": port,
             "username": username,
             "timeout": timeout,
+            "compress": self.compress,
         }
         if key_path:
             kwargs["key_filename"] = key_path
@@ -65,6 +93,178 @@ class SSHDeployService:
             raise SSHDeployError(f"SSH connection failed: {exc}") from exc
         return client
 
+    def get_pooled_client(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str | None = None,
+        key_path: str | None = None,
+    ) -> "paramiko.SSHClient":
+        """Return a live client for the target, reusing an idle pooled connection."""
+        key = (host, int(port), username, key_path)
+        while True:
+            with self._pool_lock:
+                now = time.monotonic()
+                self._evict_idle_clients(now)
+                entry = self._pool.get(key)
+                if entry is not None:
+                    client = entry[0]
+                    transport = client.get_transport()
+                    if transport is not None and transport.is_active():
+                        self._pool[key] = (client, now)
+                        return client
+                    self._close_client(client)
+                    del self._pool[key]
+                pending = self._pool_connecting.get(key)
+                if pending is None:
+                    pending = threading.Event()
+                    self._pool_connecting[key] = pending
+                    break
+            # Another caller is connecting to this target; reuse its client
+            # (or retry if that connect failed) once it finishes.
+            pending.wait()
+
+        # Connect without holding the pool lock, so a slow or unreachable host
+        # does not stall pooled operations on every other target.
+        try:
+            client = self.connect(host, port, username, password, key_path)
+            transport = client.get_transport()
+            if transport is not None:
+                transport.set_keepalive(self.POOL_KEEPALIVE_SECONDS)
+                self._tune_transport(transport)
+        except BaseException:
+            with self._pool_lock:
+                self._pool_connecting.pop(key, None)
+            pending.set()
+            raise
+        with self._pool_lock:
+            self._pool_connecting.pop(key, None)
+            # Re-check the slot: keep a live client that landed meanwhile.
+            entry = self._pool.get(key)
+            if entry is not None:
+                existing = entry[0]
+                existing_transport = existing.get_transport()
+                if existing_transport is not None and existing_transport.is_active():
+                    self._pool[key] = (existing, time.monotonic())
+                    pending.set()
+                    self._close_client(client)
+                    return existing
+                self._close_client(existing)
+            self._pool[key] = (client, time.monotonic())
+        pending.set()
+        return client
+
+    def _tune_transport(self, transport: "paramiko.Transport") -> None:
+        # Paramiko's default 2 MiB window stalls SFTP on high-latency links;
+        # channels opened after this (SFTP included) get the larger window.
+        transport.default_window_size = self.TRANSPORT_WINDOW_BYTES
+        packetizer = getattr(transport, "packetizer", None)
+        if packetizer is not None:
+            packetizer.REKEY_BYTES = self.TRANSPORT_REKEY_BYTES
+
+    @contextmanager
+    def _session_sftp(self, client: "paramiko.SSHClient") -> Iterator["paramiko.SFTPClient"]:
+        """Yield the SFTP channel kept open on ``client`` for one whole operation.
+
+        SFTPClient cannot serve concurrent requests (replies for one caller are
+        dropped by another), so operations sharing the session take turns.
+        """
+        with self._sftp_lock:
+            op_lock = self._sftp_op_locks.setdefault(client, threading.Lock())
+        with op_lock:
+            sftp = self._sftp_sessions.get(client)
+            if sftp is not None:
+                channel = sftp.get_channel()
+                if channel is None or channel.closed:
+                    sftp.close()
+                    sftp = None
+            if sftp is None:
+                sftp = client.open_sftp()
+                channel = sftp.get_channel()
+                if channel is not None:
+                    channel.settimeout(self.SFTP_CHANNEL_TIMEOUT_SECONDS)
+                with self._sftp_lock:
+                    self._sftp_sessions[client] = sftp
+            yield sftp
+
+    def _close_client(self, client: "paramiko.SSHClient") -> None:
+        with self._sftp_lock:
+            sftp = self._sftp_sessions.pop(client, None)
+            self._sftp_op_locks.pop(client, None)
+            self._remote_homes.pop(client, None)
+        if sftp is not None:
+            try:
+                sftp.close()
+            except Exception:  # noqa: BLE001
+                pass
+        client.close()
+
+    @contextmanager
+    def pooled_session(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str | None = None,
+        key_path: str | None = None,
+    ) -> Iterator["paramiko.SSHClient"]:
+        """Yield a pooled client and evict it if the operation breaks its transport."""
+        client = self.get_pooled_client(host, port, username, password, key_path)
+        try:
+            yield client
+        except Exception as exc:
+            self._discard_if_transport_failed(client, exc)
+            raise
+
+    @staticmethod
+    def _is_transport_failure(client: "paramiko.SSHClient", exc: BaseException) -> bool:
+        transport = client.get_transport()
+        if transport is None or not transport.is_active():
+            return True
+        # Remote errors (missing path, permission denied, non-zero exit) arrive
+        # as OSError/SSHDeployError and leave the connection usable; only
+        # protocol and socket failures mean the shared client is broken.
+        fatal: tuple[type[BaseException], ...] = (EOFError, ConnectionError, socket.timeout)
+        if paramiko is not None:
+            fatal += (paramiko.SSHException,)
+        seen: BaseException | None = exc
+        while seen is not None:
+            if isinstance(seen, fatal):
+                return True
+            seen = seen.__cause__
+        return False
+
+    def _discard_if_transport_failed(self, client: "paramiko.SSHClient", exc: BaseException) -> None:
+        if self._is_transport_failure(client, exc):
+            self.discard_pooled_client(client)
+
+    def discard_pooled_client(self, client: "paramiko.SSHClient") -> None:
+        with self._pool_lock:
+            for key, (pooled, _) in list(self._pool.items()):
+                if pooled is client:
+                    del self._pool[key]
+        self._close_client(client)
+
+    def _evict_idle_clients(self, now: float) -> None:
+        for key, (client, last_used) in list(self._pool.items()):
+            if now - last_used >= self.POOL_IDLE_TIMEOUT_SECONDS:
+                self._close_client(client)
+                del self._pool[key]
+
+    def set_compression(self, enabled: bool) -> None:
+        """Toggle zlib transport compression; pooled clients reconnect to pick it up."""
+        if bool(enabled) == self.compress:
+            return
+        self.compress = bool(enabled)
+        self.close_pooled_clients()
+
+    def close_pooled_clients(self) -> None:
+        with self._pool_lock:
+            for client, _ in self._pool.values():
+                self._close_client(client)
+            self._pool.clear()
+
     def test_connection(
         self,
         host: str,
@@ -73,13 +273,16 @@ class SSHDeployService:
         password: str | None = None,
         key_path: str | None = None,
     ) -> tuple[bool, str]:
-        client = self.connect(host, port, username, password, key_path)
-        try:
+        # Drop any pooled connection first so changed credentials are verified
+        # rather than masked by a session that authenticated earlier.
+        with self._pool_lock:
+            entry = self._pool.pop((host, int(port), username, key_path), None)
+        if entry is not None:
+            self._close_client(entry[0])
+        with self.pooled_session(host, port, username, password, key_path) as client:
             output = self.run_command(client, "uname -a")
             output = output.strip() or "Connection established."
             return True, output
-        finally:
-            client.close()
 
     def run_remote_command(
         self,
@@ -90,20 +293,65 @@ class SSHDeployService:
         password: str | None = None,
         key_path: str | None = None,
         timeout: float = 30.0,
+        on_output: Callable[[str], None] | None = None,
     ) -> str:
         command_text = command.strip()
         if not command_text:
             raise SSHDeployError("Remote command is empty.")
-        client = self.connect(host, port, username, password, key_path)
-        try:
+        with self.pooled_session(host, port, username, password, key_path) as client:
+            if on_output is not None:
+                return self.stream_command(client, command_text, on_output, timeout=timeout)
             return self.run_command(client, command_text, timeout=timeout)
-        finally:
-            client.close()
 
     @staticmethod
-    def run_command(client: "paramiko.SSHClient", command: str, timeout: float = 30.0) -> str:
+    def stream_command(
+        client: "paramiko.SSHClient",
+        command: str,
+        on_output: Callable[[str], None],
+        timeout: float = 30.0,
+    ) -> str:
+        """Run a command, passing each complete stdout line to on_output as it arrives."""
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        chunks: list[str] = []
+        pending = ""
+        try:
+            channel = client.get_transport().open_session()
+            channel.settimeout(timeout)
+            channel.exec_command(command)
+            while True:
+                data = channel.recv(4096)
+                text = decoder.decode(data, final=not data)
+                if text:
+                    chunks.append(text)
+                    *lines, pending = (pending + text).split("\n")
+                    for line in lines:
+                        on_output(line)
+                if not data:
+                    break
+            if pending:
+                on_output(pending)
+            exit_code = channel.recv_exit_status()
+            err_text = channel.makefile_stderr("rb").read().decode("utf-8", errors="replace")
+        except Exception as exc:  # noqa: BLE001
+            raise SSHDeployError(f"Failed to run remote command '{command}': {exc}") from exc
+        out_text = "".join(chunks)
+        if exit_code != 0:
+            detail = err_text.strip() or out_text.strip() or f"exit code {exit_code}"
+            raise SSHDeployError(f"Remote command failed: {command} ({detail})")
+        return out_text
+
+    @staticmethod
+    def run_command(
+        client: "paramiko.SSHClient",
+        command: str,
+        timeout: float = 30.0,
+        input_data: str | None = None,
+    ) -> str:
         try:
-            _, stdout, stderr = client.exec_command(command, timeout=timeout)
+            stdin, stdout, stderr = client.exec_command(command, timeout=timeout)
+            if input_data is not None:
+                stdin.write(input_data.encode("utf-8"))
+                stdin.channel.shutdown_write()
             exit_code = stdout.channel.recv_exit_status()
             out_text = stdout.read().decode("utf-8", errors="replace")
             err_text = stderr.read().decode("utf-8", errors="replace")
@@ -127,15 +375,30 @@ class SSHDeployService:
             raise SSHDeployError("Remote path is empty.")
         if not raw.startswith("~"):
             return raw
-        home = self.run_command(client, "printf %s \"$HOME\"").strip()
-        if not home:
-            raise SSHDeployError("Unable to resolve remote home directory.")
+        # $HOME cannot change for a session; resolve it once per client rather
+        # than spending an exec round-trip on every "~" path.
+        home = self._remote_homes.get(client)
+        if home is None:
+            home = self.run_command(client, "printf %s \"$HOME\"").strip()
+            if not home:
+                raise SSHDeployError("Unable to resolve remote home directory.")
+            self._remote_homes[client] = home
         if raw == "~":
             return home
         if raw.startswith("~/"):
             return posixpath.join(home, raw[2:])
         return raw.replace("~", home, 1)
 
+    @staticmethod
+    def _shell_path(path: str) -> str:
+        """Quote a remote path for the shell, leaving a leading ~ for $HOME to expand."""
+        raw = path.strip()
+        if raw == "~":
+            return '"$HOME"'
+        if raw.startswith("~/"):
+            return '"$HOME"/' + shlex.quote(raw[2:])
+        return shlex.quote(raw)
+
     @staticmethod
     def _escape_single_quotes(text: str) -> str:
         return text.replace("'", "'\"'\"'")
@@ -172,7 +435,7 @@ class SSHDeployService:
         self.ensure_remote_dir(client, remote)
         uploaded: list[str] = []
         try:
-            with client.open_sftp() as sftp:
+            with self._session_sftp(client) as sftp:
                 for name, contents in pack.files.items():
                     remote_path = posixpath.join(remote, name)
                     with sftp.file(remote_path, "w") as handle:
@@ -183,6 +446,51 @@ class SSHDeployService:
             raise SSHDeployError(f"SFTP upload failed: {exc}") from exc
         return uploaded
 
+    def upload_pack_bulk(
+        self,
+        client: "paramiko.SSHClient",
+        pack: RenderedPack,
+        remote_dir: str,
+        timeout: float = 120.0,
+    ) -> list[str]:
+        """Upload the pack as one gzipped tar stream, falling back to SFTP without tar."""
+        remote = self._expand_remote_path(client, self._normalize_remote_dir(remote_dir))
+        buffer = io.BytesIO()
+        stamp = int(time.time())
+        with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+            for name, contents in pack.files.items():
+                data = contents.encode("utf-8")
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                info.mtime = stamp
+                info.mode = 0o644
+                archive.addfile(info, io.BytesIO(data))
+
+        escaped = self._escape_single_quotes(remote)
+        command = (
+            f"command -v tar >/dev/null 2>&1 || exit {self.TAR_MISSING_EXIT_CODE}; "
+            f"mkdir -p '{escaped}' && tar xzf - -C '{escaped}'"
+        )
+        try:
+            stdin, stdout, stderr = client.exec_command(command, timeout=timeout)
+            try:
+                stdin.write(buffer.getvalue())
+                stdin.channel.shutdown_write()
+            except OSError:
+                # The remote side exits early when tar is missing; the exit
+                # status below tells us which case this was.
+                pass
+            exit_code = stdout.channel.recv_exit_status()
+            err_text = stderr.read().decode("utf-8", errors="replace")
+        except Exception as exc:  # noqa: BLE001
+            raise SSHDeployError(f"Bulk upload failed: {exc}") from exc
+        if exit_code == self.TAR_MISSING_EXIT_CODE:
+            return self.upload_pack(client, pack, remote)
+        if exit_code != 0:
+            detail = err_text.strip() or f"exit code {exit_code}"
+            raise SSHDeployError(f"Bulk upload failed: {detail}")
+        return [posixpath.join(remote, name) for name in pack.files]
+
     @staticmethod
     def _escape_remote_glob_path(path: str) -> str:
         """Quote path for shell command while preserving wildcard patterns."""
@@ -200,20 +508,18 @@ class SSHDeployService:
     ) -> list[str]:
         if max_depth < 1:
             raise SSHDeployError("max_depth must be at least 1.")
-        client = self.connect(host, port, username, password, key_path)
         try:
-            expanded_dir = self._expand_remote_path(client, self._normalize_remote_dir(remote_dir))
-            escaped_dir = self._escape_single_quotes(expanded_dir)
-            command = f"find '{escaped_dir}' -maxdepth {int(max_depth)} -type f | sort"
-            output = self.run_command(client, command)
-            files = [line.strip() for line in output.splitlines() if line.strip()]
-            return files
+            with self.pooled_session(host, port, username, password, key_path) as client:
+                expanded_dir = self._expand_remote_path(client, self._normalize_remote_dir(remote_dir))
+                escaped_dir = self._escape_single_quotes(expanded_dir)
+                command = f"find '{escaped_dir}' -maxdepth {int(max_depth)} -type f | sort"
+                output = self.run_command(client, command)
+                files = [line.strip() for line in output.splitlines() if line.strip()]
+                return files
         except Exception as exc:  # noqa: BLE001
             if isinstance(exc, SSHDeployError):
                 raise
             raise SSHDeployError(f"Failed to list files in '{remote_dir}': {exc}") from exc
-        finally:
-            client.close()
 
     def list_directory(
         self,
@@ -224,31 +530,31 @@ class SSHDeployService:
         password: str | None = None,
         key_path: str | None = None,
     ) -> dict[str, Any]:
-        client = self.connect(host, port, username, password, key_path)
+        client = self.get_pooled_client(host, port, username, password, key_path)
         try:
             expanded_dir = self._expand_remote_path(client, self._normalize_remote_dir(remote_dir))
             entries: list[dict[str, str]] = []
-            with client.open_sftp() as sftp:
-                for entry in sftp.listdir_attr(expanded_dir):
-                    name = entry.filename
-                    if name in {".", ".."}:
-                        continue
-                    entry_type = "dir" if stat.S_ISDIR(entry.st_mode) else "file"
-                    entries.append(
-                        {
-                            "name": name,
-                            "path": posixpath.join(expanded_dir, name),
-                            "type": entry_type,
-                        }
-                    )
+            with self._session_sftp(client) as sftp:
+                listing = sftp.listdir_attr(expanded_dir)
+            for entry in listing:
+                name = entry.filename
+                if name in {".", ".."}:
+                    continue
+                entry_type = "dir" if stat.S_ISDIR(entry.st_mode) else "file"
+                entries.append(
+                    {
+                        "name": name,
+                        "path": posixpath.join(expanded_dir, name),
+                        "type": entry_type,
+                    }
+                )
             entries.sort(key=lambda item: (0 if item["type"] == "dir" else 1, item["name"].lower()))
             return {"directory": expanded_dir, "entries": entries}
         except Exception as exc:  # noqa: BLE001
+            self._discard_if_transport_failed(client, exc)
             if isinstance(exc, SSHDeployError):
                 raise
             raise SSHDeployError(f"Failed to list directory '{remote_dir}': {exc}") from exc
-        finally:
-            client.close()
 
     def fetch_file(
         self,
@@ -259,19 +565,46 @@ class SSHDeployService:
         password: str | None = None,
         key_path: str | None = None,
     ) -> str:
-        client = self.connect(host, port, username, password, key_path)
+        client = self.get_pooled_client(host, port, username, password, key_path)
         try:
             expanded = self._expand_remote_path(client, remote_path)
-            with client.open_sftp() as sftp:
-                with sftp.file(expanded, "r") as handle:
-                    data = handle.read()
-                    if isinstance(data, bytes):
-                        return data.decode("utf-8", errors="replace")
-                    return str(data)
+            # Drained here so the shared session is never left locked by a
+            # half-consumed generator.
+            with self._session_sftp(client) as sftp, sftp.file(expanded, "r") as handle:
+                return "".join(self._iter_decoded_chunks(handle, int(self.FETCH_CHUNK_BYTES)))
         except Exception as exc:  # noqa: BLE001
+            self._discard_if_transport_failed(client, exc)
             raise SSHDeployError(f"Failed to fetch remote file '{remote_path}': {exc}") from exc
-        finally:
-            client.close()
+
+    @staticmethod
+    def _iter_decoded_chunks(handle: Any, read_size: int) -> Iterator[str]:
+        """Decode ``handle`` chunk by chunk so the raw bytes are never held whole."""
+        # utf-8-sig drops a leading BOM (common in configs edited on Windows) and
+        # otherwise decodes exactly like utf-8.
+        decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+        size = handle.stat().st_size or 0
+        offset = 0
+        while True:
+            if offset < size:
+                # readv pipelines the requests for one window only, so at most
+                # ``read_size`` bytes are buffered (prefetch() would pull the
+                # whole file); plain reads pick up anything appended since stat.
+                window = min(read_size, size - offset)
+                data = b"".join(handle.readv([(offset, window)]))
+            else:
+                data = handle.read(read_size)
+            if not data:
+                break
+            offset += len(data)
+            if isinstance(data, bytes):
+                text = decoder.decode(data)
+            else:
+                text = str(data)
+            if text:
+                yield text
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
 
     def write_file(
         self,
@@ -283,22 +616,20 @@ class SSHDeployService:
         password: str | None = None,
         key_path: str | None = None,
     ) -> str:
-        client = self.connect(host, port, username, password, key_path)
+        client = self.get_pooled_client(host, port, username, password, key_path)
         try:
             expanded = self._expand_remote_path(client, remote_path)
             parent = posixpath.dirname(expanded) or "."
             self.ensure_remote_dir(client, parent)
-            with client.open_sftp() as sftp:
-                with sftp.file(expanded, "w") as handle:
-                    handle.set_pipelined(True)
-                    handle.write(content)
+            with self._session_sftp(client) as sftp, sftp.file(expanded, "w") as handle:
+                handle.set_pipelined(True)
+                handle.write(content)
             return expanded
         except Exception as exc:  # noqa: BLE001
+            self._discard_if_transport_failed(client, exc)
             if isinstance(exc, SSHDeployError):
                 raise
             raise SSHDeployError(f"Failed to write remote file '{remote_path}': {exc}") from exc
-        finally:
-            client.close()
 
     def create_backup(
         self,
@@ -310,11 +641,50 @@ class SSHDeployService:
         key_path: str | None = None,
         backup_root: str = "~/klippconfig_backups",
     ) -> str:
-        client = self.connect(host, port, username, password, key_path)
-        try:
+        with self.pooled_session(host, port, username, password, key_path) as client:
             return self.backup_remote_configs(client, remote_dir, backup_root=backup_root)
-        finally:
-            client.close()
+
+    def backup_and_write(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        remote_dir: str,
+        remote_path: str,
+        content: str,
+        password: str | None = None,
+        key_path: str | None = None,
+        backup_root: str = "~/klippconfig_backups",
+    ) -> tuple[str, str]:
+        """Back up remote_dir and write remote_path in a single remote command.
+
+        Returns the backup directory and the written path, both expanded.
+        """
+        if not remote_path.strip():
+            raise SSHDeployError("Remote path is empty.")
+        remote = self._shell_path(self._normalize_remote_dir(remote_dir))
+        target = self._shell_path(remote_path)
+        parent = self._shell_path(posixpath.dirname(remote_path.strip()) or ".")
+        root = self._shell_path(backup_root)
+        # The backup is taken before the file is replaced, same as the
+        # create_backup + write_file sequence, but without the extra round-trips.
+        script = "; ".join(
+            [
+                "set -e",
+                f"backup={root}/backup-$(date +%Y%m%d-%H%M%S)",
+                'mkdir -p "$backup"',
+                f'cp -r {remote}/* "$backup" 2>/dev/null || true',
+                f"mkdir -p {parent}",
+                f"cat > {target}",
+                f"printf '%s\\n' \"$backup\" {target}",
+            ]
+        )
+        with self.pooled_session(host, port, username, password, key_path) as client:
+            output = self.run_command(client, script, input_data=content)
+        lines = [line for line in output.splitlines() if line.strip()]
+        if len(lines) < 2:
+            raise SSHDeployError(f"Unexpected response while writing '{remote_path}'.")
+        return lines[-2], lines[-1]
 
     def list_backups(
         self,
@@ -325,16 +695,13 @@ class SSHDeployService:
         key_path: str | None = None,
         backup_root: str = "~/klippconfig_backups",
     ) -> list[str]:
-        client = self.connect(host, port, username, password, key_path)
-        try:
+        with self.pooled_session(host, port, username, password, key_path) as client:
             expanded_root = self._expand_remote_path(client, backup_root)
             escaped_root = self._escape_single_quotes(expanded_root)
             command = f"ls -1dt '{escaped_root}'/backup-* 2>/dev/null || true"
             output = self.run_command(client, command)
             backups = [line.strip() for line in output.splitlines() if line.strip()]
             return backups
-        finally:
-            client.close()
 
     def restore_backup(
         self,
@@ -350,8 +717,7 @@ class SSHDeployService:
         if not backup_path.strip():
             raise SSHDeployError("Backup path is empty.")
 
-        client = self.connect(host, port, username, password, key_path)
-        try:
+        with self.pooled_session(host, port, username, password, key_path) as client:
             expanded_remote = self._expand_remote_path(client, self._normalize_remote_dir(remote_dir))
             expanded_backup = self._expand_remote_path(client, backup_path)
 
@@ -368,14 +734,13 @@ class SSHDeployService:
                 )
             commands.append(f"cp -a '{escaped_backup}'/. '{escaped_remote}'/")
             self.run_command(client, " && ".join(commands))
-        finally:
-            client.close()
 
-    def _download_remote_tree(
+    def _collect_remote_tree(
         self,
         sftp: "paramiko.SFTPClient",
         remote_dir: str,
         local_dir: Path,
+        files: list[tuple[str, Path, int]],
     ) -> None:
         local_dir.mkdir(parents=True, exist_ok=True)
         for entry in sftp.listdir_attr(remote_dir):
@@ -385,10 +750,52 @@ class SSHDeployService:
             remote_path = posixpath.join(remote_dir, name)
             local_path = local_dir / name
             if stat.S_ISDIR(entry.st_mode):
-                self._download_remote_tree(sftp, remote_path, local_path)
+                self._collect_remote_tree(sftp, remote_path, local_path, files)
             else:
+                files.append((remote_path, local_path, int(entry.st_size or 0)))
+
+    def _download_remote_files(
+        self,
+        client: "paramiko.SSHClient",
+        files: list[tuple[str, Path, int]],
+        concurrency: int,
+    ) -> None:
+        # Large files get a worker each; small files are batched so one channel
+        # round-trip is not paid per tiny config file.
+        large = [item for item in files if item[2] >= self.DOWNLOAD_SMALL_FILE_BYTES]
+        small = [item for item in files if item[2] < self.DOWNLOAD_SMALL_FILE_BYTES]
+        large.sort(key=lambda item: item[2], reverse=True)
+        batches = [[item] for item in large]
+        step = self.DOWNLOAD_SMALL_FILE_BATCH
+        batches.extend(small[index : index + step] for index in range(0, len(small), step))
+        if not batches:
+            return
+
+        # SFTP sessions are not thread-safe, so each worker opens its own
+        # channel on the shared transport.
+        local = threading.local()
+        opened: list["paramiko.SFTPClient"] = []
+        opened_lock = threading.Lock()
+
+        def _download_batch(batch: list[tuple[str, Path, int]]) -> None:
+            sftp = getattr(local, "sftp", None)
+            if sftp is None:
+                sftp = client.open_sftp()
+                local.sftp = sftp
+                with opened_lock:
+                    opened.append(sftp)
+            for remote_path, local_path, _size in batch:
                 sftp.get(remote_path, str(local_path))
 
+        workers = max(1, min(int(concurrency), len(batches)))
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for future in [executor.submit(_download_batch, batch) for batch in batches]:
+                    future.result()
+        finally:
+            for sftp in opened:
+                sftp.close()
+
     def download_backup(
         self,
         host: str,
@@ -398,6 +805,7 @@ class SSHDeployService:
         local_destination: str,
         password: str | None = None,
         key_path: str | None = None,
+        concurrency: int = 8,
     ) -> str:
         if not backup_path.strip():
             raise SSHDeployError("Backup path is empty.")
@@ -405,20 +813,21 @@ class SSHDeployService:
             raise SSHDeployError("Local destination is empty.")
 
         target_dir = Path(local_destination).expanduser()
-        client = self.connect(host, port, username, password, key_path)
+        client = self.get_pooled_client(host, port, username, password, key_path)
         try:
             expanded_backup = self._expand_remote_path(client, backup_path)
             escaped_backup = self._escape_single_quotes(expanded_backup)
             self.run_command(client, f"test -d '{escaped_backup}'")
-            with client.open_sftp() as sftp:
-                self._download_remote_tree(sftp, expanded_backup, target_dir)
+            files: list[tuple[str, Path, int]] = []
+            with self._session_sftp(client) as sftp:
+                self._collect_remote_tree(sftp, expanded_backup, target_dir, files)
+            self._download_remote_files(client, files, concurrency)
             return str(target_dir)
         except Exception as exc:  # noqa: BLE001
+            self._discard_if_transport_failed(client, exc)
             if isinstance(exc, SSHDeployError):
                 raise
             raise SSHDeployError(f"Failed to download backup '{backup_path}': {exc}") from exc
-        finally:
-            client.close()
 
     def deploy_pack(
         self,
@@ -433,17 +842,14 @@ class SSHDeployService:
         restart_klipper: bool = False,
         klipper_restart_command: str = "sudo systemctl restart klipper",
     ) -> dict[str, Any]:
-        client = self.connect(host, port, username, password, key_path)
         result: dict[str, Any] = {"uploaded": [], "backup_path": None, "restart_output": None}
-        try:
+        with self.pooled_session(host, port, username, password, key_path) as client:
             if backup_before_upload:
                 result["backup_path"] = self.backup_remote_configs(client, remote_dir)
-            result["uploaded"] = self.upload_pack(client, pack, remote_dir)
+            result["uploaded"] = self.upload_pack_bulk(client, pack, remote_dir)
             if restart_klipper:
                 result["restart_output"] = self.run_command(client, klipper_restart_command).strip()
             return result
-        finally:
-            client.close()
 
     def deploy_pack_via_temp_zip(
         self,
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import json
 import re
 import urllib.error
 import urllib.request
 
+from app.services import json_codec
+
 
 LATEST_RELEASE_API_TEMPLATE = "https://api.github.com/repos/{owner}/{repo}/releases/latest"
 _VERSION_PART_PATTERN = re.compile(r"\d+")
@@ -77,8 +78,8 @@ def check_latest_release(
         raise UpdateCheckError(f"Failed to check updates: {exc}") from exc
 
     try:
-        payload = json.loads(payload_bytes.decode("utf-8"))
-    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        payload = json_codec.loads(payload_bytes)
+    except (UnicodeDecodeError, json_codec.JSONDecodeError) as exc:
         raise UpdateCheckError(f"GitHub response could not be parsed: {exc}") from exc
 
     if not isinstance(payload, dict):
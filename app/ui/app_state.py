@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
+import threading
 from typing import Callable
 
 
@@ -58,6 +59,7 @@ class AppState:
 
 
 Listener = Callable[[AppState], None]
+SliceState = ConnectionState | ActiveFileState | ValidationState | DeployState | UIState
 
 
 def _now_utc() -> str:
@@ -69,18 +71,23 @@ class AppStateStore:
 
     def __init__(self) -> None:
         self._state = AppState()
-        self._listeners: list[Listener] = []
+        # Copy-on-write: subscribe/unsubscribe swap in a new tuple so
+        # publishing iterates the current one without copying or locking.
+        self._listeners: tuple[Listener, ...] = ()
+        self._listeners_lock = threading.Lock()
 
     def snapshot(self) -> AppState:
         return self._state
 
     def subscribe(self, listener: Listener) -> None:
-        if listener not in self._listeners:
-            self._listeners.append(listener)
+        with self._listeners_lock:
+            if listener not in self._listeners:
+                self._listeners = self._listeners + (listener,)
 
     def unsubscribe(self, listener: Listener) -> None:
-        if listener in self._listeners:
-            self._listeners.remove(listener)
+        # Bound methods are recreated on each access, so match by equality.
+        with self._listeners_lock:
+            self._listeners = tuple(item for item in self._listeners if item != listener)
 
     def update_connection(
         self,
@@ -97,7 +104,7 @@ class AppStateStore:
             profile_name=profile_name,
             last_updated_utc=_now_utc(),
         )
-        self._publish(replace(self._state, connection=connection))
+        self._publish_slice("connection", connection)
 
     def update_active_file(self, *, path: str, source: str, dirty: bool) -> None:
         active_file = ActiveFileState(
@@ -106,7 +113,7 @@ class AppStateStore:
             dirty=dirty,
             last_updated_utc=_now_utc(),
         )
-        self._publish(replace(self._state, active_file=active_file))
+        self._publish_slice("active_file", active_file)
 
     def update_validation(self, *, blocking: int, warnings: int, source_label: str) -> None:
         validation = ValidationState(
@@ -115,7 +122,7 @@ class AppStateStore:
             source_label=source_label,
             last_updated_utc=_now_utc(),
         )
-        self._publish(replace(self._state, validation=validation))
+        self._publish_slice("validation", validation)
 
     def update_deploy(
         self,
@@ -143,7 +150,7 @@ class AppStateStore:
             ),
             last_updated_utc=_now_utc(),
         )
-        self._publish(replace(self._state, deploy=deploy))
+        self._publish_slice("deploy", deploy)
 
     def update_ui(
         self,
@@ -177,9 +184,17 @@ class AppStateStore:
             ),
             last_updated_utc=_now_utc(),
         )
-        self._publish(replace(self._state, ui=ui))
+        self._publish_slice("ui", ui)
+
+    def _publish_slice(self, name: str, next_slice: SliceState) -> None:
+        # Repeated updates with identical values only differ by timestamp;
+        # don't wake every subscriber for them.
+        current = getattr(self._state, name)
+        if replace(next_slice, last_updated_utc=current.last_updated_utc) == current:
+            return
+        self._publish(replace(self._state, **{name: next_slice}))
 
     def _publish(self, next_state: AppState) -> None:
         self._state = next_state
-        for listener in list(self._listeners):
+        for listener in self._listeners:
             listener(self._state)
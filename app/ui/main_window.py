@@ -1,19 +1,24 @@
 
 from __future__ import annotations
 
+from collections import deque
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
 from datetime import datetime
-import json
+from functools import partial
+import hashlib
 from queue import Empty, SimpleQueue
 from pathlib import Path
 import posixpath
 import re
 import threading
-from typing import Any
+import time
+from typing import Any, Callable, Iterable, Iterator
 from urllib.parse import urlparse
 
 from pydantic import ValidationError
-from PySide6.QtCore import QSettings, QTimer, Qt, QUrl
-from PySide6.QtGui import QAction, QActionGroup, QDesktopServices, QPixmap
+from PySide6.QtCore import QElapsedTimer, QSettings, QSignalBlocker, QTimer, Qt, QUrl
+from PySide6.QtGui import QAction, QActionGroup, QDesktopServices, QPixmap, QTextCursor
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QApplication,
@@ -32,6 +37,7 @@ from PySide6.QtWidgets import (
     QLabel,
     QLineEdit,
     QListWidget,
+    QListWidgetItem,
     QMainWindow,
     QMenu,
     QMessageBox,
@@ -52,6 +58,7 @@ from PySide6.QtWidgets import (
 )
 
 from app.domain.models import (
+    BoardProfile,
     ImportSuggestion,
     ImportedMachineProfile,
     Preset,
@@ -59,6 +66,7 @@ from app.domain.models import (
     RenderedPack,
     ValidationReport,
 )
+from app.services import json_codec
 from app.services.board_registry import (
     get_board_profile,
     get_toolhead_board_profile,
@@ -67,13 +75,14 @@ from app.services.board_registry import (
     refresh_bundle_catalog,
     toolhead_board_transport,
 )
-from app.services.action_log import ActionLogService
+from app.services.action_log import BufferedActionLog
 from app.services.exporter import ExportService
 from app.services.existing_machine_import import (
     ExistingMachineImportError,
     ExistingMachineImportService,
 )
 from app.services.firmware_tools import FirmwareToolsService
+from app.services.manage_dir_cache import ManageDirCacheStore
 from app.services.paths import bundles_dir as default_bundles_dir
 from app.services.paths import creator_icon_path
 from app.services.paths import user_bundles_dir as default_user_bundles_dir
@@ -106,6 +115,43 @@ try:
 except Exception:
     QWebEngineView = None
 
+# A cfg form field is either a ``[section]`` header (may be indented) or a
+# ``key: value`` line starting at column 0. Comment lines never match.
+_CFG_FIELD_PATTERN = re.compile(
+    r"^(?:[ \t]*\[(?P<section>[^\]\n]+)\][ \t\r]*"
+    r"|(?P<key>[A-Za-z0-9_.-]+)[ \t]*:[ \t]*(?P<value>[^\n]*?)[ \t\r]*)$",
+    re.MULTILINE,
+)
+# Matches from the end of a key line when the next non-blank, non-comment
+# line is indented, i.e. the value continues as a multi-line block.
+_CFG_CONTINUATION_PATTERN = re.compile(r"(?:\n[ \t\r]*(?:[#;][^\n]*)?)*\n[ \t]+[^\s#;]")
+
+_STAMP_CACHE: tuple[int, str] | None = None
+
+
+def _now_stamp() -> str:
+    """Return the current HH:MM:SS log stamp, formatting at most once per second."""
+    global _STAMP_CACHE
+    second = int(time.time())
+    cached = _STAMP_CACHE
+    if cached is not None and cached[0] == second:
+        return cached[1]
+    stamp = time.strftime("%H:%M:%S", time.localtime(second))
+    _STAMP_CACHE = (second, stamp)
+    return stamp
+
+
+@dataclass(frozen=True)
+class SshFormSnapshot:
+    """Stripped SSH/Modify target fields, rebuilt only after one of them is edited."""
+
+    remote_dir: str
+    remote_file: str
+    modify_remote_path: str
+    modify_remote_dir: str
+    backup_root: str
+    restart_command: str
+
 
 class PrinterControlWindow(QMainWindow):
     def __init__(self, initial_url: str, parent: QWidget | None = None) -> None:
@@ -326,6 +372,7 @@ class SettingsWindow(QDialog):
         "ssh_default_restart_command": "sudo systemctl restart klipper",
         "ssh_default_backup_before_upload": True,
         "ssh_default_restart_after_upload": False,
+        "ssh_compression": True,
         "manage_default_scan_depth": 5,
         "manage_default_control_url": "",
         "discovery_default_ip_range": "192.168.1.0/24",
@@ -546,6 +593,11 @@ class SettingsWindow(QDialog):
             deploy_box,
         )
         deploy_form.addRow(self.ssh_default_restart_after_upload_checkbox)
+        self.ssh_compression_checkbox = QCheckBox(
+            "Compress SSH transfers (faster on slow links)",
+            deploy_box,
+        )
+        deploy_form.addRow(self.ssh_compression_checkbox)
         layout.addWidget(deploy_box)
 
         manage_box = QGroupBox("Manage / Discovery Defaults", page)
@@ -814,6 +866,7 @@ class SettingsWindow(QDialog):
             merged.get("ssh_default_restart_after_upload"),
             False,
         )
+        merged["ssh_compression"] = self._coerce_bool(merged.get("ssh_compression"), True)
         merged["manage_default_scan_depth"] = self._coerce_int(
             merged.get("manage_default_scan_depth"),
             5,
@@ -939,6 +992,7 @@ class SettingsWindow(QDialog):
             current["ssh_default_restart_after_upload"] = defaults[
                 "ssh_default_restart_after_upload"
             ]
+            current["ssh_compression"] = defaults["ssh_compression"]
             current["manage_default_scan_depth"] = defaults["manage_default_scan_depth"]
             current["manage_default_control_url"] = defaults["manage_default_control_url"]
             current["discovery_default_ip_range"] = defaults["discovery_default_ip_range"]
@@ -1121,6 +1175,7 @@ class SettingsWindow(QDialog):
             self.ssh_default_restart_after_upload_checkbox.setChecked(
                 bool(merged["ssh_default_restart_after_upload"])
             )
+            self.ssh_compression_checkbox.setChecked(bool(merged["ssh_compression"]))
             self.manage_default_scan_depth_spin.setValue(int(merged["manage_default_scan_depth"]))
             self.manage_default_control_url_edit.setText(str(merged["manage_default_control_url"]))
             self.discovery_default_ip_range_edit.setText(str(merged["discovery_default_ip_range"]))
@@ -1173,6 +1228,7 @@ class SettingsWindow(QDialog):
                 "ssh_default_restart_command": self.ssh_default_restart_command_edit.text().strip(),
                 "ssh_default_backup_before_upload": self.ssh_default_backup_before_upload_checkbox.isChecked(),
                 "ssh_default_restart_after_upload": self.ssh_default_restart_after_upload_checkbox.isChecked(),
+                "ssh_compression": self.ssh_compression_checkbox.isChecked(),
                 "manage_default_scan_depth": self.manage_default_scan_depth_spin.value(),
                 "manage_default_control_url": self.manage_default_control_url_edit.text().strip(),
                 "discovery_default_ip_range": self.discovery_default_ip_range_edit.text().strip(),
@@ -1197,6 +1253,56 @@ class MainWindow(QMainWindow):
     }
 
     DEFAULT_VORON_PRESET_ID = "voron_2_4_350"
+    MANAGE_DIR_CACHE_TTL_SECONDS = 30.0
+    MANAGE_PREFETCH_LIMIT = 16
+    MANAGE_TREE_PAGE_SIZE = 500
+    LOG_FLUSH_INTERVAL_MS = 33
+    STATUS_THROTTLE_MS = 100
+    MODIFY_STATUS_STYLES: dict[str, str] = {
+        "ok": (
+            "QLabel {"
+            " background-color: #14532d;"
+            " color: #ffffff;"
+            " border: 1px solid #16a34a;"
+            " border-radius: 4px;"
+            " padding: 6px 8px;"
+            " font-weight: 600;"
+            "}"
+        ),
+        "warning": (
+            "QLabel {"
+            " background-color: #78350f;"
+            " color: #ffffff;"
+            " border: 1px solid #f59e0b;"
+            " border-radius: 4px;"
+            " padding: 6px 8px;"
+            " font-weight: 600;"
+            "}"
+        ),
+        "error": (
+            "QLabel {"
+            " background-color: #7f1d1d;"
+            " color: #ffffff;"
+            " border: 1px solid #ef4444;"
+            " border-radius: 4px;"
+            " padding: 6px 8px;"
+            " font-weight: 600;"
+            "}"
+        ),
+        "info": (
+            "QLabel {"
+            " background-color: #111827;"
+            " color: #e5e7eb;"
+            " border: 1px solid #374151;"
+            " border-radius: 4px;"
+            " padding: 6px 8px;"
+            "}"
+        ),
+    }
+    MANAGE_TREE_POLL_INTERVAL_MS = 15000
+    MANAGE_TREE_PATH_ROLE = int(Qt.ItemDataRole.UserRole)
+    MANAGE_TREE_TYPE_ROLE = int(Qt.ItemDataRole.UserRole + 1)
+    MANAGE_TREE_LOADED_ROLE = int(Qt.ItemDataRole.UserRole + 2)
     DEFAULT_PROBE_TYPES = ["tap", "inductive", "bltouch", "klicky", "euclid"]
     UI_SCALE_OPTIONS: tuple[tuple[UIScaleMode, str], ...] = (
         ("auto", "Auto"),
@@ -1218,6 +1324,7 @@ class MainWindow(QMainWindow):
     SSH_DEFAULT_RESTART_COMMAND_SETTING_KEY = "ui/ssh/default_restart_command"
     SSH_DEFAULT_BACKUP_BEFORE_UPLOAD_SETTING_KEY = "ui/ssh/default_backup_before_upload"
     SSH_DEFAULT_RESTART_AFTER_UPLOAD_SETTING_KEY = "ui/ssh/default_restart_after_upload"
+    SSH_COMPRESSION_SETTING_KEY = "ui/ssh/compression"
     MANAGE_DEFAULT_SCAN_DEPTH_SETTING_KEY = "ui/manage/default_scan_depth"
     MANAGE_DEFAULT_CONTROL_URL_SETTING_KEY = "ui/manage/default_control_url"
     DISCOVERY_DEFAULT_IP_RANGE_SETTING_KEY = "ui/discovery/default_ip_range"
@@ -1292,11 +1399,18 @@ QGroupBox::title {
         app_settings: QSettings | None = None,
         auto_connect_on_launch: bool = False,
         check_updates_on_launch: bool = False,
+        manage_dir_cache_store: ManageDirCacheStore | None = None,
     ) -> None:
         super().__init__()
         self.setWindowTitle(f"KlippConfig v{__version__}")
         self.resize(1380, 900)
         self.app_settings = app_settings or QSettings("KlippConfig", "KlippConfig")
+        self.status_elapsed = QElapsedTimer()
+        self.status_elapsed.start()
+        self.status_pending: tuple[str, int] | None = None
+        self.status_flush_timer = QTimer(self)
+        self.status_flush_timer.setSingleShot(True)
+        self.status_flush_timer.timeout.connect(self._flush_status)
 
         self.catalog_service = PresetCatalogService()
         self.render_service = ConfigRenderService()
@@ -1304,11 +1418,12 @@ QGroupBox::title {
         self.parity_service = ParityService()
         self.firmware_tools_service = FirmwareToolsService()
         self.existing_machine_import_service = ExistingMachineImportService()
-        self.action_log_service = ActionLogService()
+        self.action_log_service = BufferedActionLog()
         self.app_state_store = AppStateStore()
         self.export_service = ExportService()
         self.project_store = ProjectStoreService()
         self.saved_connection_service = saved_connection_service or SavedConnectionService()
+        self.saved_connection_names_cache: list[str] | None = None
         self.saved_machine_profile_service = SavedMachineProfileService()
         self._clear_legacy_ssh_prefs_from_app_settings()
         self.ssh_service: SSHDeployService | None = None
@@ -1361,6 +1476,7 @@ QGroupBox::title {
         self.current_import_profile: ImportedMachineProfile | None = None
         self.imported_file_map: dict[str, str] = {}
         self.imported_file_order: list[str] = []
+        self.generated_items_by_name: dict[str, QListWidgetItem] = {}
         self.import_review_suggestions: list[ImportSuggestion] = []
         self.import_profile_applied_snapshot: dict[str, Any] = {}
 
@@ -1368,6 +1484,42 @@ QGroupBox::title {
         self._showing_external_file = False
         self.manage_current_remote_file: str | None = None
         self.manage_current_directory: str | None = None
+        self.manage_dir_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        self.manage_dir_cache_ttl = self.MANAGE_DIR_CACHE_TTL_SECONDS
+        self.manage_dir_cache_store = manage_dir_cache_store
+        self.manage_dir_cache_stale: set[str] = set()
+        self._load_persisted_manage_dir_cache()
+        self.busy_cursor_depth = 0
+        self.log_buffers: dict[str, deque[str]] = {"ssh": deque(), "modify": deque(), "console": deque()}
+        self.log_widgets: dict[str, QPlainTextEdit] = {}
+        self.log_flush_timer = QTimer(self)
+        self.log_flush_timer.setSingleShot(True)
+        self.log_flush_timer.setInterval(self.LOG_FLUSH_INTERVAL_MS)
+        self.log_flush_timer.timeout.connect(self._flush_logs)
+        self.manage_last_log_message: str | None = None
+        self.manage_log_repeat_count = 0
+        self.manage_params_rev = 0
+        self.ssh_form_rev = 0
+        self.ssh_form_cache: tuple[int, SshFormSnapshot] | None = None
+        self.manage_params_cache: tuple[int, dict[str, Any]] | None = None
+        self.remote_pending_ops = 0
+        self.remote_ops_in_flight: set[str] = set()
+        self.remote_busy_widget_counts: dict[QWidget, int] = {}
+        self.manage_prefetch_pending = 0
+        self.remote_op_result_queue: SimpleQueue[tuple[Any, ...]] = SimpleQueue()
+        self.remote_progress_queue: SimpleQueue[Callable[[], None]] = SimpleQueue()
+        self.remote_op_poll_timer = QTimer(self)
+        self.remote_op_poll_timer.setInterval(30)
+        self.remote_op_poll_timer.timeout.connect(self._process_remote_op_results)
+        self.manage_tree_params: dict[str, Any] | None = None
+        self.manage_tree_overflow: dict[str, list[tuple[str, str, str]]] = {}
+        self.manage_tree_poll_timer = QTimer(self)
+        self.manage_tree_poll_timer.setInterval(self.MANAGE_TREE_POLL_INTERVAL_MS)
+        self.manage_tree_poll_timer.timeout.connect(self._manage_poll_visible_folders)
+        self.manage_selection_label_timer = QTimer(self)
+        self.manage_selection_label_timer.setSingleShot(True)
+        self.manage_selection_label_timer.setInterval(50)
+        self.manage_selection_label_timer.timeout.connect(self._manage_apply_selection_label)
         self.modify_current_remote_file: str | None = None
         self.files_current_content: str = ""
         self.files_current_label: str = ""
@@ -1401,6 +1553,10 @@ QGroupBox::title {
         )
         self.preview_source_cache: dict[str, dict[str, str]] = {}
         self.preview_validation_cache: dict[str, tuple[int, int]] = {}
+        self.manage_validation_cache: dict[str, tuple[bytes, ValidationReport]] = {}
+        self.modify_validation_cache: dict[str, tuple[bytes, ValidationReport]] = {}
+        self.board_profile_cache: dict[str, BoardProfile | None] = {}
+        self.toolhead_board_profile_cache: dict[str, BoardProfile | None] = {}
         self.preview_connected_printer_name: str | None = None
         self.preview_connected_host: str | None = None
         self.about_window: QMainWindow | None = None
@@ -1553,6 +1709,7 @@ QGroupBox::title {
                 self.SSH_DEFAULT_RESTART_AFTER_UPLOAD_SETTING_KEY,
                 False,
             ),
+            "ssh_compression": self._settings_bool(self.SSH_COMPRESSION_SETTING_KEY, True),
             "manage_default_scan_depth": _read_int(self.MANAGE_DEFAULT_SCAN_DEPTH_SETTING_KEY, 5),
             "manage_default_control_url": str(
                 self.app_settings.value(self.MANAGE_DEFAULT_CONTROL_URL_SETTING_KEY, "") or ""
@@ -1799,7 +1956,7 @@ QGroupBox::title {
             values["discovery_default_max_hosts"] = int(self.scan_max_hosts_spin.value())
         values["profile_store"] = {}
         try:
-            for name in self.saved_connection_service.list_names():
+            for name in self._list_saved_connection_names():
                 profile = self.saved_connection_service.load(name)
                 if isinstance(profile, dict):
                     values["profile_store"][name] = dict(profile)
@@ -1919,7 +2076,7 @@ QGroupBox::title {
         profile_store = values.get("profile_store")
         target_profiles = profile_store if isinstance(profile_store, dict) else {}
         try:
-            existing_names = self.saved_connection_service.list_names()
+            existing_names = self._list_saved_connection_names()
         except OSError:
             existing_names = []
         target_names: set[str] = set()
@@ -1938,6 +2095,7 @@ QGroupBox::title {
                     self.saved_connection_service.delete(name)
                 except OSError:
                     continue
+        self.saved_connection_names_cache = None
 
         self.app_settings.setValue(self.NAV_VISIBLE_SETTING_KEY, merged["nav_visible"])
         self.app_settings.setValue("ui/default_route", str(merged.get("default_route") or "home"))
@@ -2001,6 +2159,10 @@ QGroupBox::title {
             self.SSH_DEFAULT_RESTART_AFTER_UPLOAD_SETTING_KEY,
             _as_bool(merged.get("ssh_default_restart_after_upload"), False),
         )
+        ssh_compression = _as_bool(merged.get("ssh_compression"), True)
+        self.app_settings.setValue(self.SSH_COMPRESSION_SETTING_KEY, ssh_compression)
+        if isinstance(self.ssh_service, SSHDeployService):
+            self.ssh_service.set_compression(ssh_compression)
         self.app_settings.setValue(
             self.MANAGE_DEFAULT_SCAN_DEPTH_SETTING_KEY,
             merged["manage_default_scan_depth"],
@@ -2051,7 +2213,7 @@ QGroupBox::title {
         self._apply_settings_to_runtime_ui()
         self._refresh_saved_connection_profiles(select_name=self.default_ssh_connection_name or None)
         self._refresh_tools_connect_menu()
-        self.statusBar().showMessage(f"Settings applied ({source})", 2500)
+        self._show_status(f"Settings applied ({source})", 2500)
 
     def _is_update_check_on_launch_enabled(self) -> bool:
         return bool(self.update_check_on_launch_enabled)
@@ -2061,7 +2223,7 @@ QGroupBox::title {
         self.app_settings.setValue(self.UPDATE_CHECK_ON_LAUNCH_SETTING_KEY, target)
         self.app_settings.sync()
         self.update_check_on_launch_enabled = target
-        self.statusBar().showMessage(
+        self._show_status(
             (
                 "Update check on launch enabled."
                 if target
@@ -2088,14 +2250,14 @@ QGroupBox::title {
             self.saved_connection_service.set_auto_connect_enabled(target)
         except OSError as exc:
             self._append_ssh_log(f"Failed to persist auto-connect preference: {exc}")
-            self.statusBar().showMessage("Failed to save auto-connect preference", 2500)
+            self._show_status("Failed to save auto-connect preference", 2500)
             target = self.saved_connection_service.get_auto_connect_enabled(default=True)
         self.auto_connect_enabled = target
         if hasattr(self, "ssh_auto_connect_checkbox"):
             self.ssh_auto_connect_checkbox.blockSignals(True)
             self.ssh_auto_connect_checkbox.setChecked(self.auto_connect_enabled)
             self.ssh_auto_connect_checkbox.blockSignals(False)
-        self.statusBar().showMessage(
+        self._show_status(
             (
                 "Auto-connect on launch enabled."
                 if self.auto_connect_enabled
@@ -2110,14 +2272,14 @@ QGroupBox::title {
             self.saved_connection_service.set_default_connection_name(target)
         except OSError as exc:
             self._append_ssh_log(f"Failed to persist default connection: {exc}")
-            self.statusBar().showMessage("Failed to save default connection", 2500)
+            self._show_status("Failed to save default connection", 2500)
             target = self.saved_connection_service.get_default_connection_name()
         self.default_ssh_connection_name = target
 
     def _update_default_connection_ui(self, available_names: list[str] | None = None) -> None:
         if available_names is None:
             try:
-                available_names = self.saved_connection_service.list_names()
+                available_names = self._list_saved_connection_names()
             except OSError:
                 available_names = []
 
@@ -2149,7 +2311,7 @@ QGroupBox::title {
         self._update_default_connection_ui()
         self._refresh_tools_connect_menu()
         self._append_ssh_log(f"Set default connection to '{profile_name}'.")
-        self.statusBar().showMessage(f"Default connection set: {profile_name}", 2500)
+        self._show_status(f"Default connection set: {profile_name}", 2500)
 
     def _clear_default_saved_connection(self) -> None:
         if not self.default_ssh_connection_name:
@@ -2159,7 +2321,7 @@ QGroupBox::title {
         self._update_default_connection_ui()
         self._refresh_tools_connect_menu()
         self._append_ssh_log(f"Cleared default connection '{previous}'.")
-        self.statusBar().showMessage("Default connection cleared", 2500)
+        self._show_status("Default connection cleared", 2500)
 
     def _is_files_experiment_enabled(self) -> bool:
         return bool(getattr(self, "files_experiment_enabled", False))
@@ -2180,7 +2342,7 @@ QGroupBox::title {
             files_ui_variant=("material_v1" if self.files_experiment_enabled else "classic")
         )
         self._apply_theme_mode(self.theme_mode, persist=False)
-        self.statusBar().showMessage(
+        self._show_status(
             (
                 "Files UI v1 enabled. Restart to rebuild the Files screen."
                 if self.files_experiment_enabled
@@ -2252,7 +2414,7 @@ QGroupBox::title {
         self._refresh_saved_machine_profiles()
         self.app_state_store.subscribe(self._on_app_state_changed)
         self._on_app_state_changed(self.app_state_store.snapshot())
-        self.statusBar().showMessage("Ready")
+        self._show_status("Ready")
 
     def _build_route_nav_bar(self, parent: QWidget) -> QWidget:
         bar = QWidget(parent)
@@ -2312,9 +2474,16 @@ QGroupBox::title {
         self.ssh_log = console_window.ssh_log
         self.modify_log = console_window.modify_log
         self.manage_log = console_window.manage_log
+        self.log_widgets = {
+            "ssh": self.ssh_log,
+            "modify": self.modify_log,
+            "console": self.console_activity_log,
+        }
         return console_window
 
     def _clear_active_console_logs(self) -> None:
+        for buffer in self.log_buffers.values():
+            buffer.clear()
         if hasattr(self, "console_activity_log"):
             self.console_activity_log.clear()
         if hasattr(self, "ssh_log"):
@@ -2323,14 +2492,14 @@ QGroupBox::title {
             self.modify_log.clear()
         if hasattr(self, "manage_log"):
             self.manage_log.clear()
-        self.statusBar().showMessage("Console cleared", 2000)
+        self._show_status("Console cleared", 2000)
 
     def _open_active_console_window(self) -> None:
         console_window = self._ensure_active_console_window()
         console_window.show()
         console_window.raise_()
         console_window.activateWindow()
-        self.statusBar().showMessage("Opened active console", 2500)
+        self._show_status("Opened active console", 2500)
 
     def _ensure_printer_connection_window(self) -> PrinterConnectionWindow:
         if self.printer_connection_window is not None:
@@ -2345,13 +2514,13 @@ QGroupBox::title {
         connection_window.raise_()
         connection_window.activateWindow()
         self.app_state_store.update_ui(active_route=active_route, right_panel_mode="context")
-        self.statusBar().showMessage("Opened printer connection window", 2500)
+        self._show_status("Opened printer connection window", 2500)
 
     def _open_printers_webview_or_setup(self) -> None:
         self.app_state_store.update_ui(active_route="printers", right_panel_mode="context")
         if not self._has_ssh_target_configured():
             self._open_settings_dialog(initial_page="ssh_profiles")
-            self.statusBar().showMessage(
+            self._show_status(
                 "Set up an SSH profile in Settings before opening Printers view.",
                 3500,
             )
@@ -2471,14 +2640,18 @@ QGroupBox::title {
             QTimer.singleShot(250, self._attempt_auto_connect_saved_profile)
 
     def _attempt_auto_connect_saved_profile(self) -> None:
-        if self.device_connected or self.auto_connect_in_progress:
+        if (
+            self.device_connected
+            or self.auto_connect_in_progress
+            or "connect" in self.remote_ops_in_flight
+        ):
             return
         if not self.auto_connect_enabled:
             self._append_ssh_log("Auto-connect skipped: disabled in SSH settings.")
             return
 
         try:
-            saved_profiles = self.saved_connection_service.list_names()
+            saved_profiles = self._list_saved_connection_names()
         except OSError as exc:
             self._append_ssh_log(f"Auto-connect skipped: failed to read saved connections ({exc}).")
             return
@@ -2495,7 +2668,7 @@ QGroupBox::title {
             self._append_ssh_log(
                 "Auto-connect skipped: multiple saved connections found. Set a default connection."
             )
-            self.statusBar().showMessage(
+            self._show_status(
                 "Auto-connect skipped: set a default saved connection.",
                 4000,
             )
@@ -2518,7 +2691,7 @@ QGroupBox::title {
 
         self.auto_connect_in_progress = True
         self._update_action_enablement()
-        self.statusBar().showMessage(f"Auto-connecting to {params['host']}...", 0)
+        self._show_status(f"Auto-connecting to {params['host']}...", 0)
         self._append_ssh_log(
             f"Auto-connect: {params['username']}@{params['host']}:{params['port']} ({profile_name})"
         )
@@ -2587,9 +2760,9 @@ QGroupBox::title {
             use_failure_prefix=False,
         )
         if host:
-            self.statusBar().showMessage(f"Auto-connect failed for {host}", 4000)
+            self._show_status(f"Auto-connect failed for {host}", 4000)
         else:
-            self.statusBar().showMessage("Auto-connect failed", 4000)
+            self._show_status("Auto-connect failed", 4000)
 
     def _check_for_updates(self, *, source: str = "manual") -> None:
         source_key = source.strip().lower() or "manual"
@@ -2597,11 +2770,11 @@ QGroupBox::title {
             return
         if self.update_check_in_progress:
             if source_key != "startup":
-                self.statusBar().showMessage("Update check already in progress.", 2500)
+                self._show_status("Update check already in progress.", 2500)
             return
 
         if source_key != "startup":
-            self.statusBar().showMessage("Checking GitHub for updates...", 2500)
+            self._show_status("Checking GitHub for updates...", 2500)
 
         self.update_check_in_progress = True
         self.action_log_service.log_event("update_check", phase="start", source=source_key)
@@ -2664,7 +2837,7 @@ QGroupBox::title {
                 error=error_message,
             )
             if source_key == "startup":
-                self.statusBar().showMessage("Update check failed.", 2500)
+                self._show_status("Update check failed.", 2500)
             else:
                 QMessageBox.warning(self, "Update Check Failed", error_message)
             return
@@ -2699,7 +2872,7 @@ QGroupBox::title {
                 f"Update available: v{check_result.latest_version} "
                 f"(current v{check_result.current_version})."
             )
-            self.statusBar().showMessage(message, 5000)
+            self._show_status(message, 5000)
             self._show_toast_notification(message, severity="info", duration_ms=5500)
             if source_key != "startup":
                 response = QMessageBox.question(
@@ -3162,15 +3335,12 @@ QGroupBox::title {
                     "Tip: Use Configuration -> Validate Current for full diagnostics.",
                 ]
             elif mode == "logs":
+                self._flush_logs()
                 recent_logs: list[str] = []
                 if hasattr(self, "ssh_log"):
-                    ssh_lines = self.ssh_log.toPlainText().splitlines()
-                    if ssh_lines:
-                        recent_logs.extend(ssh_lines[-8:])
+                    recent_logs.extend(self._tail_log_lines(self.ssh_log, 8))
                 if hasattr(self, "modify_log"):
-                    modify_lines = self.modify_log.toPlainText().splitlines()
-                    if modify_lines:
-                        recent_logs.extend(modify_lines[-6:])
+                    recent_logs.extend(self._tail_log_lines(self.modify_log, 6))
                 if not recent_logs:
                     recent_logs = ["(no console log entries yet)"]
                 panel_lines = ["Logs", ""] + recent_logs[-14:]
@@ -3210,7 +3380,7 @@ QGroupBox::title {
                             f"Restart status: {state.deploy.last_restart_status or 'n/a'}",
                         ]
                     )
-            self.right_context_panel.content.setPlainText("\n".join(panel_lines))
+            self.right_context_panel.set_lines(panel_lines)
         self.bottom_status_bar.set_connection(
             state.connection.connected,
             state.connection.target_printer or state.connection.host,
@@ -3245,6 +3415,8 @@ QGroupBox::title {
 
     def _set_device_connection_health(self, connected: bool, detail: str | None = None) -> None:
         self.device_connected = connected
+        if not connected:
+            self._stop_manage_tree_poll()
         host = self.ssh_host_edit.text().strip() if hasattr(self, "ssh_host_edit") else ""
         printer_name = self.preview_connected_printer_name or ""
         profile_name = self.ssh_connection_name_edit.text().strip() if hasattr(
@@ -3260,15 +3432,8 @@ QGroupBox::title {
             self.bottom_status_bar.set_connection(connected, printer_name or host)
         if not hasattr(self, "device_health_icon"):
             return
-        color = "#16a34a" if connected else "#dc2626"
         state = "Connected" if connected else "Disconnected"
-        self.device_health_icon.setStyleSheet(
-            "QLabel {"
-            f" background-color: {color};"
-            " border: 1px solid #111827;"
-            " border-radius: 6px;"
-            "}"
-        )
+        self.bottom_status_bar.set_device_connected(connected)
         tooltip = f"Device connection: {state}"
         if detail:
             tooltip = f"{tooltip}\n{detail}"
@@ -3574,7 +3739,7 @@ QGroupBox::title {
             return
         value = entry.get("path", "") or entry.get("label", "")
         QApplication.clipboard().setText(value)
-        self.statusBar().showMessage("Preview path copied", 2000)
+        self._show_status("Preview path copied", 2000)
 
     def _preview_open_in_files(self) -> None:
         if not self.preview_source_key:
@@ -3591,9 +3756,9 @@ QGroupBox::title {
         if kind == "generated":
             file_name = path or "printer.cfg"
             if self.current_pack is not None and file_name in self.current_pack.files:
-                matches = self.generated_file_list.findItems(file_name, Qt.MatchFlag.MatchExactly)
-                if matches:
-                    self.generated_file_list.setCurrentItem(matches[0])
+                match = self.find_generated_item(file_name)
+                if match is not None:
+                    self.generated_file_list.setCurrentItem(match)
                     self._showing_external_file = False
                     self._show_selected_generated_file()
                 else:
@@ -3935,7 +4100,7 @@ QGroupBox::title {
             self.ui_scale_actions[selected_mode].setChecked(True)
 
         label = "Auto" if selected_mode == "auto" else f"{selected_mode}%"
-        self.statusBar().showMessage(f"UI scale set to {label}", 2500)
+        self._show_status(f"UI scale set to {label}", 2500)
 
     def _save_project(self) -> None:
         if self.current_project_path:
@@ -3957,7 +4122,7 @@ QGroupBox::title {
             return
 
         self.current_project_path = str(path)
-        self.statusBar().showMessage(f"Saved project: {path}", 2500)
+        self._show_status(f"Saved project: {path}", 2500)
 
     def _import_preset_placeholder(self) -> None:
         QMessageBox.information(
@@ -3992,7 +4157,7 @@ QGroupBox::title {
     def _open_settings_dialog(self, initial_page: str | None = None) -> None:
         profile_store: dict[str, dict[str, Any]] = {}
         try:
-            for name in self.saved_connection_service.list_names():
+            for name in self._list_saved_connection_names():
                 profile = self.saved_connection_service.load(name)
                 if isinstance(profile, dict):
                     profile_store[name] = dict(profile)
@@ -4037,7 +4202,7 @@ QGroupBox::title {
         self.app_settings.setValue(self.NAV_VISIBLE_SETTING_KEY, bool(visible))
         self.app_settings.sync()
 
-        self.statusBar().showMessage(
+        self._show_status(
             "Navigation bar shown" if visible else "Navigation bar hidden",
             2000,
         )
@@ -4051,7 +4216,7 @@ QGroupBox::title {
             console_window.activateWindow()
         else:
             console_window.hide()
-        self.statusBar().showMessage(
+        self._show_status(
             "Console shown" if visible else "Console hidden",
             2000,
         )
@@ -4061,10 +4226,10 @@ QGroupBox::title {
             self.tabs.tabBar().setVisible(enabled)
         if enabled:
             self.app_state_store.update_ui(legacy_visible=True)
-            self.statusBar().showMessage("Advanced mode enabled", 2000)
+            self._show_status("Advanced mode enabled", 2000)
             return
         self.app_state_store.update_ui(legacy_visible=False)
-        self.statusBar().showMessage("Advanced mode hidden", 2000)
+        self._show_status("Advanced mode hidden", 2000)
 
     def _connect_ssh_from_command_bar(self) -> None:
         self._open_printer_connection_window()
@@ -4156,7 +4321,7 @@ QGroupBox::title {
         self.file_view_tabs.setCurrentIndex(next_index)
         label = "Form" if next_index == 1 else "Raw"
         self.action_log_service.log_event("files_view_mode", mode=label.lower())
-        self.statusBar().showMessage(f"Files view set to {label} mode", 2000)
+        self._show_status(f"Files view set to {label} mode", 2000)
 
     def _apply_theme_mode(self, mode: str, *, persist: bool = True) -> None:
         selected = mode.strip().lower()
@@ -4179,7 +4344,7 @@ QGroupBox::title {
         if persist:
             self.app_settings.setValue("ui/theme_mode", selected)
             self.app_settings.sync()
-        self.statusBar().showMessage(f"Theme set to {selected.title()}", 2000)
+        self._show_status(f"Theme set to {selected.title()}", 2000)
 
     def _reset_layout(self) -> None:
         if hasattr(self, "view_toggle_sidebar_action"):
@@ -4195,7 +4360,7 @@ QGroupBox::title {
             self._apply_wizard_splitter_defaults()
         if hasattr(self, "files_splitter"):
             self.files_splitter.setSizes([1, 3])
-        self.statusBar().showMessage("Layout reset", 2500)
+        self._show_status("Layout reset", 2500)
 
     def _open_manage_addons(self) -> None:
         QMessageBox.information(
@@ -4215,7 +4380,7 @@ QGroupBox::title {
         self.app_state_store.update_ui(active_route="files", right_panel_mode="validation")
         if hasattr(self, "overrides_section_toggle"):
             self.overrides_section_toggle.setChecked(True)
-        self.statusBar().showMessage("Opened section overrides", 2500)
+        self._show_status("Opened section overrides", 2500)
 
     def _open_printer_discovery(self) -> None:
         discovery_window = self._ensure_printer_discovery_window()
@@ -4228,7 +4393,7 @@ QGroupBox::title {
         self.tabs.setCurrentWidget(self.manage_printer_tab)
         self.app_state_store.update_ui(active_route="backups", right_panel_mode="context")
         self._manage_refresh_backups()
-        self.statusBar().showMessage("Opened backup manager", 2500)
+        self._show_status("Opened backup manager", 2500)
 
     def _show_firmware_info(self) -> None:
         project = self.current_project
@@ -4252,7 +4417,7 @@ QGroupBox::title {
 
     def _open_saved_connections_manager(self) -> None:
         self._open_settings_dialog(initial_page="ssh_profiles")
-        self.statusBar().showMessage("Opened Settings -> SSH Profiles", 2500)
+        self._show_status("Opened Settings -> SSH Profiles", 2500)
 
     def _disconnect_printer(self) -> None:
         self._set_device_connection_health(False, "Disconnected from printer.")
@@ -4263,7 +4428,8 @@ QGroupBox::title {
         self._append_ssh_log("Disconnected printer session.")
         self._append_modify_log("Disconnected printer session.")
         self._append_manage_log("Disconnected printer session.")
-        self.statusBar().showMessage("Disconnected", 2500)
+        self._close_ssh_cache()
+        self._show_status("Disconnected", 2500)
 
     def _run_printer_command(
         self,
@@ -4290,9 +4456,9 @@ QGroupBox::title {
             command=command,
             host=str(params["host"]),
         )
-        QApplication.setOverrideCursor(Qt.WaitCursor)
         try:
-            output = service.run_remote_command(command=command, **params).strip()
+            with self._busy_cursor():
+                output = service.run_remote_command(command=command, **params).strip()
         except SSHDeployError as exc:
             self.app_state_store.update_deploy(last_restart_status=f"failed: {exc}")
             self._set_device_connection_health(False, str(exc))
@@ -4306,8 +4472,6 @@ QGroupBox::title {
                 error=str(exc),
             )
             return
-        finally:
-            QApplication.restoreOverrideCursor()
 
         summary = output or "(no output)"
         self._append_ssh_log(f"{action_name}: {summary}")
@@ -4324,10 +4488,10 @@ QGroupBox::title {
         )
         if disconnect_after:
             self._disconnect_printer()
-            self.statusBar().showMessage(f"{action_name} issued: {summary}", 3000)
+            self._show_status(f"{action_name} issued: {summary}", 3000)
             return
         self._set_device_connection_health(True, f"{action_name} succeeded.")
-        self.statusBar().showMessage(f"{action_name} succeeded", 3000)
+        self._show_status(f"{action_name} succeeded", 3000)
 
     def _restart_klipper_service(self) -> None:
         command = self.ssh_restart_cmd_edit.text().strip() or "sudo systemctl restart klipper"
@@ -4695,7 +4859,7 @@ QGroupBox::title {
             target_json = bundle_root / subdir / f"{component_id}.json"
             self._write_guided_file(
                 target_json,
-                json.dumps(payload, indent=2, sort_keys=False) + "\n",
+                json_codec.dumps(payload, indent=True).decode("utf-8") + "\n",
             )
             created.append(target_json)
 
@@ -4729,6 +4893,8 @@ QGroupBox::title {
 
     def _refresh_bundle_backed_component_options(self) -> None:
         refresh_bundle_catalog()
+        self.board_profile_cache.clear()
+        self.toolhead_board_profile_cache.clear()
         if self.current_preset is None:
             return
         available_boards = sorted(set(self.current_preset.supported_boards).union(list_main_boards()))
@@ -4765,7 +4931,7 @@ QGroupBox::title {
                 "Reloaded bundle catalog. New boards/toolhead boards are available immediately."
             ),
         )
-        self.statusBar().showMessage("Guided component setup created bundle files", 3000)
+        self._show_status("Guided component setup created bundle files", 3000)
 
     def _learn_addons_from_import(self) -> None:
         QMessageBox.information(
@@ -4831,17 +4997,15 @@ QGroupBox::title {
         self._import_existing_machine_from_path(path, source_kind)
 
     def _import_existing_machine_from_path(self, path: str, source_kind: str) -> None:
-        QApplication.setOverrideCursor(Qt.WaitCursor)
         try:
-            if source_kind == "zip":
-                profile = self.existing_machine_import_service.import_zip(path)
-            else:
-                profile = self.existing_machine_import_service.import_folder(path)
+            with self._busy_cursor():
+                if source_kind == "zip":
+                    profile = self.existing_machine_import_service.import_zip(path)
+                else:
+                    profile = self.existing_machine_import_service.import_folder(path)
         except ExistingMachineImportError as exc:
             self._show_error("Import Existing Machine", str(exc))
             return
-        finally:
-            QApplication.restoreOverrideCursor()
 
         file_map = profile.detected.get("file_map")
         if not isinstance(file_map, dict):
@@ -4857,7 +5021,7 @@ QGroupBox::title {
 
         self._load_imported_machine_profile(profile, normalized_file_map)
         self.tabs.setCurrentWidget(self.files_tab)
-        self.statusBar().showMessage(f"Imported existing machine: {Path(path).name}", 3000)
+        self._show_status(f"Imported existing machine: {Path(path).name}", 3000)
 
     def _load_imported_machine_profile(
         self,
@@ -4874,11 +5038,7 @@ QGroupBox::title {
         self.imported_file_order = ordered
         self._showing_external_file = True
 
-        self.generated_file_list.blockSignals(True)
-        self.generated_file_list.clear()
-        for file_path in ordered:
-            self.generated_file_list.addItem(file_path)
-        self.generated_file_list.blockSignals(False)
+        self._fill_generated_file_list(ordered)
 
         if ordered:
             self.generated_file_list.setCurrentRow(0)
@@ -5048,7 +5208,7 @@ QGroupBox::title {
         self._apply_project_to_ui(updated_project)
         self._render_and_validate()
         self.import_profile_applied_snapshot = updated_project.model_dump(mode="json")
-        self.statusBar().showMessage(f"Applied {len(selected)} import suggestion(s)", 3000)
+        self._show_status(f"Applied {len(selected)} import suggestion(s)", 3000)
 
     def _refresh_saved_machine_profiles(self, select_name: str | None = None) -> None:
         names = self.saved_machine_profile_service.list_names()
@@ -5087,7 +5247,7 @@ QGroupBox::title {
             return
 
         self._refresh_saved_machine_profiles(select_name=name)
-        self.statusBar().showMessage(f"Saved machine profile '{name}'", 3000)
+        self._show_status(f"Saved machine profile '{name}'", 3000)
 
     def _load_selected_machine_profile(self) -> None:
         name = self.machine_profile_combo.currentText().strip()
@@ -5115,7 +5275,7 @@ QGroupBox::title {
             self.import_profile_applied_snapshot = dict(snapshot)
         else:
             self.import_profile_applied_snapshot = {}
-        self.statusBar().showMessage(f"Loaded machine profile '{name}'", 3000)
+        self._show_status(f"Loaded machine profile '{name}'", 3000)
 
     def _delete_selected_machine_profile(self) -> None:
         name = self.machine_profile_combo.currentText().strip()
@@ -5134,7 +5294,7 @@ QGroupBox::title {
             self._show_error("Machine Profile", f"Profile '{name}' was not found.")
             return
         self._refresh_saved_machine_profiles()
-        self.statusBar().showMessage(f"Deleted machine profile '{name}'", 3000)
+        self._show_status(f"Deleted machine profile '{name}'", 3000)
 
     def _show_selected_imported_file(self) -> None:
         item = self.generated_file_list.currentItem()
@@ -5389,6 +5549,7 @@ QGroupBox::title {
 
         self.modify_status_label = QLabel("No remote file loaded.", tab)
         self.modify_status_label.setWordWrap(True)
+        self.modify_status_severity: str | None = None
         layout.addWidget(self.modify_status_label)
 
         self.modify_editor = QPlainTextEdit(tab)
@@ -6550,7 +6711,9 @@ QGroupBox::title {
 
         action_row = QHBoxLayout()
         self.manage_refresh_files_btn = QPushButton("Refresh Files", tab)
-        self.manage_refresh_files_btn.clicked.connect(self._manage_refresh_files)
+        self.manage_refresh_files_btn.clicked.connect(
+            lambda _checked=False: self._manage_refresh_files(force=True)
+        )
         action_row.addWidget(self.manage_refresh_files_btn)
 
         self.manage_up_dir_btn = QPushButton("Up Directory", tab)
@@ -6587,6 +6750,7 @@ QGroupBox::title {
         self.manage_file_tree = QTreeWidget(editor_splitter)
         self.manage_file_tree.setHeaderLabels(["Remote Files"])
         self.manage_file_tree.setAlternatingRowColors(True)
+        self.manage_file_tree.setUniformRowHeights(True)
         self.manage_file_tree.itemSelectionChanged.connect(self._manage_file_selection_changed)
         self.manage_file_tree.itemDoubleClicked.connect(
             lambda _item, _column: self._manage_open_selected_file()
@@ -6619,6 +6783,10 @@ QGroupBox::title {
         self.manage_refresh_backups_btn.clicked.connect(self._manage_refresh_backups)
         backup_buttons.addWidget(self.manage_refresh_backups_btn)
 
+        self.manage_clear_dir_cache_btn = QPushButton("Clear Listing Cache", backup_group)
+        self.manage_clear_dir_cache_btn.clicked.connect(self._manage_clear_dir_cache)
+        backup_buttons.addWidget(self.manage_clear_dir_cache_btn)
+
         backup_buttons.addStretch(1)
         backup_layout.addLayout(backup_buttons)
 
@@ -6635,15 +6803,39 @@ QGroupBox::title {
         backup_select_row.addWidget(self.manage_restore_backup_btn)
         backup_layout.addLayout(backup_select_row)
 
+        download_row = QHBoxLayout()
         self.manage_download_backup_btn = QPushButton(
             "Download Selected Backup to Desktop", backup_group
         )
         self.manage_download_backup_btn.clicked.connect(self._manage_download_selected_backup)
-        backup_layout.addWidget(self.manage_download_backup_btn)
+        download_row.addWidget(self.manage_download_backup_btn, 1)
+        download_row.addWidget(QLabel("Parallel transfers", backup_group))
+        self.manage_download_concurrency_spin = QSpinBox(backup_group)
+        self.manage_download_concurrency_spin.setRange(1, 32)
+        self.manage_download_concurrency_spin.setValue(8)
+        download_row.addWidget(self.manage_download_concurrency_spin)
+        backup_layout.addLayout(download_row)
 
         layout.addWidget(backup_group)
 
         self.ssh_remote_dir_edit.textChanged.connect(self._sync_manage_remote_dir_from_ssh)
+        for edit in (
+            self.manage_host_edit,
+            self.ssh_host_edit,
+            self.ssh_username_edit,
+            self.ssh_password_edit,
+            self.ssh_key_path_edit,
+        ):
+            edit.textChanged.connect(self._bump_manage_params_rev)
+        self.ssh_port_spin.valueChanged.connect(self._bump_manage_params_rev)
+        for edit in (
+            self.ssh_remote_dir_edit,
+            self.ssh_remote_fetch_path_edit,
+            self.modify_remote_cfg_path_edit,
+            self.modify_backup_root_edit,
+            self.ssh_restart_cmd_edit,
+        ):
+            edit.textChanged.connect(self._bump_ssh_form_rev)
         return tab
 
     def _build_printers_tab(self) -> QWidget:
@@ -7164,7 +7356,7 @@ QGroupBox::title {
             blocking=blocking_count,
             warnings=warning_count,
         )
-        self.statusBar().showMessage("Compile complete", 2500)
+        self._show_status("Compile complete", 2500)
 
     def _update_validation_view(self, report: ValidationReport) -> None:
         sorted_findings = sorted(
@@ -7243,7 +7435,7 @@ QGroupBox::title {
 
         if not blocking_findings:
             if self._last_blocking_alert_snapshot:
-                self.statusBar().showMessage("Conflicts resolved", 2500)
+                self._show_status("Conflicts resolved", 2500)
             self._last_blocking_alert_snapshot = ()
             return
 
@@ -7261,7 +7453,7 @@ QGroupBox::title {
             for finding in blocking_findings
         )
         if snapshot != self._last_blocking_alert_snapshot:
-            self.statusBar().showMessage(f"Blocking conflicts: {len(blocking_findings)}", 3000)
+            self._show_status(f"Blocking conflicts: {len(blocking_findings)}", 3000)
             plural = "issue" if len(blocking_findings) == 1 else "issues"
             self._show_toast_notification(
                 (
@@ -7350,12 +7542,7 @@ QGroupBox::title {
         if self._showing_external_file:
             return
 
-        self.generated_file_list.blockSignals(True)
-        self.generated_file_list.clear()
-        if pack is not None:
-            for name in pack.files.keys():
-                self.generated_file_list.addItem(name)
-        self.generated_file_list.blockSignals(False)
+        self._fill_generated_file_list(pack.files.keys() if pack is not None else ())
 
         if pack is not None and self.generated_file_list.count() > 0:
             self.generated_file_list.setCurrentRow(0)
@@ -7379,6 +7566,7 @@ QGroupBox::title {
         can_upload_current = self.device_connected and self._can_upload_current_context()
         has_ssh_target = self._has_ssh_target_configured()
         can_restart = self.device_connected and has_ssh_target
+        connect_busy = self.auto_connect_in_progress or "connect" in self.remote_ops_in_flight
 
         if hasattr(self, "export_folder_action"):
             self.export_folder_action.setEnabled(can_output)
@@ -7393,13 +7581,11 @@ QGroupBox::title {
         if hasattr(self, "printer_upload_action"):
             self.printer_upload_action.setEnabled(can_upload_current)
         if hasattr(self, "printer_connect_action"):
-            self.printer_connect_action.setEnabled(has_ssh_target and not self.auto_connect_in_progress)
+            self.printer_connect_action.setEnabled(has_ssh_target and not connect_busy)
         if hasattr(self, "printer_disconnect_action"):
             self.printer_disconnect_action.setEnabled(self.device_connected)
         if hasattr(self, "tools_connect_action"):
-            self.tools_connect_action.setEnabled(
-                has_ssh_target and not self.auto_connect_in_progress
-            )
+            self.tools_connect_action.setEnabled(has_ssh_target and not connect_busy)
         if hasattr(self, "printer_restart_klipper_action"):
             self.printer_restart_klipper_action.setEnabled(can_restart)
         if hasattr(self, "printer_restart_host_action"):
@@ -7420,11 +7606,25 @@ QGroupBox::title {
             return
         self._show_selected_generated_file()
 
+    def _fill_generated_file_list(self, names: Iterable[str]) -> None:
+        self.generated_file_list.blockSignals(True)
+        self.generated_file_list.clear()
+        self.generated_items_by_name.clear()
+        for name in names:
+            item = QListWidgetItem(name)
+            self.generated_file_list.addItem(item)
+            self.generated_items_by_name.setdefault(name, item)
+        self.generated_file_list.blockSignals(False)
+
+    def find_generated_item(self, name: str) -> QListWidgetItem | None:
+        return self.generated_items_by_name.get(name)
+
     def _show_selected_generated_file(self) -> None:
         if self._showing_external_file:
             self._showing_external_file = False
             self.imported_file_order = []
             self.generated_file_list.clear()
+            self.generated_items_by_name.clear()
             self._update_generated_files_view(self.current_pack)
             return
 
@@ -7567,7 +7767,7 @@ QGroupBox::title {
             clipboard = QApplication.clipboard()
             if clipboard is not None:
                 clipboard.setText(item.text())
-            self.statusBar().showMessage("Copied file path", 1500)
+            self._show_status("Copied file path", 1500)
 
     def _current_cfg_target_label(self) -> str:
         if self.files_current_generated_name:
@@ -7771,11 +7971,11 @@ QGroupBox::title {
             warnings=warnings,
         )
         if blocking > 0:
-            self.statusBar().showMessage(f"Firmware validation: {blocking} blocking issue(s)", 3500)
+            self._show_status(f"Firmware validation: {blocking} blocking issue(s)", 3500)
         elif warnings > 0:
-            self.statusBar().showMessage(f"Firmware validation: {warnings} warning issue(s)", 3500)
+            self._show_status(f"Firmware validation: {warnings} warning issue(s)", 3500)
         else:
-            self.statusBar().showMessage("Firmware validation passed", 2500)
+            self._show_status("Firmware validation passed", 2500)
 
         if show_dialog:
             details = self._build_cfg_validation_details(report)
@@ -7836,9 +8036,9 @@ QGroupBox::title {
                 and self.files_current_generated_name
             ):
                 self.current_pack.files[self.files_current_generated_name] = updated
-            self.statusBar().showMessage(f"Refactored {source_label} ({changes} change(s))", 3000)
+            self._show_status(f"Refactored {source_label} ({changes} change(s))", 3000)
         else:
-            self.statusBar().showMessage(f"No refactor changes for {source_label}", 2500)
+            self._show_status(f"No refactor changes for {source_label}", 2500)
         self.action_log_service.log_event(
             "files_refactor",
             source=source_label,
@@ -7849,9 +8049,11 @@ QGroupBox::title {
     @staticmethod
     def _is_cfg_label(label: str, generated_name: str | None) -> bool:
         if generated_name:
-            return generated_name.lower().endswith(".cfg")
+            return generated_name[-4:].lower() == ".cfg"
+        if label[-4:].lower() == ".cfg":
+            return True
         lower = label.lower()
-        return lower.endswith(".cfg") or ".cfg:" in lower or "/.cfg" in lower
+        return ".cfg:" in lower or "/.cfg" in lower
 
     def _clear_cfg_form(self) -> None:
         self.cfg_form_editors.clear()
@@ -7874,8 +8076,7 @@ QGroupBox::title {
             self.form_summary_label.setText("Forms are available for .cfg files only.")
             return
 
-        lines = self.files_current_content.splitlines()
-        parsed = self._parse_cfg_fields(lines)
+        parsed = self._parse_cfg_fields(self.files_current_content)
         if not parsed:
             self.form_summary_label.setText(
                 "No simple editable key/value fields found. Multi-line blocks remain in raw view."
@@ -7891,9 +8092,6 @@ QGroupBox::title {
             section_layout = QFormLayout(section_group)
             for entry in entries:
                 editor = QLineEdit(entry["value"], section_group)
-                editor.setProperty("line_index", entry["line_index"])
-                editor.setProperty("key", entry["key"])
-                editor.setProperty("section", entry["section"])
                 section_layout.addRow(entry["key"], editor)
                 self.cfg_form_editors.append(
                     {
@@ -7911,57 +8109,29 @@ QGroupBox::title {
         self.apply_form_btn.setEnabled(True)
 
     @staticmethod
-    def _parse_cfg_fields(lines: list[str]) -> list[dict[str, Any]]:
+    def _parse_cfg_fields(content: str) -> list[dict[str, Any]]:
         section = "global"
         parsed: list[dict[str, Any]] = []
-        section_pattern = re.compile(r"^\s*\[([^\]]+)\]\s*$")
-        key_pattern = re.compile(r"^\s*([A-Za-z0-9_.-]+)\s*:\s*(.*)$")
+        line_index = 0
+        line_start = 0
 
-        for index, line in enumerate(lines):
-            stripped = line.strip()
-            if not stripped:
-                continue
-            if stripped.startswith("#") or stripped.startswith(";"):
-                continue
-
-            section_match = section_pattern.match(line)
-            if section_match:
-                section = section_match.group(1).strip() or "global"
-                continue
+        for match in _CFG_FIELD_PATTERN.finditer(content):
+            line_index += content.count("\n", line_start, match.start())
+            line_start = match.start()
 
-            if line[:1].isspace():
+            section_name = match.group("section")
+            if section_name is not None:
+                section = section_name.strip() or "global"
                 continue
-
-            key_match = key_pattern.match(line)
-            if not key_match:
-                continue
-
-            key = key_match.group(1).strip()
-            value = key_match.group(2).strip()
-
-            has_multiline_value = False
-            probe = index + 1
-            while probe < len(lines):
-                nxt = lines[probe]
-                nxt_stripped = nxt.strip()
-                if not nxt_stripped:
-                    probe += 1
-                    continue
-                if nxt_stripped.startswith("#") or nxt_stripped.startswith(";"):
-                    probe += 1
-                    continue
-                if nxt[:1].isspace():
-                    has_multiline_value = True
-                break
-            if has_multiline_value:
+            if _CFG_CONTINUATION_PATTERN.match(content, match.end()):
                 continue
 
             parsed.append(
                 {
                     "section": section,
-                    "key": key,
-                    "value": value,
-                    "line_index": index,
+                    "key": match.group("key"),
+                    "value": match.group("value"),
+                    "line_index": line_index,
                 }
             )
         return parsed
@@ -8014,7 +8184,7 @@ QGroupBox::title {
             warnings=sum(1 for finding in self.current_cfg_report.findings if finding.severity == "warning"),
             source_label=self._current_cfg_target_label(),
         )
-        self.statusBar().showMessage("Applied form changes to current file view", 2500)
+        self._show_status("Applied form changes to current file view", 2500)
         self._run_current_cfg_validation(show_dialog=False)
 
     def _ensure_export_ready(self) -> bool:
@@ -8049,7 +8219,7 @@ QGroupBox::title {
 
         if hasattr(self, "export_status_label"):
             self.export_status_label.setText(f"Folder export complete: {directory}")
-        self.statusBar().showMessage("Exported folder", 2500)
+        self._show_status("Exported folder", 2500)
 
     def _export_zip(self) -> None:
         if not self._ensure_export_ready():
@@ -8077,7 +8247,7 @@ QGroupBox::title {
 
         if hasattr(self, "export_status_label"):
             self.export_status_label.setText(f"ZIP export complete: {zip_path}")
-        self.statusBar().showMessage("Exported zip", 2500)
+        self._show_status("Exported zip", 2500)
     def _save_project_to_file(self) -> None:
         file_path, _ = QFileDialog.getSaveFileName(
             self,
@@ -8109,7 +8279,7 @@ QGroupBox::title {
         self._apply_project_to_ui(project)
         self.current_project_path = file_path
         self._render_and_validate()
-        self.statusBar().showMessage(f"Loaded project: {file_path}", 2500)
+        self._show_status(f"Loaded project: {file_path}", 2500)
 
     def _new_project(self) -> None:
         if self.preset_combo.count() == 0:
@@ -8128,7 +8298,7 @@ QGroupBox::title {
         self.led_initial_blue_spin.setValue(0.0)
         self._sync_led_controls()
         self.current_project_path = None
-        self.statusBar().showMessage("New project ready", 2500)
+        self._show_status("New project ready", 2500)
 
     def _apply_project_to_ui(self, project: ProjectConfig) -> None:
         self._applying_project = True
@@ -8152,21 +8322,21 @@ QGroupBox::title {
             self.hotend_thermistor_edit.setText(project.thermistors.hotend)
             self.bed_thermistor_edit.setText(project.thermistors.bed)
 
-            self.toolhead_can_board_combo.blockSignals(True)
-            self.toolhead_usb_board_combo.blockSignals(True)
-            self.toolhead_can_board_combo.setCurrentIndex(0)
-            self.toolhead_usb_board_combo.setCurrentIndex(0)
-            if project.toolhead.board:
-                if toolhead_board_transport(project.toolhead.board) == "usb":
-                    toolhead_index = self.toolhead_usb_board_combo.findData(project.toolhead.board)
-                    if toolhead_index >= 0:
-                        self.toolhead_usb_board_combo.setCurrentIndex(toolhead_index)
-                else:
-                    toolhead_index = self.toolhead_can_board_combo.findData(project.toolhead.board)
-                    if toolhead_index >= 0:
-                        self.toolhead_can_board_combo.setCurrentIndex(toolhead_index)
-            self.toolhead_can_board_combo.blockSignals(False)
-            self.toolhead_usb_board_combo.blockSignals(False)
+            with (
+                QSignalBlocker(self.toolhead_can_board_combo),
+                QSignalBlocker(self.toolhead_usb_board_combo),
+            ):
+                self.toolhead_can_board_combo.setCurrentIndex(0)
+                self.toolhead_usb_board_combo.setCurrentIndex(0)
+                if project.toolhead.board:
+                    if toolhead_board_transport(project.toolhead.board) == "usb":
+                        toolhead_index = self.toolhead_usb_board_combo.findData(project.toolhead.board)
+                        if toolhead_index >= 0:
+                            self.toolhead_usb_board_combo.setCurrentIndex(toolhead_index)
+                    else:
+                        toolhead_index = self.toolhead_can_board_combo.findData(project.toolhead.board)
+                        if toolhead_index >= 0:
+                            self.toolhead_can_board_combo.setCurrentIndex(toolhead_index)
             self.toolhead_canbus_uuid_edit.setText(project.toolhead.canbus_uuid or "")
 
             self.led_enabled_checkbox.setChecked(project.leds.enabled)
@@ -8189,19 +8359,17 @@ QGroupBox::title {
             self._applying_project = False
 
     def _replace_overrides(self, overrides: dict[str, Any]) -> None:
-        self.overrides_table.blockSignals(True)
-        self.overrides_table.setRowCount(0)
-        for key, value in sorted(overrides.items()):
-            self._add_override_row(key, str(value), trigger_render=False)
-        self.overrides_table.blockSignals(False)
+        with QSignalBlocker(self.overrides_table):
+            self.overrides_table.setRowCount(0)
+            for key, value in sorted(overrides.items()):
+                self._add_override_row(key, str(value), trigger_render=False)
 
     def _add_override_row(self, key: str = "", value: str = "", trigger_render: bool = True) -> None:
-        self.overrides_table.blockSignals(True)
-        row = self.overrides_table.rowCount()
-        self.overrides_table.insertRow(row)
-        self.overrides_table.setItem(row, 0, QTableWidgetItem(key))
-        self.overrides_table.setItem(row, 1, QTableWidgetItem(value))
-        self.overrides_table.blockSignals(False)
+        with QSignalBlocker(self.overrides_table):
+            row = self.overrides_table.rowCount()
+            self.overrides_table.insertRow(row)
+            self.overrides_table.setItem(row, 0, QTableWidgetItem(key))
+            self.overrides_table.setItem(row, 1, QTableWidgetItem(value))
         if trigger_render:
             self._render_and_validate()
 
@@ -8209,10 +8377,9 @@ QGroupBox::title {
         rows = sorted({index.row() for index in self.overrides_table.selectedIndexes()}, reverse=True)
         if not rows:
             return
-        self.overrides_table.blockSignals(True)
-        for row in rows:
-            self.overrides_table.removeRow(row)
-        self.overrides_table.blockSignals(False)
+        with QSignalBlocker(self.overrides_table):
+            for row in rows:
+                self.overrides_table.removeRow(row)
         self._render_and_validate()
 
     def _clear_overrides(self, skip_confirm: bool = False) -> None:
@@ -8220,9 +8387,8 @@ QGroupBox::title {
             answer = QMessageBox.question(self, "Clear Overrides", "Remove all advanced overrides?")
             if answer != QMessageBox.StandardButton.Yes:
                 return
-        self.overrides_table.blockSignals(True)
-        self.overrides_table.setRowCount(0)
-        self.overrides_table.blockSignals(False)
+        with QSignalBlocker(self.overrides_table):
+            self.overrides_table.setRowCount(0)
         self._render_and_validate()
 
     def _refresh_board_summary(self) -> None:
@@ -8234,7 +8400,7 @@ QGroupBox::title {
         lines: list[str] = []
 
         if isinstance(board_id, str):
-            main_profile = get_board_profile(board_id)
+            main_profile = self._cached_board_profile(board_id)
             lines.append(f"Mainboard: {self._format_board_label(board_id)}")
             if main_profile:
                 lines.append(f"MCU: {main_profile.mcu}")
@@ -8245,7 +8411,7 @@ QGroupBox::title {
                         lines.append(f"  - {section}: {', '.join(connectors)}")
 
         if isinstance(toolhead_id, str):
-            tool_profile = get_toolhead_board_profile(toolhead_id)
+            tool_profile = self._cached_toolhead_board_profile(toolhead_id)
             lines.append("")
             lines.append(f"Toolhead: {self._format_toolhead_board_label(toolhead_id)}")
             if tool_profile:
@@ -8323,20 +8489,19 @@ QGroupBox::title {
             self.scan_network_btn.setEnabled(False)
         if hasattr(self, "tools_scan_printers_action"):
             self.tools_scan_printers_action.setEnabled(False)
-        self.statusBar().showMessage("Scanning network for printers...", 0)
-        QApplication.setOverrideCursor(Qt.WaitCursor)
+        self._show_status("Scanning network for printers...", 0)
         try:
-            results = self.discovery_service.scan(
-                cidr,
-                timeout=timeout,
-                max_hosts=max_hosts,
-            )
+            with self._busy_cursor():
+                results = self.discovery_service.scan(
+                    cidr,
+                    timeout=timeout,
+                    max_hosts=max_hosts,
+                )
         except PrinterDiscoveryError as exc:
             self._show_error("Discovery Failed", str(exc))
             self._append_ssh_log(f"Discovery failed: {exc}")
             return
         finally:
-            QApplication.restoreOverrideCursor()
             if hasattr(self, "scan_network_btn"):
                 self.scan_network_btn.setEnabled(True)
             if hasattr(self, "tools_scan_printers_action"):
@@ -8347,10 +8512,10 @@ QGroupBox::title {
             self._append_ssh_log(
                 f"Discovery complete: {len(results)} likely printer host(s) found in {cidr}."
             )
-            self.statusBar().showMessage(f"Found {len(results)} host(s)", 3000)
+            self._show_status(f"Found {len(results)} host(s)", 3000)
         else:
             self._append_ssh_log(f"Discovery complete: no printers found in {cidr}.")
-            self.statusBar().showMessage("No printers found", 3000)
+            self._show_status("No printers found", 3000)
 
     def _populate_discovery_results(self, results: list[DiscoveredPrinter]) -> None:
         self.discovery_results_table.setRowCount(len(results))
@@ -8388,19 +8553,19 @@ QGroupBox::title {
             self._show_error("Discovery", "Selected row has no host value.")
             return
 
-        host = host_item.data(Qt.ItemDataRole.UserRole) or host_item.text().strip()
+        host = str(host_item.data(Qt.ItemDataRole.UserRole) or host_item.text().strip())
         if not host:
             self._show_error("Discovery", "Selected row has an invalid host.")
             return
-        self.ssh_host_edit.setText(str(host))
-        self.manage_host_edit.setText(str(host))
+        self.ssh_host_edit.setText(host)
+        self.manage_host_edit.setText(host)
         self._refresh_modify_connection_summary()
         if not self.ssh_connection_name_edit.text().strip():
-            self.ssh_connection_name_edit.setText(str(host))
+            self.ssh_connection_name_edit.setText(host)
         self._append_ssh_log(f"Using discovered host: {host}")
         self._append_manage_log(f"Using discovered host: {host}")
         self._append_modify_log(f"Using discovered host: {host}")
-        self.statusBar().showMessage(f"Host set to {host}", 2500)
+        self._show_status(f"Host set to {host}", 2500)
 
     def _sync_manage_remote_dir_from_ssh(self, value: str) -> None:
         if not self.manage_remote_dir_edit.text().strip():
@@ -8434,7 +8599,7 @@ QGroupBox::title {
         self._append_ssh_log(f"Exploring config directory: {host} -> {remote_dir}")
         self._append_manage_log(f"Exploring config directory: {host} -> {remote_dir}")
         self._manage_refresh_files(target_dir=remote_dir)
-        self.statusBar().showMessage("Opened connected printer config explorer", 3000)
+        self._show_status("Opened connected printer config explorer", 3000)
 
     def _resolve_manage_host(self) -> str:
         return self.manage_host_edit.text().strip() or self.ssh_host_edit.text().strip()
@@ -8453,7 +8618,8 @@ QGroupBox::title {
 
     def _resolve_manage_control_url(self) -> str:
         manual_url = self.manage_control_url_edit.text().strip()
-        source = manual_url or self.ssh_host_edit.text().strip() or self._resolve_manage_host()
+        ssh_host = self.ssh_host_edit.text().strip()
+        source = manual_url or ssh_host or self.manage_host_edit.text().strip()
         normalized = self._normalize_control_url(source)
         if normalized:
             return normalized
@@ -8480,13 +8646,13 @@ QGroupBox::title {
                 opened = QDesktopServices.openUrl(QUrl(control_url))
                 if opened:
                     self._append_manage_log(f"{exc} Opened in external browser: {control_url}")
-                    self.statusBar().showMessage("Embedded view unavailable; opened browser", 3500)
+                    self._show_status("Embedded view unavailable; opened browser", 3500)
                     self.app_state_store.update_ui(active_route="printers", right_panel_mode="context")
                     return
                 self._show_error("Manage Printer", str(exc))
                 return
             self._append_manage_log(f"Opened control view in tab: {control_url}")
-            self.statusBar().showMessage(f"Control view opened: {control_url}", 3000)
+            self._show_status(f"Control view opened: {control_url}", 3000)
             self.app_state_store.update_ui(active_route="printers", right_panel_mode="context")
             return
 
@@ -8495,7 +8661,7 @@ QGroupBox::title {
             self._append_manage_log(
                 f"Embedded view unavailable. Opened in external browser: {control_url}"
             )
-            self.statusBar().showMessage("Embedded view unavailable; opened browser", 3500)
+            self._show_status("Embedded view unavailable; opened browser", 3500)
             self.app_state_store.update_ui(active_route="printers", right_panel_mode="context")
             return
 
@@ -8511,7 +8677,7 @@ QGroupBox::title {
         except RuntimeError as exc:
             self._show_error("Manage Printer", str(exc))
             return
-        self.statusBar().showMessage("Control view reloaded", 2500)
+        self._show_status("Control view reloaded", 2500)
 
     def _manage_open_control_external(self) -> None:
         control_url = self._resolve_manage_control_url()
@@ -8519,44 +8685,257 @@ QGroupBox::title {
             return
         if QDesktopServices.openUrl(QUrl(control_url)):
             self._append_manage_log(f"Opened control URL in browser: {control_url}")
-            self.statusBar().showMessage("Opened control URL in browser", 2500)
+            self._show_status("Opened control URL in browser", 2500)
             return
         self._show_error("Manage Printer", "Could not open external browser for control URL.")
 
+    def _bump_manage_params_rev(self, *_args: Any) -> None:
+        self.manage_params_rev += 1
+
     def _collect_manage_params(self) -> dict[str, Any] | None:
+        cached = self.manage_params_cache
+        if cached is not None and cached[0] == self.manage_params_rev:
+            return dict(cached[1])
         host = self._resolve_manage_host()
         if not host:
             self._show_error("Manage Printer", "Set a host in SSH or Manage Printer tab.")
             return None
-        return self._collect_ssh_params(host_override=host)
+        params = self._collect_ssh_params(host_override=host)
+        if params is not None:
+            self.manage_params_cache = (self.manage_params_rev, dict(params))
+        return params
 
     def _append_manage_log(self, message: str) -> None:
-        stamp = datetime.now().strftime("%H:%M:%S")
+        stamp = _now_stamp()
         line = f"[{stamp}] {message}"
+        if message == self.manage_last_log_message and not self.manage_log.document().isEmpty():
+            # Collapse repeats into the last line instead of growing the log.
+            self.manage_log_repeat_count += 1
+            cursor = self.manage_log.textCursor()
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.movePosition(
+                QTextCursor.MoveOperation.StartOfBlock,
+                QTextCursor.MoveMode.KeepAnchor,
+            )
+            with QSignalBlocker(self.manage_log):
+                cursor.insertText(f"{line} (x{self.manage_log_repeat_count})")
+            return
+        self.manage_last_log_message = message
+        self.manage_log_repeat_count = 1
         self.manage_log.appendPlainText(line)
-        if hasattr(self, "console_activity_log"):
-            self.console_activity_log.appendPlainText(f"[MANAGE] {line}")
+        self._queue_log_line("console", f"[MANAGE] {line}")
 
     def _manage_resolve_root_directory(self) -> str:
         return self.manage_remote_dir_edit.text().strip() or self.ssh_remote_dir_edit.text().strip()
 
+    @staticmethod
+    def _manage_dir_cache_prefix(params: dict[str, Any]) -> str:
+        return f"{params.get('username')}@{params.get('host')}:{params.get('port')}:"
+
+    def _submit_remote_op(
+        self,
+        task: Callable[[], Any],
+        on_done: Callable[[Any, Exception | None], None] | None,
+        *,
+        busy_widgets: tuple[QWidget, ...] = (),
+        name: str = "klippconfig-remote-op",
+    ) -> None:
+        for widget in busy_widgets:
+            self.remote_busy_widget_counts[widget] = self.remote_busy_widget_counts.get(widget, 0) + 1
+            widget.setEnabled(False)
+        self.remote_pending_ops += 1
+
+        def _run() -> None:
+            try:
+                result = task()
+            except Exception as exc:  # noqa: BLE001
+                self.remote_op_result_queue.put((on_done, busy_widgets, None, exc))
+                return
+            self.remote_op_result_queue.put((on_done, busy_widgets, result, None))
+
+        threading.Thread(target=_run, name=name, daemon=True).start()
+        self.remote_op_poll_timer.start()
+
+    def _begin_remote_flow(self, key: str, busy_message: str) -> bool:
+        if key in self.remote_ops_in_flight:
+            self._show_status(busy_message, 2500)
+            return False
+        self.remote_ops_in_flight.add(key)
+        return True
+
+    def _end_remote_flow(self, key: str) -> None:
+        self.remote_ops_in_flight.discard(key)
+
+    def _post_remote_progress(self, callback: Callable[[], None]) -> None:
+        """Queue a UI update from a worker; it runs on the next op poll, before results."""
+        self.remote_progress_queue.put(callback)
+
+    def _process_remote_op_results(self) -> None:
+        while True:
+            try:
+                callback = self.remote_progress_queue.get_nowait()
+            except Empty:
+                break
+            callback()
+        while True:
+            try:
+                on_done, busy_widgets, result, error = self.remote_op_result_queue.get_nowait()
+            except Empty:
+                break
+            self.remote_pending_ops -= 1
+            for widget in busy_widgets:
+                # Widgets shared by overlapping ops stay disabled until the last one finishes.
+                remaining = self.remote_busy_widget_counts.get(widget, 1) - 1
+                if remaining > 0:
+                    self.remote_busy_widget_counts[widget] = remaining
+                    continue
+                self.remote_busy_widget_counts.pop(widget, None)
+                widget.setEnabled(True)
+            if on_done is not None:
+                on_done(result, error)
+        if self.remote_pending_ops <= 0:
+            self.remote_pending_ops = 0
+            self.remote_op_poll_timer.stop()
+
+    def _manage_request_listing(
+        self,
+        service: SSHDeployService,
+        remote_dir: str,
+        params: dict[str, Any],
+        on_done: Callable[[Any, Exception | None], None],
+        *,
+        force: bool = False,
+        busy_widgets: tuple[QWidget, ...] = (),
+    ) -> None:
+        prefix = self._manage_dir_cache_prefix(params)
+        cache_key = f"{prefix}{remote_dir}"
+        cached = self.manage_dir_cache.get(cache_key)
+        shown_stale: dict[str, Any] | None = None
+        if not force and cached is not None:
+            stamp, listing = cached
+            if cache_key in self.manage_dir_cache_stale:
+                # Listing restored from disk: show it now, then revalidate in the background.
+                self.manage_dir_cache_stale.discard(cache_key)
+                shown_stale = listing
+                on_done(listing, None)
+            elif time.monotonic() - stamp < self.manage_dir_cache_ttl:
+                on_done(listing, None)
+                return
+
+        def _store(listing: Any, error: Exception | None) -> None:
+            if error is None:
+                stamp = time.monotonic()
+                self.manage_dir_cache[cache_key] = (stamp, listing)
+                self.manage_dir_cache_stale.discard(cache_key)
+                directory = str(listing.get("directory") or "").strip()
+                if directory and directory != remote_dir:
+                    self.manage_dir_cache[f"{prefix}{directory}"] = (stamp, listing)
+                    self.manage_dir_cache_stale.discard(f"{prefix}{directory}")
+                if shown_stale is not None and listing.get("entries") == shown_stale.get("entries"):
+                    return
+            elif shown_stale is not None:
+                self._append_manage_log(f"Could not refresh cached listing for {remote_dir}: {error}")
+                return
+            on_done(listing, error)
+
+        self._submit_remote_op(
+            lambda: service.list_directory(remote_dir=remote_dir, **params),
+            _store,
+            busy_widgets=busy_widgets,
+            name="klippconfig-manage-list",
+        )
+
+    def _manage_prefetch_child_dirs(
+        self,
+        parent_item: QTreeWidgetItem,
+        service: SSHDeployService,
+        params: dict[str, Any],
+    ) -> None:
+        """Warm the listing cache for unloaded subfolders; the tree itself is untouched."""
+        prefix = self._manage_dir_cache_prefix(params)
+        now = time.monotonic()
+
+        def _on_prefetched(_listing: Any, _error: Exception | None) -> None:
+            self.manage_prefetch_pending -= 1
+
+        for index in range(parent_item.childCount()):
+            if self.manage_prefetch_pending >= self.MANAGE_PREFETCH_LIMIT:
+                return
+            child = parent_item.child(index)
+            if str(child.data(0, self.MANAGE_TREE_TYPE_ROLE) or "file") != "dir":
+                continue
+            if bool(child.data(0, self.MANAGE_TREE_LOADED_ROLE)):
+                continue
+            child_path = str(child.data(0, self.MANAGE_TREE_PATH_ROLE) or "").strip()
+            if not child_path:
+                continue
+            cached = self.manage_dir_cache.get(f"{prefix}{child_path}")
+            if cached is not None and now - cached[0] < self.manage_dir_cache_ttl:
+                continue
+            self.manage_prefetch_pending += 1
+            # force skips the show-stale-then-revalidate path, which would call
+            # back twice for one request; fresh entries were already skipped above.
+            self._manage_request_listing(service, child_path, params, _on_prefetched, force=True)
+
+    def _manage_invalidate_dir_cache(
+        self,
+        params: dict[str, Any],
+        remote_dir: str | None = None,
+    ) -> None:
+        prefix = self._manage_dir_cache_prefix(params)
+        if remote_dir is not None:
+            self.manage_dir_cache.pop(f"{prefix}{remote_dir}", None)
+            self.manage_dir_cache_stale.discard(f"{prefix}{remote_dir}")
+            return
+        for key in [key for key in self.manage_dir_cache if key.startswith(prefix)]:
+            del self.manage_dir_cache[key]
+            self.manage_dir_cache_stale.discard(key)
+
+    def _load_persisted_manage_dir_cache(self) -> None:
+        if self.manage_dir_cache_store is None:
+            return
+        stamp = time.monotonic()
+        for key, listing in self.manage_dir_cache_store.load().items():
+            self.manage_dir_cache[key] = (stamp, listing)
+            self.manage_dir_cache_stale.add(key)
+
+    def _persist_manage_dir_cache(self) -> None:
+        if self.manage_dir_cache_store is None:
+            return
+        listings = {key: listing for key, (_stamp, listing) in self.manage_dir_cache.items()}
+        try:
+            self.manage_dir_cache_store.save(listings)
+        except OSError:
+            return
+
+    def _manage_clear_dir_cache(self) -> None:
+        self.manage_dir_cache.clear()
+        self.manage_dir_cache_stale.clear()
+        if self.manage_dir_cache_store is not None:
+            try:
+                self.manage_dir_cache_store.clear()
+            except OSError as exc:
+                self._append_manage_log(f"Failed to clear listing cache: {exc}")
+                return
+        self._append_manage_log("Cleared cached directory listings.")
+        self._show_status("Cleared cached directory listings", 2500)
+
     @staticmethod
     def _manage_parent_directory(path: str) -> str:
         normalized = path.rstrip("/") or "/"
-        parent = posixpath.dirname(normalized) or "/"
-        return parent
+        return normalized.rpartition("/")[0].rstrip("/") or "/"
 
-    @staticmethod
-    def _manage_tree_path_role() -> int:
-        return int(Qt.ItemDataRole.UserRole)
+    @classmethod
+    def _manage_tree_path_role(cls) -> int:
+        return cls.MANAGE_TREE_PATH_ROLE
 
-    @staticmethod
-    def _manage_tree_type_role() -> int:
-        return int(Qt.ItemDataRole.UserRole + 1)
+    @classmethod
+    def _manage_tree_type_role(cls) -> int:
+        return cls.MANAGE_TREE_TYPE_ROLE
 
-    @staticmethod
-    def _manage_tree_loaded_role() -> int:
-        return int(Qt.ItemDataRole.UserRole + 2)
+    @classmethod
+    def _manage_tree_loaded_role(cls) -> int:
+        return cls.MANAGE_TREE_LOADED_ROLE
 
     def _manage_selected_tree_item(self) -> QTreeWidgetItem | None:
         selected = self.manage_file_tree.selectedItems()
@@ -8564,12 +8943,6 @@ QGroupBox::title {
             return None
         return selected[0]
 
-    @staticmethod
-    def _manage_entry_sort_key(entry: dict[str, Any]) -> tuple[int, str]:
-        entry_type = str(entry.get("type") or "file")
-        name = str(entry.get("name") or "")
-        return (0 if entry_type == "dir" else 1, name.casefold())
-
     def _manage_create_tree_item(
         self,
         *,
@@ -8579,9 +8952,9 @@ QGroupBox::title {
         loaded: bool,
     ) -> QTreeWidgetItem:
         item = QTreeWidgetItem([name])
-        item.setData(0, self._manage_tree_path_role(), remote_path)
-        item.setData(0, self._manage_tree_type_role(), entry_type)
-        item.setData(0, self._manage_tree_loaded_role(), loaded)
+        item.setData(0, self.MANAGE_TREE_PATH_ROLE, remote_path)
+        item.setData(0, self.MANAGE_TREE_TYPE_ROLE, entry_type)
+        item.setData(0, self.MANAGE_TREE_LOADED_ROLE, loaded)
         if entry_type == "dir":
             item.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator)
         return item
@@ -8591,22 +8964,136 @@ QGroupBox::title {
         parent_item: QTreeWidgetItem,
         entries: list[dict[str, Any]],
     ) -> int:
-        count = 0
-        for entry in sorted(entries, key=self._manage_entry_sort_key):
+        """Sync children with a listing, keeping unchanged items (and their state) in place."""
+        path_role = self.MANAGE_TREE_PATH_ROLE
+        type_role = self.MANAGE_TREE_TYPE_ROLE
+        existing: dict[str, QTreeWidgetItem] = {}
+        for index in range(parent_item.childCount() - 1, -1, -1):
+            child = parent_item.child(index)
+            if child.data(0, type_role) == "more":
+                parent_item.removeChild(child)
+                continue
+            existing[str(child.data(0, path_role) or "")] = child
+
+        # Normalize each entry once and sort on the precomputed (dirs first, name) key.
+        decorated: list[tuple[int, str, str, str, str]] = []
+        for entry in entries:
             entry_type = str(entry.get("type") or "file")
             name = str(entry.get("name") or "").strip()
             remote_path = str(entry.get("path") or "").strip()
             if not name or not remote_path:
                 continue
-            item = self._manage_create_tree_item(
-                name=name,
-                remote_path=remote_path,
-                entry_type=entry_type,
-                loaded=(entry_type != "dir"),
+            decorated.append(
+                (0 if entry_type == "dir" else 1, name.casefold(), name, remote_path, entry_type)
+            )
+        decorated.sort(key=lambda row: (row[0], row[1]))
+        listed = [(row[2], row[3], row[4]) for row in decorated]
+
+        # Huge folders are materialized a page at a time behind a "more" row; keep
+        # however many rows the user already paged in.
+        limit = max(self.MANAGE_TREE_PAGE_SIZE, len(existing))
+        incoming = listed[:limit]
+        self._manage_set_tree_overflow(parent_item, listed[limit:])
+
+        if not existing:
+            # First load of this folder: insert every child in one batch.
+            parent_item.insertChildren(
+                0,
+                [
+                    self._manage_create_tree_item(
+                        name=name,
+                        remote_path=remote_path,
+                        entry_type=entry_type,
+                        loaded=(entry_type != "dir"),
+                    )
+                    for name, remote_path, entry_type in incoming
+                ],
             )
-            parent_item.addChild(item)
-            count += 1
-        return count
+            return len(listed)
+
+        incoming_paths = {remote_path for _name, remote_path, _type in incoming}
+        for remote_path, child in existing.items():
+            if remote_path not in incoming_paths:
+                parent_item.removeChild(child)
+
+        for index, (name, remote_path, entry_type) in enumerate(incoming):
+            child = existing.get(remote_path)
+            if child is not None and str(child.data(0, type_role) or "file") != entry_type:
+                parent_item.removeChild(child)
+                child = None
+            if child is None:
+                child = self._manage_create_tree_item(
+                    name=name,
+                    remote_path=remote_path,
+                    entry_type=entry_type,
+                    loaded=(entry_type != "dir"),
+                )
+                parent_item.insertChild(index, child)
+                continue
+            if parent_item.indexOfChild(child) != index:
+                parent_item.insertChild(index, parent_item.takeChild(parent_item.indexOfChild(child)))
+            if child.text(0) != name:
+                child.setText(0, name)
+        return len(listed)
+
+    def _manage_set_tree_overflow(
+        self,
+        parent_item: QTreeWidgetItem,
+        overflow: list[tuple[str, str, str]],
+    ) -> None:
+        parent_path = str(parent_item.data(0, self.MANAGE_TREE_PATH_ROLE) or "")
+        if not overflow:
+            self.manage_tree_overflow.pop(parent_path, None)
+            return
+        self.manage_tree_overflow[parent_path] = overflow
+        more_item = QTreeWidgetItem([f"... {len(overflow)} more (open to show)"])
+        more_item.setData(0, self.MANAGE_TREE_PATH_ROLE, "")
+        more_item.setData(0, self.MANAGE_TREE_TYPE_ROLE, "more")
+        more_item.setData(0, self.MANAGE_TREE_LOADED_ROLE, True)
+        parent_item.addChild(more_item)
+
+    def _manage_show_more_tree_children(self, more_item: QTreeWidgetItem) -> None:
+        parent_item = more_item.parent()
+        if parent_item is None:
+            return
+        parent_path = str(parent_item.data(0, self.MANAGE_TREE_PATH_ROLE) or "")
+        overflow = self.manage_tree_overflow.get(parent_path, [])
+        page = overflow[: self.MANAGE_TREE_PAGE_SIZE]
+        tree = self.manage_file_tree
+        tree.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(tree):
+                parent_item.removeChild(more_item)
+                parent_item.addChildren(
+                    [
+                        self._manage_create_tree_item(
+                            name=name,
+                            remote_path=remote_path,
+                            entry_type=entry_type,
+                            loaded=(entry_type != "dir"),
+                        )
+                        for name, remote_path, entry_type in page
+                    ]
+                )
+                self._manage_set_tree_overflow(parent_item, overflow[len(page) :])
+        finally:
+            tree.setUpdatesEnabled(True)
+
+    def _manage_sync_tree_children(
+        self,
+        parent_item: QTreeWidgetItem,
+        entries: list[dict[str, Any]],
+    ) -> int:
+        tree = self.manage_file_tree
+        sorting_enabled = tree.isSortingEnabled()
+        tree.setUpdatesEnabled(False)
+        tree.setSortingEnabled(False)
+        try:
+            with QSignalBlocker(tree):
+                return self._manage_populate_tree_children(parent_item, entries)
+        finally:
+            tree.setSortingEnabled(sorting_enabled)
+            tree.setUpdatesEnabled(True)
 
     def _manage_load_tree_item(
         self,
@@ -8614,11 +9101,12 @@ QGroupBox::title {
         service: SSHDeployService | None = None,
         params: dict[str, Any] | None = None,
     ) -> bool:
-        entry_type = str(item.data(0, self._manage_tree_type_role()) or "file")
-        remote_path = str(item.data(0, self._manage_tree_path_role()) or "").strip()
+        """Return True when the folder is already loaded; otherwise start loading it."""
+        entry_type = str(item.data(0, self.MANAGE_TREE_TYPE_ROLE) or "file")
+        remote_path = str(item.data(0, self.MANAGE_TREE_PATH_ROLE) or "").strip()
         if entry_type != "dir" or not remote_path:
             return False
-        if bool(item.data(0, self._manage_tree_loaded_role())):
+        if bool(item.data(0, self.MANAGE_TREE_LOADED_ROLE)):
             return True
 
         local_service = service or self._get_ssh_service()
@@ -8628,34 +9116,41 @@ QGroupBox::title {
         if local_params is None:
             return False
 
-        QApplication.setOverrideCursor(Qt.WaitCursor)
-        try:
-            listing = local_service.list_directory(remote_dir=remote_path, **local_params)
-        except SSHDeployError as exc:
-            self._set_device_connection_health(False, str(exc))
-            self._show_error("Manage Printer", str(exc))
-            self._append_manage_log(f"Folder load failed: {exc}")
-            return False
-        finally:
-            QApplication.restoreOverrideCursor()
-
-        entries = list(listing.get("entries") or [])
-        item.takeChildren()
-        shown_count = self._manage_populate_tree_children(item, entries)
-        item.setData(0, self._manage_tree_loaded_role(), True)
-        item.setExpanded(True)
-        self.manage_current_directory = remote_path
-        self.manage_remote_dir_edit.setText(remote_path)
-        self.manage_current_dir_label.setText(f"Tree root: {self.manage_remote_dir_edit.text().strip()}")
-        self._append_manage_log(f"Loaded {shown_count} entries from {remote_path}.")
-        self._set_device_connection_health(True, f"Host {local_params['host']} reachable.")
-        return True
+        def _on_loaded(listing: Any, error: Exception | None) -> None:
+            if error is not None:
+                self._set_device_connection_health(False, str(error))
+                self._show_error("Manage Printer", str(error))
+                self._append_manage_log(f"Folder load failed: {error}")
+                return
+            entries = list(listing.get("entries") or [])
+            try:
+                shown_count = self._manage_sync_tree_children(item, entries)
+            except RuntimeError:
+                # The tree was rebuilt while the folder was loading.
+                return
+            item.setData(0, self.MANAGE_TREE_LOADED_ROLE, True)
+            item.setExpanded(True)
+            self.manage_current_directory = remote_path
+            self.manage_remote_dir_edit.setText(remote_path)
+            self.manage_current_dir_label.setText(f"Tree root: {remote_path}")
+            self._append_manage_log(f"Loaded {shown_count} entries from {remote_path}.")
+            self._set_device_connection_health(True, f"Host {local_params['host']} reachable.")
+            self._manage_prefetch_child_dirs(item, local_service, local_params)
+
+        self._manage_request_listing(
+            local_service,
+            remote_path,
+            local_params,
+            _on_loaded,
+            busy_widgets=(self.manage_open_file_btn,),
+        )
+        return False
 
     def _manage_tree_item_expanded(self, item: QTreeWidgetItem) -> None:
-        entry_type = str(item.data(0, self._manage_tree_type_role()) or "file")
+        entry_type = str(item.data(0, self.MANAGE_TREE_TYPE_ROLE) or "file")
         if entry_type != "dir":
             return
-        if bool(item.data(0, self._manage_tree_loaded_role())):
+        if bool(item.data(0, self.MANAGE_TREE_LOADED_ROLE)):
             return
         self._manage_load_tree_item(item)
 
@@ -8663,21 +9158,16 @@ QGroupBox::title {
         normalized = remote_dir.rstrip("/") or "/"
         if normalized == "/":
             return "/"
-        name = posixpath.basename(normalized)
-        if name:
-            return name
-        return normalized
+        return normalized.rpartition("/")[2] or normalized
 
     def _manage_browse_up_directory(self) -> None:
         selected = self._manage_selected_tree_item()
         current = ""
+        if selected is not None and selected.data(0, self.MANAGE_TREE_TYPE_ROLE) == "more":
+            selected = selected.parent()
         if selected is not None:
-            selected_path = str(
-                selected.data(0, self._manage_tree_path_role()) or ""
-            ).strip()
-            selected_type = str(
-                selected.data(0, self._manage_tree_type_role()) or "file"
-            )
+            selected_path = str(selected.data(0, self.MANAGE_TREE_PATH_ROLE) or "").strip()
+            selected_type = str(selected.data(0, self.MANAGE_TREE_TYPE_ROLE) or "file")
             if selected_type == "dir":
                 current = selected_path
             else:
@@ -8690,7 +9180,7 @@ QGroupBox::title {
         parent = self._manage_parent_directory(current)
         self._manage_refresh_files(target_dir=parent)
 
-    def _manage_refresh_files(self, target_dir: str | None = None) -> None:
+    def _manage_refresh_files(self, target_dir: str | None = None, *, force: bool = False) -> None:
         service = self._get_ssh_service()
         if service is None:
             return
@@ -8703,35 +9193,48 @@ QGroupBox::title {
             self._show_error("Manage Printer", "Remote cfg dir is empty.")
             return
 
-        self.manage_refresh_files_btn.setEnabled(False)
-        self.manage_up_dir_btn.setEnabled(False)
-        QApplication.setOverrideCursor(Qt.WaitCursor)
-        try:
-            listing = service.list_directory(
-                remote_dir=remote_dir,
-                **params,
-            )
-        except SSHDeployError as exc:
-            self._set_device_connection_health(False, str(exc))
-            self._show_error("Manage Printer", str(exc))
-            self._append_manage_log(f"File refresh failed: {exc}")
-            return
-        finally:
-            QApplication.restoreOverrideCursor()
-            self.manage_refresh_files_btn.setEnabled(True)
-            self.manage_up_dir_btn.setEnabled(True)
+        def _on_listed(listing: Any, error: Exception | None) -> None:
+            if error is not None:
+                self._set_device_connection_health(False, str(error))
+                self._show_error("Manage Printer", str(error))
+                self._append_manage_log(f"File refresh failed: {error}")
+                return
+            self._manage_show_listing(listing, remote_dir, params)
+
+        self._manage_request_listing(
+            service,
+            remote_dir,
+            params,
+            _on_listed,
+            force=force,
+            busy_widgets=(self.manage_refresh_files_btn, self.manage_up_dir_btn),
+        )
 
+    def _manage_show_listing(
+        self,
+        listing: dict[str, Any],
+        remote_dir: str,
+        params: dict[str, Any],
+    ) -> None:
         current_dir = str(listing.get("directory") or remote_dir).strip()
         entries = list(listing.get("entries") or [])
-        self.manage_file_tree.clear()
-        root_item = self._manage_create_tree_item(
-            name=self._manage_tree_root_display_name(current_dir),
-            remote_path=current_dir,
-            entry_type="dir",
-            loaded=True,
-        )
-        shown_count = self._manage_populate_tree_children(root_item, entries)
-        self.manage_file_tree.addTopLevelItem(root_item)
+        root_item = self.manage_file_tree.topLevelItem(0)
+        if (
+            root_item is None
+            or self.manage_file_tree.topLevelItemCount() != 1
+            or str(root_item.data(0, self.MANAGE_TREE_PATH_ROLE) or "") != current_dir
+        ):
+            self.manage_file_tree.clear()
+            root_item = self._manage_create_tree_item(
+                name=self._manage_tree_root_display_name(current_dir),
+                remote_path=current_dir,
+                entry_type="dir",
+                loaded=True,
+            )
+            shown_count = self._manage_populate_tree_children(root_item, entries)
+            self.manage_file_tree.addTopLevelItem(root_item)
+        else:
+            shown_count = self._manage_sync_tree_children(root_item, entries)
         root_item.setExpanded(True)
         self.manage_file_tree.setCurrentItem(root_item)
 
@@ -8745,14 +9248,80 @@ QGroupBox::title {
             f"Loaded {shown_count} entries from {current_dir}."
         )
         self._set_device_connection_health(True, f"Host {params['host']} reachable.")
-        self.statusBar().showMessage(f"Loaded {shown_count} entries", 2500)
+        self._show_status(f"Loaded {shown_count} entries", 2500)
+        self.manage_tree_params = dict(params)
+        self.manage_tree_poll_timer.start()
+
+    def _stop_manage_tree_poll(self) -> None:
+        """Stop background tree polling so it cannot reconnect a dropped or replaced session."""
+        if hasattr(self, "manage_tree_poll_timer"):
+            self.manage_tree_poll_timer.stop()
+        self.manage_tree_params = None
+
+    def _manage_visible_folder_items(self) -> list[QTreeWidgetItem]:
+        folders: list[QTreeWidgetItem] = []
+        stack = [
+            self.manage_file_tree.topLevelItem(index)
+            for index in range(self.manage_file_tree.topLevelItemCount())
+        ]
+        while stack:
+            item = stack.pop()
+            if str(item.data(0, self.MANAGE_TREE_TYPE_ROLE) or "file") != "dir":
+                continue
+            if not bool(item.data(0, self.MANAGE_TREE_LOADED_ROLE)):
+                continue
+            if item.parent() is not None and not item.isExpanded():
+                continue
+            folders.append(item)
+            stack.extend(item.child(index) for index in range(item.childCount()))
+        return folders
+
+    def _manage_poll_visible_folders(self) -> None:
+        """Re-list the root and expanded folders and apply only the entries that changed."""
+        params = self.manage_tree_params
+        service = self.ssh_service
+        if params is None or service is None or self.remote_pending_ops:
+            return
+        if not self.device_connected or not self.isActiveWindow():
+            return
+        prefix = self._manage_dir_cache_prefix(params)
+        for item in self._manage_visible_folder_items():
+            remote_path = str(item.data(0, self.MANAGE_TREE_PATH_ROLE) or "").strip()
+            if not remote_path:
+                continue
+            previous = self.manage_dir_cache.get(f"{prefix}{remote_path}")
+            previous_entries = previous[1].get("entries") if previous is not None else None
+
+            def _on_polled(
+                listing: Any,
+                error: Exception | None,
+                item: QTreeWidgetItem = item,
+                remote_path: str = remote_path,
+                previous_entries: Any = previous_entries,
+            ) -> None:
+                if error is not None:
+                    return
+                entries = list(listing.get("entries") or [])
+                if entries == previous_entries:
+                    return
+                try:
+                    shown_count = self._manage_sync_tree_children(item, entries)
+                except RuntimeError:
+                    return
+                self._append_manage_log(f"Updated {remote_path} ({shown_count} entries).")
+
+            self._manage_request_listing(service, remote_path, params, _on_polled, force=True)
 
     def _manage_file_selection_changed(self) -> None:
+        # Key-held navigation fires this per row; only the final selection updates the label.
+        self.manage_selection_label_timer.start()
+
+    def _manage_apply_selection_label(self) -> None:
         item = self._manage_selected_tree_item()
         if item is None:
             return
-        remote_path = str(item.data(0, self._manage_tree_path_role()) or "").strip()
-        entry_type = str(item.data(0, self._manage_tree_type_role()) or "file")
+        remote_path = str(item.data(0, self.MANAGE_TREE_PATH_ROLE) or "").strip()
+        entry_type = str(item.data(0, self.MANAGE_TREE_TYPE_ROLE) or "file")
         if not remote_path:
             return
         if entry_type == "dir":
@@ -8773,8 +9342,11 @@ QGroupBox::title {
         if selected is None:
             self._show_error("Manage Printer", "Select a remote file or folder first.")
             return
-        remote_path = str(selected.data(0, self._manage_tree_path_role()) or "").strip()
-        entry_type = str(selected.data(0, self._manage_tree_type_role()) or "file")
+        remote_path = str(selected.data(0, self.MANAGE_TREE_PATH_ROLE) or "").strip()
+        entry_type = str(selected.data(0, self.MANAGE_TREE_TYPE_ROLE) or "file")
+        if entry_type == "more":
+            self._manage_show_more_tree_children(selected)
+            return
         if not remote_path:
             self._show_error("Manage Printer", "Selected item has an invalid file path.")
             return
@@ -8785,18 +9357,34 @@ QGroupBox::title {
                 self.manage_remote_dir_edit.setText(remote_path)
             return
 
-        QApplication.setOverrideCursor(Qt.WaitCursor)
-        try:
-            content = service.fetch_file(remote_path=remote_path, **params)
-        except SSHDeployError as exc:
-            self._set_device_connection_health(False, str(exc))
-            self._show_error("Manage Printer", str(exc))
-            self._append_manage_log(f"Open failed: {exc}")
+        if not self._begin_remote_flow("manage_open", "Remote file is already opening..."):
+            return
+        self._submit_remote_op(
+            lambda: service.fetch_file(remote_path=remote_path, **params),
+            lambda content, error: self._manage_on_file_opened(remote_path, content, error),
+            busy_widgets=(self.manage_open_file_btn,),
+            name="klippconfig-manage-fetch",
+        )
+
+    def _manage_on_file_opened(
+        self,
+        remote_path: str,
+        content: Any,
+        error: Exception | None,
+    ) -> None:
+        self._end_remote_flow("manage_open")
+        if error is not None:
+            self._set_device_connection_health(False, str(error))
+            self._show_error("Manage Printer", str(error))
+            self._append_manage_log(f"Open failed: {error}")
             return
-        finally:
-            QApplication.restoreOverrideCursor()
 
-        self.manage_file_editor.setPlainText(content)
+        # Repaint once after the whole document is laid out, not per block.
+        self.manage_file_editor.setUpdatesEnabled(False)
+        try:
+            self.manage_file_editor.setPlainText(content)
+        finally:
+            self.manage_file_editor.setUpdatesEnabled(True)
         self.manage_current_remote_file = remote_path
         self.manage_current_file_label.setText(f"Editing: {remote_path}")
         self._set_persistent_preview_source(
@@ -8808,7 +9396,7 @@ QGroupBox::title {
         )
         self._append_manage_log(f"Opened {remote_path}.")
         self._set_device_connection_health(True, f"Opened {remote_path}.")
-        self.statusBar().showMessage(f"Opened {remote_path}", 2500)
+        self._show_status(f"Opened {remote_path}", 2500)
 
     def _manage_save_current_file(self) -> None:
         service = self._get_ssh_service()
@@ -8822,29 +9410,40 @@ QGroupBox::title {
         if not remote_path:
             selected = self._manage_selected_tree_item()
             if selected is not None:
-                selected_type = str(selected.data(0, self._manage_tree_type_role()) or "file")
+                selected_type = str(selected.data(0, self.MANAGE_TREE_TYPE_ROLE) or "file")
                 if selected_type != "file":
                     self._show_error("Manage Printer", "Select and open a file before saving.")
                     return
-                remote_path = str(
-                    selected.data(0, self._manage_tree_path_role()) or ""
-                ).strip()
+                remote_path = str(selected.data(0, self.MANAGE_TREE_PATH_ROLE) or "").strip()
         if not remote_path:
             self._show_error("Manage Printer", "No remote file is loaded for saving.")
             return
 
+        if not self._begin_remote_flow("manage_save", "Remote file is already saving..."):
+            return
         content = self.manage_file_editor.toPlainText()
-        QApplication.setOverrideCursor(Qt.WaitCursor)
-        try:
-            saved_path = service.write_file(remote_path=remote_path, content=content, **params)
-        except SSHDeployError as exc:
-            self._set_device_connection_health(False, str(exc))
-            self._show_error("Manage Printer", str(exc))
-            self._append_manage_log(f"Save failed: {exc}")
+        self._submit_remote_op(
+            lambda: service.write_file(remote_path=remote_path, content=content, **params),
+            lambda saved_path, error: self._manage_on_file_saved(params, content, saved_path, error),
+            busy_widgets=(self.manage_save_file_btn,),
+            name="klippconfig-manage-write",
+        )
+
+    def _manage_on_file_saved(
+        self,
+        params: dict[str, Any],
+        content: str,
+        saved_path: Any,
+        error: Exception | None,
+    ) -> None:
+        self._end_remote_flow("manage_save")
+        if error is not None:
+            self._set_device_connection_health(False, str(error))
+            self._show_error("Manage Printer", str(error))
+            self._append_manage_log(f"Save failed: {error}")
             return
-        finally:
-            QApplication.restoreOverrideCursor()
 
+        self._manage_invalidate_dir_cache(params, posixpath.dirname(saved_path) or "/")
         self.manage_current_remote_file = saved_path
         self.manage_current_file_label.setText(f"Editing: {saved_path}")
         self._set_persistent_preview_source(
@@ -8856,7 +9455,7 @@ QGroupBox::title {
         )
         self._append_manage_log(f"Saved {saved_path}.")
         self._set_device_connection_health(True, f"Saved {saved_path}.")
-        self.statusBar().showMessage("Remote file saved", 2500)
+        self._show_status("Remote file saved", 2500)
 
     def _manage_current_cfg_context(self) -> tuple[str, str] | None:
         remote_path = (self.manage_current_remote_file or "").strip()
@@ -8873,7 +9472,15 @@ QGroupBox::title {
         if context is None:
             return
         content, remote_path = context
-        report = self.firmware_tools_service.validate_cfg(content, source_label=remote_path)
+        # Only the latest digest per file is kept; refactor -> validate often re-checks
+        # unchanged text.
+        digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+        cached = self.manage_validation_cache.get(remote_path)
+        if cached is not None and cached[0] == digest:
+            report = cached[1]
+        else:
+            report = self.firmware_tools_service.validate_cfg(content, source_label=remote_path)
+            self.manage_validation_cache[remote_path] = (digest, report)
         blocking = sum(1 for finding in report.findings if finding.severity == "blocking")
         warnings = sum(1 for finding in report.findings if finding.severity == "warning")
         self._set_preview_validation_state(
@@ -8901,7 +9508,7 @@ QGroupBox::title {
                 f"{remote_path}: warnings={warnings}\n\n{self._build_cfg_validation_details(report)}",
             )
         else:
-            self.statusBar().showMessage("Remote firmware validation passed", 3000)
+            self._show_status("Remote firmware validation passed", 3000)
 
     def _manage_refactor_current_file(self) -> None:
         context = self._manage_current_cfg_context()
@@ -8919,10 +9526,10 @@ QGroupBox::title {
                 update_last=True,
             )
             self._append_manage_log(f"Refactored {remote_path}: {changes} change(s).")
-            self.statusBar().showMessage(f"Refactored remote file ({changes} change(s))", 3000)
+            self._show_status(f"Refactored remote file ({changes} change(s))", 3000)
         else:
             self._append_manage_log(f"No refactor changes for {remote_path}.")
-            self.statusBar().showMessage("No refactor changes for remote file", 2500)
+            self._show_status("No refactor changes for remote file", 2500)
         self._manage_validate_current_file()
 
     def _manage_create_backup(self) -> None:
@@ -8939,25 +9546,28 @@ QGroupBox::title {
             return
         backup_root = self.manage_backup_root_edit.text().strip() or "~/klippconfig_backups"
 
-        QApplication.setOverrideCursor(Qt.WaitCursor)
-        try:
-            backup_path = service.create_backup(
+        def _on_backup_created(backup_path: Any, error: Exception | None) -> None:
+            if error is not None:
+                self._set_device_connection_health(False, str(error))
+                self._show_error("Manage Printer", str(error))
+                self._append_manage_log(f"Backup failed: {error}")
+                return
+            self._manage_invalidate_dir_cache(params)
+            self._append_manage_log(f"Backup created: {backup_path}")
+            self._set_device_connection_health(True, f"Backup created: {backup_path}.")
+            self._show_status(f"Backup created: {backup_path}", 3000)
+            self._manage_refresh_backups()
+
+        self._submit_remote_op(
+            lambda: service.create_backup(
                 remote_dir=remote_dir,
                 backup_root=backup_root,
                 **params,
-            )
-        except SSHDeployError as exc:
-            self._set_device_connection_health(False, str(exc))
-            self._show_error("Manage Printer", str(exc))
-            self._append_manage_log(f"Backup failed: {exc}")
-            return
-        finally:
-            QApplication.restoreOverrideCursor()
-
-        self._append_manage_log(f"Backup created: {backup_path}")
-        self._set_device_connection_health(True, f"Backup created: {backup_path}.")
-        self.statusBar().showMessage(f"Backup created: {backup_path}", 3000)
-        self._manage_refresh_backups()
+            ),
+            _on_backup_created,
+            busy_widgets=(self.manage_create_backup_btn,),
+            name="klippconfig-manage-backup",
+        )
 
     def _manage_refresh_backups(self) -> None:
         service = self._get_ssh_service()
@@ -8968,22 +9578,25 @@ QGroupBox::title {
             return
 
         backup_root = self.manage_backup_root_edit.text().strip() or "~/klippconfig_backups"
-        QApplication.setOverrideCursor(Qt.WaitCursor)
-        try:
-            backups = service.list_backups(backup_root=backup_root, **params)
-        except SSHDeployError as exc:
-            self._set_device_connection_health(False, str(exc))
-            self._show_error("Manage Printer", str(exc))
-            self._append_manage_log(f"Backup list failed: {exc}")
-            return
-        finally:
-            QApplication.restoreOverrideCursor()
 
-        self.manage_backup_combo.clear()
-        self.manage_backup_combo.addItems(backups)
-        self._append_manage_log(f"Loaded {len(backups)} backup(s).")
-        self._set_device_connection_health(True, f"Backups listed from {backup_root}.")
-        self.statusBar().showMessage(f"{len(backups)} backup(s) found", 2500)
+        def _on_backups_listed(backups: Any, error: Exception | None) -> None:
+            if error is not None:
+                self._set_device_connection_health(False, str(error))
+                self._show_error("Manage Printer", str(error))
+                self._append_manage_log(f"Backup list failed: {error}")
+                return
+            self.manage_backup_combo.clear()
+            self.manage_backup_combo.addItems(backups)
+            self._append_manage_log(f"Loaded {len(backups)} backup(s).")
+            self._set_device_connection_health(True, f"Backups listed from {backup_root}.")
+            self._show_status(f"{len(backups)} backup(s) found", 2500)
+
+        self._submit_remote_op(
+            lambda: service.list_backups(backup_root=backup_root, **params),
+            _on_backups_listed,
+            busy_widgets=(self.manage_refresh_backups_btn,),
+            name="klippconfig-manage-backups",
+        )
 
     def _manage_restore_selected_backup(self) -> None:
         service = self._get_ssh_service()
@@ -9014,26 +9627,31 @@ QGroupBox::title {
         if answer != QMessageBox.StandardButton.Yes:
             return
 
-        QApplication.setOverrideCursor(Qt.WaitCursor)
-        try:
-            service.restore_backup(
+        clear_before_restore = self.manage_clear_before_restore_checkbox.isChecked()
+
+        def _on_restored(_result: Any, error: Exception | None) -> None:
+            if error is not None:
+                self._set_device_connection_health(False, str(error))
+                self._show_error("Manage Printer", str(error))
+                self._append_manage_log(f"Restore failed: {error}")
+                return
+            self._manage_invalidate_dir_cache(params)
+            self._append_manage_log(f"Restored backup: {backup_path}")
+            self._set_device_connection_health(True, f"Restored backup: {backup_path}.")
+            self._show_status("Backup restore complete", 3000)
+            self._manage_refresh_files()
+
+        self._submit_remote_op(
+            lambda: service.restore_backup(
                 remote_dir=remote_dir,
                 backup_path=backup_path,
-                clear_before_restore=self.manage_clear_before_restore_checkbox.isChecked(),
+                clear_before_restore=clear_before_restore,
                 **params,
-            )
-        except SSHDeployError as exc:
-            self._set_device_connection_health(False, str(exc))
-            self._show_error("Manage Printer", str(exc))
-            self._append_manage_log(f"Restore failed: {exc}")
-            return
-        finally:
-            QApplication.restoreOverrideCursor()
-
-        self._append_manage_log(f"Restored backup: {backup_path}")
-        self._set_device_connection_health(True, f"Restored backup: {backup_path}.")
-        self.statusBar().showMessage("Backup restore complete", 3000)
-        self._manage_refresh_files()
+            ),
+            _on_restored,
+            busy_widgets=(self.manage_restore_backup_btn,),
+            name="klippconfig-manage-restore",
+        )
 
     def _desktop_backup_download_root(self) -> Path:
         return Path.home() / "Desktop" / "KlippConfig Backups"
@@ -9063,24 +9681,29 @@ QGroupBox::title {
             return
 
         local_target = self._build_backup_download_target(backup_path)
-        QApplication.setOverrideCursor(Qt.WaitCursor)
-        try:
-            downloaded_path = service.download_backup(
+        concurrency = int(self.manage_download_concurrency_spin.value())
+
+        def _on_downloaded(downloaded_path: Any, error: Exception | None) -> None:
+            if error is not None:
+                self._set_device_connection_health(False, str(error))
+                self._show_error("Manage Printer", str(error))
+                self._append_manage_log(f"Backup download failed: {error}")
+                return
+            self._append_manage_log(f"Backup downloaded to {downloaded_path}.")
+            self._set_device_connection_health(True, f"Downloaded backup to {downloaded_path}.")
+            self._show_status(f"Backup downloaded to {downloaded_path}", 4000)
+
+        self._submit_remote_op(
+            lambda: service.download_backup(
                 backup_path=backup_path,
                 local_destination=str(local_target),
+                concurrency=concurrency,
                 **params,
-            )
-        except SSHDeployError as exc:
-            self._set_device_connection_health(False, str(exc))
-            self._show_error("Manage Printer", str(exc))
-            self._append_manage_log(f"Backup download failed: {exc}")
-            return
-        finally:
-            QApplication.restoreOverrideCursor()
-
-        self._append_manage_log(f"Backup downloaded to {downloaded_path}.")
-        self._set_device_connection_health(True, f"Downloaded backup to {downloaded_path}.")
-        self.statusBar().showMessage(f"Backup downloaded to {downloaded_path}", 4000)
+            ),
+            _on_downloaded,
+            busy_widgets=(self.manage_download_backup_btn,),
+            name="klippconfig-manage-download",
+        )
 
     def _browse_ssh_key(self) -> None:
         file_path, _ = QFileDialog.getOpenFileName(
@@ -9104,6 +9727,9 @@ QGroupBox::title {
             else:
                 self._append_ssh_log(f"SSH unavailable: {exc}")
             return None
+        self.ssh_service.set_compression(
+            self._settings_bool(self.SSH_COMPRESSION_SETTING_KEY, True)
+        )
         return self.ssh_service
 
     def _collect_ssh_params(
@@ -9134,9 +9760,35 @@ QGroupBox::title {
             "key_path": key_path,
         }
 
+    def _bump_ssh_form_rev(self, *_args: Any) -> None:
+        self.ssh_form_rev += 1
+
+    def _ssh_form(self) -> SshFormSnapshot:
+        cached = self.ssh_form_cache
+        if cached is not None and cached[0] == self.ssh_form_rev:
+            return cached[1]
+        modify_remote_path = self.modify_remote_cfg_path_edit.text().strip()
+        snapshot = SshFormSnapshot(
+            remote_dir=self.ssh_remote_dir_edit.text().strip(),
+            remote_file=self.ssh_remote_fetch_path_edit.text().strip(),
+            modify_remote_path=modify_remote_path,
+            modify_remote_dir=posixpath.dirname(modify_remote_path.rstrip("/")) or ".",
+            backup_root=self.modify_backup_root_edit.text().strip() or "~/klippconfig_backups",
+            restart_command=self.ssh_restart_cmd_edit.text().strip()
+            or "sudo systemctl restart klipper",
+        )
+        self.ssh_form_cache = (self.ssh_form_rev, snapshot)
+        return snapshot
+
+    def _list_saved_connection_names(self) -> list[str]:
+        """Return saved profile names, reading the store only after a save or delete."""
+        if self.saved_connection_names_cache is None:
+            self.saved_connection_names_cache = self.saved_connection_service.list_names()
+        return list(self.saved_connection_names_cache)
+
     def _refresh_saved_connection_profiles(self, select_name: str | None = None) -> None:
         try:
-            names = self.saved_connection_service.list_names()
+            names = self._list_saved_connection_names()
         except OSError as exc:
             self._append_ssh_log(f"Failed to load saved connections: {exc}")
             self._update_default_connection_ui([])
@@ -9179,7 +9831,7 @@ QGroupBox::title {
         self.tools_connect_menu.addSeparator()
 
         try:
-            saved_profiles = self.saved_connection_service.list_names()
+            saved_profiles = self._list_saved_connection_names()
         except OSError as exc:
             error_action = QAction(
                 f"(Failed to load saved connections: {exc})",
@@ -9200,9 +9852,7 @@ QGroupBox::title {
             if default_name and profile_name == default_name:
                 label = f"{profile_name} (default)"
             profile_action = QAction(label, self.tools_connect_menu)
-            profile_action.triggered.connect(
-                lambda checked=False, name=profile_name: self._connect_saved_connection(name)
-            )
+            profile_action.triggered.connect(partial(self._connect_saved_connection, profile_name))
             self.tools_connect_menu.addAction(profile_action)
 
     def _build_connection_profile_payload(self) -> dict[str, Any] | None:
@@ -9235,10 +9885,11 @@ QGroupBox::title {
         except (OSError, ValueError) as exc:
             self._show_error("Saved Connections", str(exc))
             return False
+        self.saved_connection_names_cache = None
 
         if not self.default_ssh_connection_name:
             try:
-                saved_names = self.saved_connection_service.list_names()
+                saved_names = self._list_saved_connection_names()
             except OSError:
                 saved_names = []
             if len(saved_names) == 1 and saved_names[0] == profile_name:
@@ -9248,7 +9899,7 @@ QGroupBox::title {
         self.ssh_connection_name_edit.setText(profile_name)
         if announce:
             self._append_ssh_log(f"Saved connection profile '{profile_name}'.")
-            self.statusBar().showMessage(f"Saved connection '{profile_name}'", 2500)
+            self._show_status(f"Saved connection '{profile_name}'", 2500)
         return True
 
     def _save_current_connection_profile(self) -> None:
@@ -9284,32 +9935,48 @@ QGroupBox::title {
             index = self.ssh_saved_connection_combo.findText(profile_name)
             if index >= 0:
                 self.ssh_saved_connection_combo.setCurrentIndex(index)
-        self.ssh_host_edit.setText(str(profile.get("host") or ""))
+        host = str(profile.get("host") or "")
+        remote_dir = str(profile.get("remote_dir") or "~/printer_data/config")
+        remote_file = str(profile.get("remote_file") or "~/printer_data/config/printer.cfg")
         try:
             port_value = int(profile.get("port") or 22)
         except (TypeError, ValueError):
             port_value = 22
-        self.ssh_port_spin.setValue(port_value)
-        self.ssh_username_edit.setText(str(profile.get("username") or ""))
-        self.ssh_password_edit.setText(str(profile.get("password") or ""))
-        self.ssh_key_path_edit.setText(str(profile.get("key_path") or ""))
-        self.ssh_remote_dir_edit.setText(
-            str(profile.get("remote_dir") or "~/printer_data/config")
-        )
-        self.ssh_remote_fetch_path_edit.setText(
-            str(profile.get("remote_file") or "~/printer_data/config/printer.cfg")
-        )
-        self.manage_host_edit.setText(self.ssh_host_edit.text().strip())
-        self.manage_remote_dir_edit.setText(self.ssh_remote_dir_edit.text().strip())
-        self.modify_remote_cfg_path_edit.setText(self.ssh_remote_fetch_path_edit.text().strip())
+        # Every field below has change handlers; fill them silently and run
+        # the dependent refreshes once afterwards.
+        with self._batch_edits(
+            self.ssh_host_edit,
+            self.ssh_port_spin,
+            self.ssh_username_edit,
+            self.ssh_password_edit,
+            self.ssh_key_path_edit,
+            self.ssh_remote_dir_edit,
+            self.ssh_remote_fetch_path_edit,
+            self.manage_host_edit,
+            self.manage_remote_dir_edit,
+            self.modify_remote_cfg_path_edit,
+        ):
+            self.ssh_host_edit.setText(host)
+            self.ssh_port_spin.setValue(port_value)
+            self.ssh_username_edit.setText(str(profile.get("username") or ""))
+            self.ssh_password_edit.setText(str(profile.get("password") or ""))
+            self.ssh_key_path_edit.setText(str(profile.get("key_path") or ""))
+            self.ssh_remote_dir_edit.setText(remote_dir)
+            self.ssh_remote_fetch_path_edit.setText(remote_file)
+            self.manage_host_edit.setText(host.strip())
+            self.manage_remote_dir_edit.setText(remote_dir.strip())
+            self.modify_remote_cfg_path_edit.setText(remote_file.strip())
+        self._bump_manage_params_rev()
+        self._bump_ssh_form_rev()
         self.modify_current_remote_file = None
+        self._update_action_enablement()
         self._refresh_modify_connection_summary()
         self._append_ssh_log(f"Loaded connection profile '{profile_name}'.")
         self._append_modify_log(f"Loaded connection profile '{profile_name}'.")
-        self.statusBar().showMessage(f"Loaded connection '{profile_name}'", 2500)
+        self._show_status(f"Loaded connection '{profile_name}'", 2500)
         return True
 
-    def _connect_saved_connection(self, profile_name: str) -> None:
+    def _connect_saved_connection(self, profile_name: str, _checked: bool = False) -> None:
         if not self._load_saved_connection_profile(profile_name):
             return
         self._connect_ssh_to_host()
@@ -9327,11 +9994,12 @@ QGroupBox::title {
         if answer != QMessageBox.StandardButton.Yes:
             return
         deleted = self.saved_connection_service.delete(profile_name)
+        self.saved_connection_names_cache = None
         if deleted:
             if self.default_ssh_connection_name == profile_name:
                 self._persist_default_ssh_connection("")
             self._append_ssh_log(f"Deleted connection profile '{profile_name}'.")
-            self.statusBar().showMessage(f"Deleted connection '{profile_name}'", 2500)
+            self._show_status(f"Deleted connection '{profile_name}'", 2500)
             self._refresh_saved_connection_profiles()
             if self.ssh_connection_name_edit.text().strip() == profile_name:
                 self.ssh_connection_name_edit.clear()
@@ -9350,66 +10018,91 @@ QGroupBox::title {
         self._save_named_connection_profile(profile_name, announce=True)
 
     def _append_ssh_log(self, message: str) -> None:
-        stamp = datetime.now().strftime("%H:%M:%S")
+        stamp = _now_stamp()
         line = f"[{stamp}] {message}"
-        self.ssh_log.appendPlainText(line)
-        if hasattr(self, "console_activity_log"):
-            self.console_activity_log.appendPlainText(f"[SSH] {line}")
+        self._queue_log_line("ssh", line)
+        self._queue_log_line("console", f"[SSH] {line}")
 
     def _append_modify_log(self, message: str) -> None:
-        stamp = datetime.now().strftime("%H:%M:%S")
+        stamp = _now_stamp()
         line = f"[{stamp}] {message}"
-        self.modify_log.appendPlainText(line)
-        if hasattr(self, "console_activity_log"):
-            self.console_activity_log.appendPlainText(f"[MODIFY] {line}")
+        self._queue_log_line("modify", line)
+        self._queue_log_line("console", f"[MODIFY] {line}")
+
+    def _queue_log_line(self, log_key: str, line: str) -> None:
+        self.log_buffers[log_key].append(line)
+        if not self.log_flush_timer.isActive():
+            self.log_flush_timer.start()
+
+    def _flush_logs(self) -> None:
+        # Bursts (deploys, connect retries) land as one append per log instead
+        # of a relayout per line.
+        self.log_flush_timer.stop()
+        for log_key, buffer in self.log_buffers.items():
+            if not buffer:
+                continue
+            lines = list(buffer)
+            buffer.clear()
+            widget = self.log_widgets.get(log_key)
+            if widget is not None:
+                widget.appendPlainText("\n".join(lines))
+
+    @staticmethod
+    def _tail_log_lines(widget: QPlainTextEdit, count: int) -> list[str]:
+        # Walk back from the last block instead of copying the whole log.
+        document = widget.document()
+        if document.isEmpty():
+            return []
+        lines: list[str] = []
+        block = document.lastBlock()
+        while block.isValid() and len(lines) < count:
+            lines.append(block.text())
+            block = block.previous()
+        lines.reverse()
+        return lines
+
+    def _show_status(self, message: str, timeout: int = 0) -> None:
+        # Chained flows (refactor -> validate -> upload) post several messages
+        # in a row; only the latest one within the throttle window is painted.
+        if self.status_elapsed.elapsed() >= self.STATUS_THROTTLE_MS:
+            self.status_pending = None
+            self.status_flush_timer.stop()
+            self.statusBar().showMessage(message, timeout)
+            self.status_elapsed.restart()
+            return
+        self.status_pending = (message, timeout)
+        if not self.status_flush_timer.isActive():
+            self.status_flush_timer.start(
+                max(self.STATUS_THROTTLE_MS - self.status_elapsed.elapsed(), 0)
+            )
+
+    def _flush_status(self) -> None:
+        pending = self.status_pending
+        self.status_pending = None
+        if pending is None:
+            return
+        self.statusBar().showMessage(*pending)
+        self.status_elapsed.restart()
+
+    def _clear_status(self) -> None:
+        self.status_pending = None
+        self.status_flush_timer.stop()
+        self.statusBar().clearMessage()
 
     def _set_modify_status(self, message: str, severity: str = "info") -> None:
-        style_by_severity = {
-            "ok": (
-                "QLabel {"
-                " background-color: #14532d;"
-                " color: #ffffff;"
-                " border: 1px solid #16a34a;"
-                " border-radius: 4px;"
-                " padding: 6px 8px;"
-                " font-weight: 600;"
-                "}"
-            ),
-            "warning": (
-                "QLabel {"
-                " background-color: #78350f;"
-                " color: #ffffff;"
-                " border: 1px solid #f59e0b;"
-                " border-radius: 4px;"
-                " padding: 6px 8px;"
-                " font-weight: 600;"
-                "}"
-            ),
-            "error": (
-                "QLabel {"
-                " background-color: #7f1d1d;"
-                " color: #ffffff;"
-                " border: 1px solid #ef4444;"
-                " border-radius: 4px;"
-                " padding: 6px 8px;"
-                " font-weight: 600;"
-                "}"
-            ),
-            "info": (
-                "QLabel {"
-                " background-color: #111827;"
-                " color: #e5e7eb;"
-                " border: 1px solid #374151;"
-                " border-radius: 4px;"
-                " padding: 6px 8px;"
-                "}"
-            ),
-        }
+        if severity not in self.MODIFY_STATUS_STYLES:
+            severity = "info"
         self.modify_status_label.setText(message)
-        self.modify_status_label.setStyleSheet(style_by_severity.get(severity, style_by_severity["info"]))
+        # setStyleSheet re-polishes the label even for an identical sheet.
+        if severity == self.modify_status_severity:
+            return
+        self.modify_status_severity = severity
+        self.modify_status_label.setStyleSheet(self.MODIFY_STATUS_STYLES[severity])
 
     def _modify_connect(self) -> None:
-        self._connect_ssh_to_host()
+        self._connect_ssh_to_host(on_finished=self._on_modify_connect_finished)
+
+    def _on_modify_connect_finished(self) -> None:
         if self.device_connected:
             self._set_modify_status("SSH connection ready for modify workflow.", severity="ok")
             self._append_modify_log("SSH connection verified for modify workflow.")
@@ -9423,23 +10116,35 @@ QGroupBox::title {
         if params is None:
             return
 
-        remote_path = self.modify_remote_cfg_path_edit.text().strip()
+        remote_path = self._ssh_form().modify_remote_path
         if not remote_path:
             self._show_error("Modify Existing", "Remote .cfg path is required.")
             return
 
+        if not self._begin_remote_flow("modify_open", "Remote file is already opening..."):
+            return
         self._append_modify_log(f"Opening remote file: {remote_path}")
-        QApplication.setOverrideCursor(Qt.WaitCursor)
-        try:
-            contents = service.fetch_file(remote_path=remote_path, **params)
-        except SSHDeployError as exc:
-            self._set_device_connection_health(False, str(exc))
-            self._set_modify_status(str(exc), severity="error")
-            self._append_modify_log(f"Open failed: {exc}")
-            self._show_error("Modify Existing", str(exc))
+        self._submit_remote_op(
+            lambda: service.fetch_file(remote_path=remote_path, **params),
+            lambda contents, error: self._on_modify_remote_cfg_opened(remote_path, contents, error),
+            busy_widgets=(self.modify_open_remote_btn,),
+            name="klippconfig-modify-open",
+        )
+
+    def _on_modify_remote_cfg_opened(
+        self,
+        remote_path: str,
+        contents: str | None,
+        error: Exception | None,
+    ) -> None:
+        self._end_remote_flow("modify_open")
+        if error is not None:
+            self._set_device_connection_health(False, str(error))
+            self._set_modify_status(str(error), severity="error")
+            self._append_modify_log(f"Open failed: {error}")
+            self._show_error("Modify Existing", str(error))
             return
-        finally:
-            QApplication.restoreOverrideCursor()
+        contents = contents or ""
 
         self.modify_editor.setPlainText(contents)
         self.modify_current_remote_file = remote_path
@@ -9453,10 +10158,29 @@ QGroupBox::title {
         self._set_device_connection_health(True, f"Opened {remote_path}.")
         self._set_modify_status(f"Loaded {remote_path}", severity="ok")
         self._append_modify_log(f"Loaded {remote_path}.")
-        self.statusBar().showMessage(f"Loaded {remote_path}", 2500)
+        self._show_status(f"Loaded {remote_path}", 2500)
+        self._prime_modify_validation(remote_path, contents)
+
+    def _prime_modify_validation(self, remote_path: str, content: str) -> None:
+        # Parse the freshly opened file in the background while the operator
+        # reads it, so Validate usually lands on a cached report.
+        digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+        cached = self.modify_validation_cache.get(remote_path)
+        if cached is not None and cached[0] == digest:
+            return
+
+        def _on_done(report: ValidationReport | None, error: Exception | None) -> None:
+            if error is None and report is not None:
+                self.modify_validation_cache[remote_path] = (digest, report)
+
+        self._submit_remote_op(
+            partial(self.firmware_tools_service.validate_cfg, content, source_label=remote_path),
+            _on_done,
+            name="klippconfig-modify-prevalidate",
+        )
 
     def _modify_current_cfg_context(self) -> tuple[str, str] | None:
-        remote_path = self.modify_remote_cfg_path_edit.text().strip()
+        remote_path = self._ssh_form().modify_remote_path
         if not remote_path:
             remote_path = (self.modify_current_remote_file or "").strip()
         if not remote_path:
@@ -9474,7 +10198,32 @@ QGroupBox::title {
             return
 
         content, remote_path = context
-        report = self.firmware_tools_service.validate_cfg(content, source_label=remote_path)
+        # A refactor with no changes re-validates identical text; reuse that report.
+        digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+        cached = self.modify_validation_cache.get(remote_path)
+        if cached is not None and cached[0] == digest:
+            self._on_modify_validation_finished(remote_path, digest, cached[1], None)
+            return
+        self._submit_remote_op(
+            partial(self.firmware_tools_service.validate_cfg, content, source_label=remote_path),
+            lambda report, error: self._on_modify_validation_finished(
+                remote_path, digest, report, error
+            ),
+            name="klippconfig-modify-validate",
+        )
+
+    def _on_modify_validation_finished(
+        self,
+        remote_path: str,
+        digest: bytes,
+        report: ValidationReport | None,
+        error: Exception | None,
+    ) -> None:
+        if error is not None:
+            self._set_modify_status(f"{remote_path}: validation failed: {error}", severity="error")
+            self._append_modify_log(f"Validation failed for {remote_path}: {error}")
+            return
+        self.modify_validation_cache[remote_path] = (digest, report)
         blocking = sum(1 for finding in report.findings if finding.severity == "blocking")
         warnings = sum(1 for finding in report.findings if finding.severity == "warning")
         self._set_preview_validation_state(
@@ -9520,14 +10269,40 @@ QGroupBox::title {
 
         self._set_modify_status(f"{remote_path}: validation passed.", severity="ok")
         self._set_device_connection_health(True, f"{remote_path}: validation passed.")
-        self.statusBar().showMessage("Modify workflow validation passed", 2500)
+        self._show_status("Modify workflow validation passed", 2500)
 
     def _modify_refactor_current_file(self) -> None:
         context = self._modify_current_cfg_context()
         if context is None:
             return
         content, remote_path = context
-        updated, changes = self.firmware_tools_service.refactor_cfg(content)
+        self._submit_remote_op(
+            partial(self.firmware_tools_service.refactor_cfg, content),
+            lambda result, error: self._on_modify_refactor_finished(
+                content, remote_path, result, error
+            ),
+            busy_widgets=(self.modify_refactor_btn,),
+            name="klippconfig-modify-refactor",
+        )
+
+    def _on_modify_refactor_finished(
+        self,
+        content: str,
+        remote_path: str,
+        result: tuple[str, int] | None,
+        error: Exception | None,
+    ) -> None:
+        if error is not None:
+            self._set_modify_status(f"Refactor failed for {remote_path}: {error}", severity="error")
+            self._append_modify_log(f"Refactor failed for {remote_path}: {error}")
+            return
+        if self.modify_editor.toPlainText() != content:
+            # The user kept editing while the refactor ran; don't clobber that.
+            self._append_modify_log(
+                f"Editor changed during refactor of {remote_path}; result discarded."
+            )
+            return
+        updated, changes = result
         if updated != content:
             self.modify_editor.setPlainText(updated)
             self._set_persistent_preview_source(
@@ -9542,7 +10317,7 @@ QGroupBox::title {
                 f"Refactored {remote_path}: {changes} change(s).",
                 severity="info",
             )
-            self.statusBar().showMessage(f"Refactored {remote_path}", 2500)
+            self._show_status(f"Refactored {remote_path}", 2500)
         else:
             self._append_modify_log(f"No refactor changes for {remote_path}.")
             self._set_modify_status(f"No refactor changes for {remote_path}.", severity="info")
@@ -9564,9 +10339,15 @@ QGroupBox::title {
             self._show_error("Modify Existing", "Current editor content is empty.")
             return
 
-        backup_root = self.modify_backup_root_edit.text().strip() or "~/klippconfig_backups"
-        remote_dir = posixpath.dirname(remote_path.rstrip("/")) or "."
+        form = self._ssh_form()
+        backup_root = form.backup_root
+        if remote_path == form.modify_remote_path:
+            remote_dir = form.modify_remote_dir
+        else:
+            remote_dir = posixpath.dirname(remote_path.rstrip("/")) or "."
 
+        if not self._begin_remote_flow("modify_upload", "Upload already in progress..."):
+            return
         self.app_state_store.update_deploy(upload_in_progress=True)
         self.action_log_service.log_event(
             "upload",
@@ -9577,39 +10358,50 @@ QGroupBox::title {
             remote_path=remote_path,
         )
         self._append_modify_log(f"Creating backup from {remote_dir} into {backup_root}.")
-        QApplication.setOverrideCursor(Qt.WaitCursor)
-        try:
-            backup_path = service.create_backup(
+        self._submit_remote_op(
+            lambda: service.backup_and_write(
                 remote_dir=remote_dir,
-                backup_root=backup_root,
-                **params,
-            )
-            saved_path = service.write_file(
                 remote_path=remote_path,
                 content=content,
+                backup_root=backup_root,
                 **params,
-            )
-        except SSHDeployError as exc:
+            ),
+            lambda result, error: self._on_modify_upload_finished(
+                params, content, remote_path, result, error
+            ),
+            name="klippconfig-modify-upload",
+        )
+
+    def _on_modify_upload_finished(
+        self,
+        params: dict[str, Any],
+        content: str,
+        remote_path: str,
+        result: tuple[str, str] | None,
+        error: Exception | None,
+    ) -> None:
+        self._end_remote_flow("modify_upload")
+        if error is not None:
             self.app_state_store.update_deploy(
                 upload_in_progress=False,
-                last_upload_status=f"failed: {exc}",
+                last_upload_status=f"failed: {error}",
             )
-            self._set_device_connection_health(False, str(exc))
-            self._set_modify_status(str(exc), severity="error")
-            self._append_modify_log(f"Upload failed: {exc}")
-            self._show_error("Modify Existing", str(exc))
+            self._set_device_connection_health(False, str(error))
+            self._set_modify_status(str(error), severity="error")
+            self._append_modify_log(f"Upload failed: {error}")
+            self._show_error("Modify Existing", str(error))
             self.action_log_service.log_event(
                 "upload",
                 phase="failed",
                 mode="modify_existing",
                 host=str(params["host"]),
                 remote_path=remote_path,
-                error=str(exc),
+                error=str(error),
             )
             return
-        finally:
-            QApplication.restoreOverrideCursor()
 
+        assert result is not None
+        backup_path, saved_path = result
         self.modify_current_remote_file = saved_path
         self.modify_remote_cfg_path_edit.setText(saved_path)
         self._set_persistent_preview_source(
@@ -9638,7 +10430,7 @@ QGroupBox::title {
             backup_path=str(backup_path),
         )
         self._set_device_connection_health(True, f"Uploaded {saved_path}.")
-        self.statusBar().showMessage("Modify workflow upload complete", 3000)
+        self._show_status("Modify workflow upload complete", 3000)
 
     def _modify_test_restart(self) -> None:
         service = self._get_ssh_service()
@@ -9648,7 +10440,9 @@ QGroupBox::title {
         if params is None:
             return
 
-        restart_command = self.ssh_restart_cmd_edit.text().strip() or "sudo systemctl restart klipper"
+        restart_command = self._ssh_form().restart_command
+        if not self._begin_remote_flow("modify_restart", "Restart command already running..."):
+            return
         self.action_log_service.log_event(
             "restart",
             phase="start",
@@ -9657,31 +10451,52 @@ QGroupBox::title {
             host=str(params["host"]),
         )
         self._append_modify_log(f"Running restart/status command: {restart_command}")
-        QApplication.setOverrideCursor(Qt.WaitCursor)
-        try:
-            output = service.run_remote_command(
+        streamed: list[str] = []
+
+        def _on_output(line: str) -> None:
+            # Called on the worker thread; the log itself is touched on the UI thread.
+            streamed.append(line)
+            self._post_remote_progress(partial(self._append_modify_log, f"| {line}"))
+
+        self._submit_remote_op(
+            lambda: service.run_remote_command(
                 command=restart_command,
+                on_output=_on_output,
                 **params,
-            ).strip()
-        except SSHDeployError as exc:
-            self.app_state_store.update_deploy(last_restart_status=f"failed: {exc}")
-            self._set_device_connection_health(False, str(exc))
-            self._set_modify_status(str(exc), severity="error")
-            self._append_modify_log(f"Restart test failed: {exc}")
-            self._show_error("Modify Existing", str(exc))
+            ),
+            lambda output, error: self._on_modify_restart_finished(
+                params, restart_command, output, error, streamed=bool(streamed)
+            ),
+            name="klippconfig-modify-restart",
+        )
+
+    def _on_modify_restart_finished(
+        self,
+        params: dict[str, Any],
+        restart_command: str,
+        output: str | None,
+        error: Exception | None,
+        *,
+        streamed: bool = False,
+    ) -> None:
+        self._end_remote_flow("modify_restart")
+        if error is not None:
+            self.app_state_store.update_deploy(last_restart_status=f"failed: {error}")
+            self._set_device_connection_health(False, str(error))
+            self._set_modify_status(str(error), severity="error")
+            self._append_modify_log(f"Restart test failed: {error}")
+            self._show_error("Modify Existing", str(error))
             self.action_log_service.log_event(
                 "restart",
                 phase="failed",
                 action_name="Modify Existing Restart",
                 command=restart_command,
                 host=str(params["host"]),
-                error=str(exc),
+                error=str(error),
             )
             return
-        finally:
-            QApplication.restoreOverrideCursor()
 
-        summary = output or "(no output)"
+        summary = (output or "").strip() or "(no output)"
         self.app_state_store.update_deploy(last_restart_status=summary)
         self.action_log_service.log_event(
             "restart",
@@ -9692,9 +10507,12 @@ QGroupBox::title {
             output=summary,
         )
         self._set_modify_status(f"Restart command succeeded: {summary}", severity="ok")
-        self._append_modify_log(f"Restart output: {summary}")
+        if streamed:
+            self._append_modify_log("Restart command finished.")
+        else:
+            self._append_modify_log(f"Restart output: {summary}")
         self._set_device_connection_health(True, f"Restart command succeeded on {params['host']}.")
-        self.statusBar().showMessage("Restart test succeeded", 3000)
+        self._show_status("Restart test succeeded", 3000)
 
     def _resolve_connected_printer_name(self, host: str) -> str:
         name = self.ssh_connection_name_edit.text().strip()
@@ -9712,6 +10530,9 @@ QGroupBox::title {
         *,
         source: str = "manual",
     ) -> None:
+        tree_params = self.manage_tree_params
+        if tree_params is not None and tree_params.get("host") != params.get("host"):
+            self._stop_manage_tree_poll()
         self._set_device_connection_health(True, str(output))
         printer_name = self._resolve_connected_printer_name(str(params["host"]))
         self.preview_connected_printer_name = printer_name
@@ -9733,9 +10554,9 @@ QGroupBox::title {
         self._set_modify_status(f"Connected to {printer_name}", severity="ok")
         self._save_successful_connection_profile()
         if source == "startup":
-            self.statusBar().showMessage(f"Auto-connected to {printer_name}", 3000)
+            self._show_status(f"Auto-connected to {printer_name}", 3000)
         else:
-            self.statusBar().showMessage(f"Connected to {printer_name}", 2500)
+            self._show_status(f"Connected to {printer_name}", 2500)
         self.action_log_service.log_event(
             "connect",
             phase="complete",
@@ -9776,9 +10597,14 @@ QGroupBox::title {
             source=source,
         )
 
-    def _connect_ssh_to_host(self) -> None:
-        if self.auto_connect_in_progress:
-            self.statusBar().showMessage("Connect already in progress...", 2500)
+    def _connect_ssh_to_host(
+        self,
+        _checked: bool = False,
+        *,
+        on_finished: Callable[[], None] | None = None,
+    ) -> None:
+        if self.auto_connect_in_progress or "connect" in self.remote_ops_in_flight:
+            self._show_status("Connect already in progress...", 2500)
             return
 
         service = self._get_ssh_service()
@@ -9789,6 +10615,8 @@ QGroupBox::title {
         if params is None:
             return
 
+        self.remote_ops_in_flight.add("connect")
+        self._update_action_enablement()
         self.action_log_service.log_event(
             "connect",
             phase="start",
@@ -9799,22 +10627,39 @@ QGroupBox::title {
         self._append_ssh_log(
             f"Connecting to {params['username']}@{params['host']}:{params['port']}"
         )
-        try:
-            ok, output = service.test_connection(**params)
-        except SSHDeployError as exc:
-            self._apply_connect_failure(
-                params,
-                str(exc),
-                source="manual",
-                show_error_dialog=True,
-                use_failure_prefix=False,
-            )
-            return
+        self._show_status(f"Connecting to {params['host']}...", 0)
+
+        def _on_done(result: Any, error: Exception | None) -> None:
+            self._end_remote_flow("connect")
+            self._clear_status()
+            if error is not None:
+                self._apply_connect_failure(
+                    params,
+                    str(error),
+                    source="manual",
+                    show_error_dialog=True,
+                    use_failure_prefix=False,
+                )
+            else:
+                ok, output = result
+                if ok:
+                    self._apply_connect_success(params, str(output), source="manual")
+                else:
+                    self._apply_connect_failure(
+                        params,
+                        str(output),
+                        source="manual",
+                        show_error_dialog=False,
+                    )
+            self._update_action_enablement()
+            if on_finished is not None:
+                on_finished()
 
-        if ok:
-            self._apply_connect_success(params, str(output), source="manual")
-            return
-        self._apply_connect_failure(params, str(output), source="manual", show_error_dialog=False)
+        self._submit_remote_op(
+            lambda: service.test_connection(**params),
+            _on_done,
+            name="klippconfig-connect",
+        )
 
     def _test_ssh_connection(self) -> None:
         self._connect_ssh_to_host()
@@ -9828,23 +10673,36 @@ QGroupBox::title {
         if params is None:
             return
 
-        remote_path = self.ssh_remote_fetch_path_edit.text().strip()
+        remote_path = self._ssh_form().remote_file
         if not remote_path:
             self._show_error("SSH Input Error", "Remote file path is required.")
             return
 
+        if not self._begin_remote_flow("fetch_remote", "Remote file is already being fetched..."):
+            return
         self._append_ssh_log(f"Fetching remote file: {remote_path}")
-        try:
-            contents = service.fetch_file(remote_path=remote_path, **params)
-        except SSHDeployError as exc:
-            self._set_device_connection_health(False, str(exc))
-            self._append_ssh_log(str(exc))
-            self._show_error("Remote Fetch Failed", str(exc))
+        self._submit_remote_op(
+            lambda: service.fetch_file(remote_path=remote_path, **params),
+            lambda contents, error: self._on_remote_cfg_file_fetched(remote_path, contents, error),
+            name="klippconfig-fetch-remote",
+        )
+
+    def _on_remote_cfg_file_fetched(
+        self,
+        remote_path: str,
+        contents: str | None,
+        error: Exception | None,
+    ) -> None:
+        self._end_remote_flow("fetch_remote")
+        if error is not None:
+            self._set_device_connection_health(False, str(error))
+            self._append_ssh_log(str(error))
+            self._show_error("Remote Fetch Failed", str(error))
             return
 
         self._showing_external_file = True
         self._set_files_tab_content(
-            content=contents,
+            content=contents or "",
             label=f"Remote: {remote_path}",
             source="remote",
             generated_name=None,
@@ -9866,50 +10724,71 @@ QGroupBox::title {
         if params is None:
             return
 
-        remote_dir = self.ssh_remote_dir_edit.text().strip()
+        form = self._ssh_form()
+        remote_dir = form.remote_dir
         if not remote_dir:
             self._show_error("SSH Input Error", "Remote config directory is required.")
             return
 
         assert self.current_pack is not None
+        if not self._begin_remote_flow("deploy", "Deploy already in progress..."):
+            return
+        pack = self.current_pack
         self.app_state_store.update_deploy(upload_in_progress=True)
         self.action_log_service.log_event(
             "upload",
             phase="start",
             host=str(params["host"]),
             remote_dir=remote_dir,
-            file_count=len(self.current_pack.files),
+            file_count=len(pack.files),
         )
         self._append_ssh_log(
-            f"Deploying {len(self.current_pack.files)} files to {params['host']}:{remote_dir}"
-        )
-        try:
-            result = service.deploy_pack(
-                pack=self.current_pack,
+            f"Deploying {len(pack.files)} files to {params['host']}:{remote_dir}"
+        )
+        backup_before_upload = self.ssh_backup_checkbox.isChecked()
+        restart_klipper = self.ssh_restart_checkbox.isChecked()
+        restart_command = form.restart_command
+        self._submit_remote_op(
+            lambda: service.deploy_pack(
+                pack=pack,
                 remote_dir=remote_dir,
-                backup_before_upload=self.ssh_backup_checkbox.isChecked(),
-                restart_klipper=self.ssh_restart_checkbox.isChecked(),
-                klipper_restart_command=self.ssh_restart_cmd_edit.text().strip()
-                or "sudo systemctl restart klipper",
+                backup_before_upload=backup_before_upload,
+                restart_klipper=restart_klipper,
+                klipper_restart_command=restart_command,
                 **params,
-            )
-        except SSHDeployError as exc:
+            ),
+            lambda result, error: self._on_generated_pack_deployed(
+                params, remote_dir, result, error
+            ),
+            name="klippconfig-deploy",
+        )
+
+    def _on_generated_pack_deployed(
+        self,
+        params: dict[str, Any],
+        remote_dir: str,
+        result: dict[str, Any] | None,
+        error: Exception | None,
+    ) -> None:
+        self._end_remote_flow("deploy")
+        if error is not None:
             self.app_state_store.update_deploy(
                 upload_in_progress=False,
-                last_upload_status=f"failed: {exc}",
+                last_upload_status=f"failed: {error}",
             )
-            self._set_device_connection_health(False, str(exc))
-            self._append_ssh_log(str(exc))
-            self._show_error("Deploy Failed", str(exc))
+            self._set_device_connection_health(False, str(error))
+            self._append_ssh_log(str(error))
+            self._show_error("Deploy Failed", str(error))
             self.action_log_service.log_event(
                 "upload",
                 phase="failed",
                 host=str(params["host"]),
                 remote_dir=remote_dir,
-                error=str(exc),
+                error=str(error),
             )
             return
 
+        result = result or {}
         uploaded = result.get("uploaded", [])
         backup_path = result.get("backup_path")
         restart_output = result.get("restart_output")
@@ -9934,7 +10813,7 @@ QGroupBox::title {
             restart_output=str(restart_output or ""),
         )
         self._set_device_connection_health(True, f"Deployed to {params['host']}.")
-        self.statusBar().showMessage("Deploy complete", 2500)
+        self._show_status("Deploy complete", 2500)
 
     @staticmethod
     def _set_combo_to_value(combo: QComboBox, value: Any) -> bool:
@@ -9944,23 +10823,40 @@ QGroupBox::title {
                 return True
         return False
 
-    @staticmethod
-    def _format_board_label(board_id: str) -> str:
-        profile = get_board_profile(board_id)
+    def _cached_board_profile(self, board_id: str) -> BoardProfile | None:
+        if board_id not in self.board_profile_cache:
+            self.board_profile_cache[board_id] = get_board_profile(board_id)
+        return self.board_profile_cache[board_id]
+
+    def _cached_toolhead_board_profile(self, board_id: str) -> BoardProfile | None:
+        if board_id not in self.toolhead_board_profile_cache:
+            self.toolhead_board_profile_cache[board_id] = get_toolhead_board_profile(board_id)
+        return self.toolhead_board_profile_cache[board_id]
+
+    def _format_board_label(self, board_id: str) -> str:
+        profile = self._cached_board_profile(board_id)
         if profile is None:
             return board_id
         return f"{profile.label} ({board_id})"
 
-    @staticmethod
-    def _format_toolhead_board_label(board_id: str) -> str:
-        profile = get_toolhead_board_profile(board_id)
+    def _format_toolhead_board_label(self, board_id: str) -> str:
+        profile = self._cached_toolhead_board_profile(board_id)
         if profile is None:
             return board_id
         return f"{profile.label} ({board_id})"
 
+    def _close_ssh_cache(self) -> None:
+        if isinstance(self.ssh_service, SSHDeployService):
+            self.ssh_service.close_pooled_clients()
+
     def closeEvent(self, event) -> None:  # noqa: ANN001
         if hasattr(self, "auto_connect_poll_timer"):
             self.auto_connect_poll_timer.stop()
+        if hasattr(self, "manage_tree_poll_timer"):
+            self.manage_tree_poll_timer.stop()
+        self._persist_manage_dir_cache()
+        self._close_ssh_cache()
+        self.action_log_service.close()
         if hasattr(self, "update_check_poll_timer"):
             self.update_check_poll_timer.stop()
         if not bool(getattr(self, "build_ratios_locked", True)):
@@ -9982,6 +10878,28 @@ QGroupBox::title {
         self.app_state_store.unsubscribe(self._on_app_state_changed)
         super().closeEvent(event)
 
+    @contextmanager
+    def _busy_cursor(self) -> Iterator[None]:
+        """Show the wait cursor; nested uses share one override instead of stacking."""
+        if self.busy_cursor_depth == 0:
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+        self.busy_cursor_depth += 1
+        try:
+            yield
+        finally:
+            self.busy_cursor_depth -= 1
+            if self.busy_cursor_depth == 0:
+                QApplication.restoreOverrideCursor()
+
+    @staticmethod
+    @contextmanager
+    def _batch_edits(*widgets: QWidget) -> Iterator[None]:
+        """Block change signals on widgets while several are filled in together."""
+        with ExitStack() as stack:
+            for widget in widgets:
+                stack.enter_context(QSignalBlocker(widget))
+            yield
+
     def _show_error(self, title: str, message: str) -> None:
         QMessageBox.critical(self, title, message)
 
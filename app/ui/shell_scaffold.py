@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, QSignalBlocker, Qt, QTimer, Signal, Slot
+from PySide6.QtGui import QColor, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QHBoxLayout,
     QLabel,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QPlainTextEdit,
     QSizePolicy,
     QVBoxLayout,
@@ -22,7 +25,47 @@ class RouteDefinition:
     active: bool = True
 
 
-class LeftNav(QListWidget):
+class RouteListModel(QAbstractListModel):
+    """Flat list model over the active routes shown in the left navigation."""
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._routes: tuple[RouteDefinition, ...] = ()
+        self._key_to_row: dict[str, int] = {}
+
+    def set_routes(self, routes: list[RouteDefinition]) -> None:
+        self.beginResetModel()
+        self._routes = tuple(route for route in routes if route.active)
+        self._key_to_row = {}
+        for row, route in enumerate(self._routes):
+            self._key_to_row.setdefault(route.key, row)
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008, N802
+        if parent.isValid():
+            return 0
+        return len(self._routes)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or not 0 <= index.row() < len(self._routes):
+            return None
+        route = self._routes[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return route.label
+        if role == Qt.ItemDataRole.UserRole:
+            return route.key
+        return None
+
+    def route_key(self, row: int) -> str | None:
+        if 0 <= row < len(self._routes):
+            return self._routes[row].key
+        return None
+
+    def row_for_key(self, route_key: str) -> int | None:
+        return self._key_to_row.get(route_key)
+
+
+class LeftNav(QListView):
     route_selected = Signal(str)
 
     def __init__(self, parent: QWidget | None = None) -> None:
@@ -31,39 +74,45 @@ class LeftNav(QListWidget):
         self.setMinimumWidth(180)
         self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.currentItemChanged.connect(self._emit_route)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.route_model = RouteListModel(self)
+        self.setModel(self.route_model)
+        self.selectionModel().currentRowChanged.connect(self._emit_route)
 
     def set_routes(self, routes: list[RouteDefinition]) -> None:
-        self.clear()
-        for route in routes:
-            if not route.active:
-                continue
-            item = QListWidgetItem(route.label, self)
-            item.setData(Qt.ItemDataRole.UserRole, route.key)
-        if self.count() > 0:
-            self.setCurrentRow(0)
+        # Rebuild without intermediate repaints; the initial selection is
+        # announced once after the view is consistent again.
+        self.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self):
+                self.route_model.set_routes(routes)
+                if self.route_model.rowCount() > 0:
+                    self.setCurrentIndex(self.route_model.index(0))
+        finally:
+            self.setUpdatesEnabled(True)
+        route_key = self.route_model.route_key(0)
+        if route_key:
+            self.route_selected.emit(route_key)
 
+    @Slot(str)
     def select_route(self, route_key: str) -> None:
-        for index in range(self.count()):
-            item = self.item(index)
-            if item is None:
-                continue
-            key = item.data(Qt.ItemDataRole.UserRole)
-            if key == route_key:
-                self.blockSignals(True)
-                self.setCurrentRow(index)
-                self.blockSignals(False)
-                return
-
-    def _emit_route(self, current: QListWidgetItem | None, _previous: QListWidgetItem | None) -> None:
-        if current is None:
+        row = self.route_model.row_for_key(route_key)
+        if row is None:
             return
-        route_key = current.data(Qt.ItemDataRole.UserRole)
-        if isinstance(route_key, str) and route_key:
+        with QSignalBlocker(self):
+            self.setCurrentIndex(self.route_model.index(row))
+
+    @Slot(QModelIndex, QModelIndex)
+    def _emit_route(self, current: QModelIndex, _previous: QModelIndex) -> None:
+        route_key = self.route_model.route_key(current.row()) if current.isValid() else None
+        if route_key:
             self.route_selected.emit(route_key)
 
 
 class RightContextPanel(QWidget):
+    MAX_LINES = 200
+
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.setObjectName("right_context_panel")
@@ -75,48 +124,143 @@ class RightContextPanel(QWidget):
         self.content.setReadOnly(True)
         self.content.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.content.setPlaceholderText("Right context panel placeholder (Context | Validation | Logs).")
+        self.content.setMaximumBlockCount(self.MAX_LINES)
         layout.addWidget(self.content, 1)
+        self._text = ""
+
+    def set_lines(self, lines: list[str]) -> None:
+        # App state changes re-render the panel often; skip relayout when the
+        # rendered text is identical.
+        text = "\n".join(lines)
+        if text == self._text:
+            return
+        self._text = text
+        self.content.setPlainText(text)
+
+
+@lru_cache(maxsize=64)
+def _target_text(target: str) -> str:
+    return f"Target: {target or 'none'}"
+
+
+@lru_cache(maxsize=64)
+def _state_text(state: str) -> str:
+    return f"State: {state or 'idle'}"
 
 
 class BottomStatusBar(QWidget):
-    def __init__(self, parent: QWidget | None = None) -> None:
+    FLUSH_INTERVAL_MS = 50
+    DEVICE_DOT_SIZE = 10
+    DEVICE_CONNECTED_COLOR = "#16a34a"
+    DEVICE_DISCONNECTED_COLOR = "#dc2626"
+    DEVICE_BORDER_COLOR = "#111827"
+    # Painted on first use (a QGuiApplication must exist) and shared by every bar.
+    _DEVICE_DOT_CACHE: dict[tuple[str, float], QPixmap] = {}
+
+    def __init__(self, parent: QWidget | None = None, *, show_device_indicator: bool = True) -> None:
         super().__init__(parent)
         self.setObjectName("bottom_status_bar")
         self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
         self.setMinimumHeight(22)
         self.setMaximumHeight(22)
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(8, 1, 8, 1)
-        layout.setSpacing(6)
         self.connection_label = QLabel("Disconnected", self)
         self.target_label = QLabel("Target: none", self)
         self.state_label = QLabel("State: idle", self)
-        self.connection_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-        self.target_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-        self.state_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
+        for label in (self.connection_label, self.target_label, self.state_label):
+            label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
+        self.device_caption: QLabel | None = None
+        self.device_icon: QLabel | None = None
+        self._device_dots: dict[bool, QPixmap] = {}
+        self._device_connected: bool | None = None
+        if show_device_indicator:
+            self.device_caption = QLabel("Device", self)
+            self.device_caption.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
+            self.device_icon = QLabel(self)
+            self.device_icon.setFixedSize(self.DEVICE_DOT_SIZE, self.DEVICE_DOT_SIZE)
+            self._device_dots = {
+                True: self._device_dot(self.DEVICE_CONNECTED_COLOR),
+                False: self._device_dot(self.DEVICE_DISCONNECTED_COLOR),
+            }
+            self.set_device_connected(False)
+
+        # Populate a detached layout and install it once, so the bar is laid
+        # out a single time instead of after every insertion.
+        layout = QHBoxLayout()
+        layout.setContentsMargins(8, 1, 8, 1)
+        layout.setSpacing(6)
         layout.addWidget(self.connection_label)
         layout.addStretch(1)
         layout.addWidget(self.target_label)
         layout.addSpacing(6)
         layout.addWidget(self.state_label)
-        layout.addSpacing(8)
-        self.device_caption = QLabel("Device", self)
-        self.device_caption.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
-        layout.addWidget(self.device_caption)
-        self.device_icon = QLabel(self)
-        self.device_icon.setFixedSize(10, 10)
-        self.device_icon.setStyleSheet(
-            "QLabel {"
-            " background-color: #dc2626;"
-            " border: 1px solid #111827;"
-            " border-radius: 5px;"
-            "}"
-        )
-        layout.addWidget(self.device_icon)
+        if self.device_icon is not None:
+            layout.addSpacing(8)
+            layout.addWidget(self.device_caption)
+            layout.addWidget(self.device_icon)
+        self.setLayout(layout)
 
+        self._pending: dict[QLabel, str] = {}
+        self._last_connection: tuple[bool, str] = (False, "")
+        self._last_state = ""
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush)
+
+    @Slot(bool, str)
     def set_connection(self, connected: bool, target: str) -> None:
-        self.connection_label.setText("Connected" if connected else "Disconnected")
-        self.target_label.setText(f"Target: {target or 'none'}")
+        # The app state store notifies on every update, changed or not.
+        connection = (bool(connected), target or "")
+        if connection == self._last_connection:
+            return
+        self._last_connection = connection
+        self._queue_text(self.connection_label, "Connected" if connected else "Disconnected")
+        self._queue_text(self.target_label, _target_text(connection[1]))
 
+    @Slot(str)
     def set_state(self, text: str) -> None:
-        self.state_label.setText(f"State: {text or 'idle'}")
+        if (text or "") == self._last_state:
+            return
+        self._last_state = text or ""
+        self._queue_text(self.state_label, _state_text(self._last_state))
+
+    @Slot(bool)
+    def set_device_connected(self, connected: bool) -> None:
+        # Swapping prebuilt pixmaps avoids a stylesheet parse per health change.
+        if self.device_icon is None or connected == self._device_connected:
+            return
+        self._device_connected = connected
+        self.device_icon.setPixmap(self._device_dots[connected])
+
+    def _device_dot(self, color: str) -> QPixmap:
+        size = self.DEVICE_DOT_SIZE
+        ratio = self.devicePixelRatioF()
+        cached = self._DEVICE_DOT_CACHE.get((color, ratio))
+        if cached is not None:
+            return cached
+        pixmap = QPixmap(round(size * ratio), round(size * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(QColor(self.DEVICE_BORDER_COLOR), 1))
+        painter.setBrush(QColor(color))
+        painter.drawEllipse(0.5, 0.5, size - 1, size - 1)
+        painter.end()
+        self._DEVICE_DOT_CACHE[(color, ratio)] = pixmap
+        return pixmap
+
+    def _queue_text(self, label: QLabel, text: str) -> None:
+        # State store bursts collapse into one relayout per flush interval.
+        self._pending[label] = text
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    @Slot()
+    def flush(self) -> None:
+        self._flush_timer.stop()
+        pending = self._pending
+        self._pending = {}
+        for label, text in pending.items():
+            if label.text() != text:
+                label.setText(text)
@@ -1,4 +1,70 @@
 import os
+import shutil
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
 
 
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("QT_STYLE_OVERRIDE", "Fusion")
+
+
+@pytest.fixture(scope="module")
+def main_window(qapp) -> Iterator:  # noqa: ANN001
+    """One shown MainWindow per test module; tests reset whatever state they depend on."""
+    from app.ui.main_window import MainWindow
+
+    # Building and first-rendering MainWindow dominates the Qt modules, so
+    # tests that only drive specific widgets share a single window.
+    window = MainWindow()
+    window.show()
+    deadline = time.monotonic() + 5.0
+    while window.preset_combo.count() == 0 and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.01)
+    assert window.preset_combo.count() > 0
+    yield window
+    window.close()
+    window.deleteLater()
+    qapp.processEvents()
+
+
+@pytest.fixture(autouse=True)
+def _shared_qapp(request):
+    """Bring up pytest-qt's session QApplication for ``qt`` tests only, so core runs never touch Qt."""
+    if request.node.get_closest_marker("qt") is not None:
+        request.getfixturevalue("qapp")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def jinja_bytecode_cache(tmp_path_factory):
+    """Share compiled templates across every ConfigRenderService built in the session."""
+    cache_dir = tmp_path_factory.mktemp("j2bc")
+    previous = os.environ.get("KLIPPCONFIG_JINJA_BYTECODE_CACHE")
+    os.environ["KLIPPCONFIG_JINJA_BYTECODE_CACHE"] = str(cache_dir)
+    yield cache_dir
+    if previous is None:
+        os.environ.pop("KLIPPCONFIG_JINJA_BYTECODE_CACHE", None)
+    else:
+        os.environ["KLIPPCONFIG_JINJA_BYTECODE_CACHE"] = previous
+
+
+@pytest.fixture(scope="session")
+def machine_sample_root(tmp_path_factory) -> Path:
+    """Copy the sample machine tree to the session temp dir once, keeping its folder name."""
+    source = Path(__file__).resolve().parent / "fixtures" / "existing_machine_sample"
+    target = tmp_path_factory.mktemp("machine") / source.name
+    shutil.copytree(source, target)
+    return target
+
+
+@pytest.fixture(scope="session")
+def imported_sample(machine_sample_root):
+    """Import the sample machine fixture once; tests must treat the result as read-only."""
+    from app.services.existing_machine_import import ExistingMachineImportService
+
+    importer = ExistingMachineImportService()
+    profile = importer.import_folder(str(machine_sample_root))
+    return importer, profile, dict(importer.last_import_files)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 
-from app.services.action_log import ActionLogService
+from app.services.action_log import ActionLogService, BufferedActionLog
 
 
 def test_action_log_service_writes_json_lines(tmp_path) -> None:
@@ -23,3 +23,33 @@ def test_action_log_service_writes_json_lines(tmp_path) -> None:
     assert "timestamp" in first
     assert second["action"] == "validate"
     assert second["warnings"] == 1
+
+
+def test_buffered_action_log_writes_events_off_the_caller_thread(tmp_path) -> None:
+    log_path = tmp_path / "logs" / "actions.log"
+    service = BufferedActionLog(log_path=log_path)
+
+    for index in range(100):
+        service.log_event("upload", phase="start", index=index)
+    service.flush()
+
+    lines = log_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["index"] for line in lines] == list(range(100))
+
+    service.log_event("upload", phase="complete")
+    service.close()
+
+    lines = log_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 101
+    assert json.loads(lines[-1])["phase"] == "complete"
+
+
+def test_action_log_falls_back_to_stdlib_json(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr("app.services.json_codec.orjson", None)
+    log_path = tmp_path / "actions.log"
+
+    ActionLogService(log_path=log_path).log_event("deploy", phase="complete", files=3)
+
+    record = json.loads(log_path.read_text(encoding="utf-8"))
+    assert record["action"] == "deploy"
+    assert record["files"] == 3
@@ -1,19 +1,10 @@
 from __future__ import annotations
 
-from pathlib import Path
-
 from app.services.addon_bundle_learning import AddonBundleLearningService
-from app.services.existing_machine_import import ExistingMachineImportService
-
-
-def _fixture_root() -> Path:
-    return Path(__file__).resolve().parent / "fixtures" / "existing_machine_sample"
 
 
-def test_learn_from_import_writes_addon_bundle_files(tmp_path) -> None:
-    importer = ExistingMachineImportService()
-    profile = importer.import_folder(str(_fixture_root()))
-    file_map = importer.last_import_files
+def test_learn_from_import_writes_addon_bundle_files(tmp_path, imported_sample) -> None:
+    _importer, profile, file_map = imported_sample
     service = AddonBundleLearningService(bundle_root=tmp_path / "bundles")
 
     created = service.learn_from_import(profile, file_map)
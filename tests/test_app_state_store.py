@@ -38,9 +38,22 @@ def test_app_state_store_notifies_subscribers() -> None:
         seen.append(state.ui.active_route)
 
     store.subscribe(listener)
-    store.update_ui(active_route="home")
+    store.update_ui(active_route="generate")
     store.update_ui(active_route="files")
     store.unsubscribe(listener)
+    store.update_ui(active_route="home")
+
+    assert seen == ["generate", "files"]
+
+
+def test_app_state_store_skips_unchanged_updates() -> None:
+    store = AppStateStore()
+    seen: list[str] = []
+    store.subscribe(lambda state: seen.append(state.ui.active_route))
+
     store.update_ui(active_route="files")
+    store.update_ui(active_route="files")
+    store.update_deploy(upload_in_progress=False)
+    store.update_ui(active_route="home")
 
-    assert seen == ["home", "files"]
+    assert seen == ["files", "home"]
@@ -1,80 +1,117 @@
 from __future__ import annotations
 
-import json
+import copy
+from pathlib import Path
+from typing import Final
 
-from app.domain.models import ProjectConfig
-from app.services import board_registry
+import pytest
+
+from app.domain.models import ProjectConfig, ToolheadConfig
+from app.services import board_registry, json_codec
 from app.services.config_bundles import BundleCatalogService
 from app.services.preset_catalog import PresetCatalogService
 from app.services.renderer import ConfigRenderService
 from app.services.validator import ValidationService
 
 
-def _write_json(path, payload: dict) -> None:  # noqa: ANN001
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-
-
-def _base_project_payload(preset_id: str, board: str, x: int, y: int, z: int) -> dict:
-    return {
-        "preset_id": preset_id,
-        "board": board,
-        "dimensions": {"x": x, "y": y, "z": z},
-        "probe": {"enabled": False, "type": None},
-        "thermistors": {
-            "hotend": "EPCOS 100K B57560G104F",
-            "bed": "EPCOS 100K B57560G104F",
-        },
-        "motion_profile": "safe",
-        "macro_packs": [],
-        "addons": [],
-        "toolhead": {"enabled": False, "board": None, "canbus_uuid": None},
-        "leds": {
-            "enabled": False,
-            "pin": "PA8",
-            "chain_count": 1,
-            "color_order": "GRB",
-            "initial_red": 0.0,
-            "initial_green": 0.0,
-            "initial_blue": 0.0,
-        },
-        "advanced_overrides": {},
+@pytest.fixture(scope="module")
+def catalog() -> PresetCatalogService:
+    return PresetCatalogService()
+
+
+@pytest.fixture(scope="module")
+def validator() -> ValidationService:
+    return ValidationService()
+
+
+@pytest.fixture(scope="module")
+def voron_preset(catalog: PresetCatalogService):  # noqa: ANN201
+    return catalog.load_preset("voron_2_4_300")
+
+
+def _write_bundle(root: Path, entries: dict[str, dict]) -> None:
+    """Write ``{"subdir/name.json": payload}`` entries, creating each directory once."""
+    grouped: dict[str, list[tuple[str, dict]]] = {}
+    for rel, payload in entries.items():
+        subdir, _, name = rel.rpartition("/")
+        grouped.setdefault(subdir, []).append((name, payload))
+    for subdir, files in grouped.items():
+        target = root / subdir if subdir else root
+        target.mkdir(parents=True, exist_ok=True)
+        for name, payload in files:
+            (target / name).write_bytes(json_codec.dumps(payload, indent=True, sort_keys=True))
+
+
+_BASE_PROJECT_PAYLOAD: Final[dict] = {
+    "preset_id": "",
+    "board": "",
+    "dimensions": {"x": 0, "y": 0, "z": 0},
+    "probe": {"enabled": False, "type": None},
+    "thermistors": {
+        "hotend": "EPCOS 100K B57560G104F",
+        "bed": "EPCOS 100K B57560G104F",
+    },
+    "motion_profile": "safe",
+    "macro_packs": [],
+    "addons": [],
+    "toolhead": {"enabled": False, "board": None, "canbus_uuid": None},
+    "leds": {
+        "enabled": False,
+        "pin": "PA8",
+        "chain_count": 1,
+        "color_order": "GRB",
+        "initial_red": 0.0,
+        "initial_green": 0.0,
+        "initial_blue": 0.0,
+    },
+    "advanced_overrides": {},
+}
+
+
+@pytest.fixture(scope="module")
+def base_project(voron_preset) -> ProjectConfig:  # noqa: ANN001
+    # Validated once; tests derive their project with model_copy(update=...),
+    # which replaces top-level fields without touching this instance.
+    payload = copy.deepcopy(_BASE_PROJECT_PAYLOAD)
+    payload["preset_id"] = voron_preset.id
+    payload["board"] = voron_preset.supported_boards[0]
+    payload["dimensions"] = {
+        "x": voron_preset.build_volume.x,
+        "y": voron_preset.build_volume.y,
+        "z": voron_preset.build_volume.z,
     }
+    return ProjectConfig.model_validate(payload)
 
 
 def test_bundle_catalog_loads_board_toolhead_and_addon_profiles(tmp_path) -> None:
     bundle_root = tmp_path / "bundles"
-    _write_json(
-        bundle_root / "boards" / "my_board.json",
-        {
-            "id": "my_board",
-            "label": "My Board",
-            "mcu": "stm32f446xx",
-            "serial_hint": "/dev/serial/by-id/usb-My_Board",
-            "pins": {"stepper_x_step": "PA0"},
-            "layout": {"Drivers": ["X"]},
-        },
-    )
-    _write_json(
-        bundle_root / "toolhead_boards" / "my_toolhead.json",
+    _write_bundle(
+        bundle_root,
         {
-            "id": "my_toolhead",
-            "label": "My Toolhead",
-            "mcu": "rp2040",
-            "serial_hint": "canbus_uuid: replace-with-uuid",
-            "pins": {"extruder_step": "toolhead:EXT_STEP"},
-        },
-    )
-    _write_json(
-        bundle_root / "addons" / "my_addon.json",
-        {
-            "id": "my_addon",
-            "label": "My Addon",
-            "template": "addons/my_addon.cfg.j2",
-            "supported_families": ["voron"],
-            "include_files": ["my_addon.cfg"],
-            "package_templates": {"my_addon.cfg": "addons/my_addon.cfg.j2"},
-            "learned": True,
+            "boards/my_board.json": {
+                "id": "my_board",
+                "label": "My Board",
+                "mcu": "stm32f446xx",
+                "serial_hint": "/dev/serial/by-id/usb-My_Board",
+                "pins": {"stepper_x_step": "PA0"},
+                "layout": {"Drivers": ["X"]},
+            },
+            "toolhead_boards/my_toolhead.json": {
+                "id": "my_toolhead",
+                "label": "My Toolhead",
+                "mcu": "rp2040",
+                "serial_hint": "canbus_uuid: replace-with-uuid",
+                "pins": {"extruder_step": "toolhead:EXT_STEP"},
+            },
+            "addons/my_addon.json": {
+                "id": "my_addon",
+                "label": "My Addon",
+                "template": "addons/my_addon.cfg.j2",
+                "supported_families": ["voron"],
+                "include_files": ["my_addon.cfg"],
+                "package_templates": {"my_addon.cfg": "addons/my_addon.cfg.j2"},
+                "learned": True,
+            },
         },
     )
 
@@ -101,23 +138,26 @@ def test_invalid_bundle_files_are_ignored(tmp_path) -> None:
     invalid_board.parent.mkdir(parents=True, exist_ok=True)
     invalid_board.write_text("{not-valid-json", encoding="utf-8")
 
-    invalid_addon = bundle_root / "addons" / "missing_fields.json"
-    _write_json(invalid_addon, {"id": "missing_fields"})
+    _write_bundle(bundle_root, {"addons/missing_fields.json": {"id": "missing_fields"}})
 
     service = BundleCatalogService(bundle_roots=[bundle_root])
     assert service.load_main_board_profiles() == {}
     assert service.load_addon_profiles() == {}
 
 
-def test_custom_addon_bundle_is_ignored_when_addons_are_disabled(monkeypatch, tmp_path) -> None:
+def test_custom_addon_bundle_is_ignored_when_addons_are_disabled(
+    monkeypatch, tmp_path, validator, voron_preset, base_project
+) -> None:
     bundle_root = tmp_path / "bundles"
-    _write_json(
-        bundle_root / "addons" / "chamber_heater.json",
+    _write_bundle(
+        bundle_root,
         {
-            "id": "chamber_heater",
-            "label": "Chamber Heater",
-            "template": "addons/chamber_heater.cfg.j2",
-            "supported_families": ["voron"],
+            "addons/chamber_heater.json": {
+                "id": "chamber_heater",
+                "label": "Chamber Heater",
+                "template": "addons/chamber_heater.cfg.j2",
+                "supported_families": ["voron"],
+            },
         },
     )
     template_path = bundle_root / "templates" / "addons" / "chamber_heater.cfg.j2"
@@ -132,20 +172,11 @@ def test_custom_addon_bundle_is_ignored_when_addons_are_disabled(monkeypatch, tm
     monkeypatch.setenv("KLIPPCONFIG_BUNDLE_DIRS", str(bundle_root))
     monkeypatch.setattr(board_registry, "_bundle_catalog", BundleCatalogService([bundle_root]))
 
-    catalog = PresetCatalogService()
-    validator = ValidationService()
+    # Built per test: its template search path follows KLIPPCONFIG_BUNDLE_DIRS.
     renderer = ConfigRenderService()
-    preset = catalog.load_preset("voron_2_4_300")
-
-    payload = _base_project_payload(
-        preset.id,
-        preset.supported_boards[0],
-        preset.build_volume.x,
-        preset.build_volume.y,
-        preset.build_volume.z,
-    )
-    payload["addons"] = ["chamber_heater"]
-    project = ProjectConfig.model_validate(payload)
+    preset = voron_preset
+
+    project = base_project.model_copy(update={"addons": ["chamber_heater"]})
 
     report = validator.validate_project(project, preset)
     assert not report.has_blocking
@@ -156,42 +187,33 @@ def test_custom_addon_bundle_is_ignored_when_addons_are_disabled(monkeypatch, tm
 
 
 def test_usb_toolhead_bundle_renders_serial_and_skips_can_uuid_requirement(
-    monkeypatch, tmp_path
+    monkeypatch, tmp_path, validator, voron_preset, base_project
 ) -> None:
     bundle_root = tmp_path / "bundles"
-    _write_json(
-        bundle_root / "toolhead_boards" / "usb_toolhead.json",
+    _write_bundle(
+        bundle_root,
         {
-            "id": "usb_toolhead",
-            "label": "USB Toolhead",
-            "mcu": "rp2040",
-            "transport": "usb",
-            "serial_hint": "/dev/serial/by-id/usb-USB_Toolhead",
-            "pins": {"extruder_step": "toolhead:EXT_STEP"},
+            "toolhead_boards/usb_toolhead.json": {
+                "id": "usb_toolhead",
+                "label": "USB Toolhead",
+                "mcu": "rp2040",
+                "transport": "usb",
+                "serial_hint": "/dev/serial/by-id/usb-USB_Toolhead",
+                "pins": {"extruder_step": "toolhead:EXT_STEP"},
+            },
         },
     )
 
     monkeypatch.setenv("KLIPPCONFIG_BUNDLE_DIRS", str(bundle_root))
     monkeypatch.setattr(board_registry, "_bundle_catalog", BundleCatalogService([bundle_root]))
 
-    catalog = PresetCatalogService()
-    validator = ValidationService()
+    # Built per test: its template search path follows KLIPPCONFIG_BUNDLE_DIRS.
     renderer = ConfigRenderService()
-    preset = catalog.load_preset("voron_2_4_300")
-
-    payload = _base_project_payload(
-        preset.id,
-        preset.supported_boards[0],
-        preset.build_volume.x,
-        preset.build_volume.y,
-        preset.build_volume.z,
+    preset = voron_preset
+
+    project = base_project.model_copy(
+        update={"toolhead": ToolheadConfig(enabled=True, board="usb_toolhead", canbus_uuid=None)}
     )
-    payload["toolhead"] = {
-        "enabled": True,
-        "board": "usb_toolhead",
-        "canbus_uuid": None,
-    }
-    project = ProjectConfig.model_validate(payload)
 
     assert board_registry.toolhead_board_transport("usb_toolhead") == "usb"
     assert "usb_toolhead" in board_registry.list_usb_toolhead_boards()
@@ -18,6 +18,19 @@ def test_resolve_includes_accepts_trailing_comments_and_wildcards() -> None:
     ]
 
 
+def test_resolve_includes_ignores_non_include_lines_and_crlf() -> None:
+    service = ConfigGraphService()
+    content = (
+        "[printer]\r\n"
+        "  [INCLUDE macros.cfg] ; indented\r\n"
+        "#[include disabled.cfg]\r\n"
+        "[include\nsplit.cfg]\n"
+        "[include extra.cfg] trailing\n"
+    )
+
+    assert service.resolve_includes("config/printer.cfg", content) == ["config/macros.cfg"]
+
+
 def test_build_graph_and_flatten_expand_nested_includes() -> None:
     service = ConfigGraphService()
     files = {
@@ -43,3 +56,38 @@ def test_build_graph_and_flatten_expand_nested_includes() -> None:
     assert order[0] == "config/printer.cfg"
     assert "config/AFC/mcu/AFC_Lite.cfg" in order
     assert "config/KAMP/Adaptive_Meshing.cfg" in order
+
+
+def test_find_cycles_reports_each_cycle_once_without_recursion_limits() -> None:
+    service = ConfigGraphService()
+    graph = {
+        "printer.cfg": ["a.cfg", "self.cfg"],
+        "a.cfg": ["b.cfg", "missing.cfg"],
+        "b.cfg": ["printer.cfg"],
+        "self.cfg": ["self.cfg"],
+    }
+
+    cycles = service.find_cycles(graph, graph.keys())
+    assert sorted(cycles) == [
+        ["printer.cfg", "a.cfg", "b.cfg", "printer.cfg"],
+        ["self.cfg", "self.cfg"],
+    ]
+
+    chain = {f"part_{index}.cfg": [f"part_{index + 1}.cfg"] for index in range(5000)}
+    chain["part_5000.cfg"] = []
+    assert service.find_cycles(chain, chain.keys()) == []
+
+
+def test_find_cycles_reports_real_include_path_for_non_simple_component() -> None:
+    service = ConfigGraphService()
+    graph = {
+        "a.cfg": ["b.cfg"],
+        "b.cfg": ["a.cfg", "c.cfg"],
+        "c.cfg": ["b.cfg"],
+    }
+
+    cycles = service.find_cycles(graph, graph.keys())
+    assert cycles == [["a.cfg", "b.cfg", "a.cfg"]]
+    for cycle in cycles:
+        for source, target in zip(cycle, cycle[1:]):
+            assert target in graph[source]
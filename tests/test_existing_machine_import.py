@@ -1,46 +1,72 @@
 from __future__ import annotations
 
+import io
 import zipfile
-from pathlib import Path
+from typing import Final
 
 from app.domain.models import ProjectConfig
 from app.services.existing_machine_import import ExistingMachineImportService
 
 
-def _fixture_root() -> Path:
-    return Path(__file__).resolve().parent / "fixtures" / "existing_machine_sample"
-
-
-def _base_project_payload() -> dict:
-    return {
-        "preset_id": "voron_2_4_300",
-        "board": "btt_octopus_1_1",
-        "dimensions": {"x": 300, "y": 300, "z": 300},
-        "probe": {"enabled": False, "type": None},
-        "thermistors": {
-            "hotend": "EPCOS 100K B57560G104F",
-            "bed": "EPCOS 100K B57560G104F",
-        },
-        "motion_profile": "safe",
-        "macro_packs": [],
-        "addons": [],
-        "toolhead": {"enabled": False, "board": None, "canbus_uuid": None},
-        "leds": {
-            "enabled": False,
-            "pin": "PA8",
-            "chain_count": 1,
-            "color_order": "GRB",
-            "initial_red": 0.0,
-            "initial_green": 0.0,
-            "initial_blue": 0.0,
-        },
-        "advanced_overrides": {},
-    }
-
-
-def test_import_folder_detects_machine_traits_and_addons() -> None:
-    service = ExistingMachineImportService()
-    profile = service.import_folder(str(_fixture_root()))
+_BASE_PROJECT_PAYLOAD: Final[dict] = {
+    "preset_id": "voron_2_4_300",
+    "board": "btt_octopus_1_1",
+    "dimensions": {"x": 300, "y": 300, "z": 300},
+    "probe": {"enabled": False, "type": None},
+    "thermistors": {
+        "hotend": "EPCOS 100K B57560G104F",
+        "bed": "EPCOS 100K B57560G104F",
+    },
+    "motion_profile": "safe",
+    "macro_packs": [],
+    "addons": [],
+    "toolhead": {"enabled": False, "board": None, "canbus_uuid": None},
+    "leds": {
+        "enabled": False,
+        "pin": "PA8",
+        "chain_count": 1,
+        "color_order": "GRB",
+        "initial_red": 0.0,
+        "initial_green": 0.0,
+        "initial_blue": 0.0,
+    },
+    "advanced_overrides": {},
+}
+
+
+_THERMISTOR_SAMPLE_CFG: Final[bytes] = (
+    b"[mcu]\n"
+    b"serial: /dev/serial/by-id/usb-Klipper_stm32f446xx_TEST-if00\n\n"
+    b"[printer]\n"
+    b"kinematics: corexy\n\n"
+    b"[stepper_x]\n"
+    b"position_max: 350\n\n"
+    b"[stepper_y]\n"
+    b"position_max: 350\n\n"
+    b"[stepper_z]\n"
+    b"position_max: 310\n\n"
+    b"[stepper_z1]\n"
+    b"step_pin: PG4\n\n"
+    b"[stepper_z2]\n"
+    b"step_pin: PF9\n\n"
+    b"[stepper_z3]\n"
+    b"step_pin: PC13\n\n"
+    b"[extruder]\n"
+    b"sensor_type: ATC Semitec 104NT-4-R025H42G\n\n"
+    b"[heater_bed]\n"
+    b"sensor_type: Generic 3950\n\n"
+    b"[quad_gantry_level]\n"
+    b"gantry_corners:\n"
+    b"  -60,-10\n"
+    b"  410,420\n"
+)
+
+
+_BASE_PROJECT: Final[ProjectConfig] = ProjectConfig.model_validate(_BASE_PROJECT_PAYLOAD)
+
+
+def test_import_folder_detects_machine_traits_and_addons(imported_sample) -> None:
+    _service, profile, _files = imported_sample
 
     assert profile.root_file == "config/printer.cfg"
     assert profile.detected["preset_id"] == "voron_2_4_350"
@@ -54,27 +80,34 @@ def test_import_folder_detects_machine_traits_and_addons() -> None:
     assert "config/printer.cfg" in profile.detected["section_map"]
 
 
-def test_import_zip_matches_folder_core_signals(tmp_path) -> None:
-    fixture_root = _fixture_root()
-    zip_path = tmp_path / "existing_machine_sample.zip"
-    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
-        for file_path in fixture_root.rglob("*"):
+def test_import_zip_matches_folder_core_signals(machine_sample_root, imported_sample) -> None:
+    fixture_root = machine_sample_root
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as archive:
+        for file_path in sorted(fixture_root.rglob("*")):
             if not file_path.is_file():
                 continue
-            archive.write(file_path, file_path.relative_to(fixture_root))
+            member = zipfile.ZipInfo(
+                file_path.relative_to(fixture_root).as_posix(),
+                date_time=(1980, 1, 1, 0, 0, 0),
+            )
+            archive.writestr(member, file_path.read_bytes())
 
     service = ExistingMachineImportService()
-    profile = service.import_zip(str(zip_path))
+    profile = service.import_zip_bytes(buffer.getvalue(), name="existing_machine_sample")
 
     assert profile.root_file == "config/printer.cfg"
     assert profile.detected["preset_id"] == "voron_2_4_350"
     assert any(s.field == "toolhead.board" and s.value == "ldo_nitehawk_sb" for s in profile.suggestions)
 
+    _folder_service, folder_profile, _files = imported_sample
+    assert profile.root_file == folder_profile.root_file
+    assert profile.detected["preset_id"] == folder_profile.detected["preset_id"]
 
-def test_apply_suggestions_updates_project_with_auto_apply_fields() -> None:
-    service = ExistingMachineImportService()
-    profile = service.import_folder(str(_fixture_root()))
-    project = ProjectConfig.model_validate(_base_project_payload())
+
+def test_apply_suggestions_updates_project_with_auto_apply_fields(imported_sample) -> None:
+    service, profile, _files = imported_sample
+    project = _BASE_PROJECT.model_copy(deep=True)
 
     updated = service.apply_suggestions(profile, project)
 
@@ -95,33 +128,7 @@ def test_import_detects_and_applies_thermistors(tmp_path) -> None:
     source = tmp_path / "machine"
     config_dir = source / "config"
     config_dir.mkdir(parents=True, exist_ok=True)
-    (config_dir / "printer.cfg").write_text(
-        "[mcu]\n"
-        "serial: /dev/serial/by-id/usb-Klipper_stm32f446xx_TEST-if00\n\n"
-        "[printer]\n"
-        "kinematics: corexy\n\n"
-        "[stepper_x]\n"
-        "position_max: 350\n\n"
-        "[stepper_y]\n"
-        "position_max: 350\n\n"
-        "[stepper_z]\n"
-        "position_max: 310\n\n"
-        "[stepper_z1]\n"
-        "step_pin: PG4\n\n"
-        "[stepper_z2]\n"
-        "step_pin: PF9\n\n"
-        "[stepper_z3]\n"
-        "step_pin: PC13\n\n"
-        "[extruder]\n"
-        "sensor_type: ATC Semitec 104NT-4-R025H42G\n\n"
-        "[heater_bed]\n"
-        "sensor_type: Generic 3950\n\n"
-        "[quad_gantry_level]\n"
-        "gantry_corners:\n"
-        "  -60,-10\n"
-        "  410,420\n",
-        encoding="utf-8",
-    )
+    (config_dir / "printer.cfg").write_bytes(_THERMISTOR_SAMPLE_CFG)
 
     service = ExistingMachineImportService()
     profile = service.import_folder(str(source))
@@ -141,7 +148,7 @@ def test_import_detects_and_applies_thermistors(tmp_path) -> None:
         for s in profile.suggestions
     )
 
-    project = ProjectConfig.model_validate(_base_project_payload())
+    project = _BASE_PROJECT.model_copy(deep=True)
     updated = service.apply_suggestions(profile, project)
     assert updated.thermistors.hotend == "ATC Semitec 104NT-4-R025H42G"
     assert updated.thermistors.bed == "Generic 3950"
@@ -25,3 +25,19 @@ def test_export_folder_and_zip(tmp_path) -> None:
     with ZipFile(zip_path, "r") as archive:
         names = set(archive.namelist())
     assert {"printer.cfg", "mcu.cfg"}.issubset(names)
+
+
+def test_export_folder_writes_nested_files(tmp_path) -> None:
+    pack = RenderedPack(
+        files={
+            "printer.cfg": "[include macros/start.cfg]\n",
+            "macros/start.cfg": "[gcode_macro START]\n",
+            "macros/end.cfg": "[gcode_macro END]\n",
+            "boards/mcu.cfg": "[mcu]\n",
+        }
+    )
+
+    ExportService().export_folder(pack, str(tmp_path / "out"))
+
+    for name, contents in pack.files.items():
+        assert (tmp_path / "out" / name).read_text(encoding="utf-8") == contents
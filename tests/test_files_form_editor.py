@@ -2,12 +2,15 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from PySide6.QtCore import Qt
+import pytest
 from PySide6.QtWidgets import QFileDialog
 
 from app.ui.main_window import MainWindow
 
 
+pytestmark = pytest.mark.qt
+
+
 def _select_default_voron_preset(window: MainWindow) -> None:
     preset_index = window.preset_combo.findData(MainWindow.DEFAULT_VORON_PRESET_ID)
     if preset_index < 0 and window.preset_combo.count() > 1:
@@ -16,17 +19,14 @@ def _select_default_voron_preset(window: MainWindow) -> None:
         window.preset_combo.setCurrentIndex(preset_index)
 
 
-def test_generated_cfg_file_builds_form_and_applies_changes(qtbot) -> None:
-    window = MainWindow()
-    qtbot.addWidget(window)
-    window.show()
-    qtbot.waitUntil(lambda: window.preset_combo.count() > 0)
+def test_generated_cfg_file_builds_form_and_applies_changes(qtbot, main_window: MainWindow) -> None:
+    window = main_window
     _select_default_voron_preset(window)
     qtbot.waitUntil(lambda: window.current_pack is not None)
 
-    items = window.generated_file_list.findItems("printer.cfg", Qt.MatchFlag.MatchExactly)
-    assert items
-    window.generated_file_list.setCurrentItem(items[0])
+    item = window.find_generated_item("printer.cfg")
+    assert item is not None
+    window.generated_file_list.setCurrentItem(item)
     window._show_selected_generated_file()
 
     assert window.apply_form_btn.isEnabled()
@@ -42,7 +42,7 @@ def test_generated_cfg_file_builds_form_and_applies_changes(qtbot) -> None:
     assert "max_velocity: 123" in window.current_pack.files["printer.cfg"]
 
 
-def test_local_cfg_file_builds_form_and_updates_preview(qtbot, monkeypatch, tmp_path) -> None:
+def test_local_cfg_file_builds_form_and_updates_preview(monkeypatch, tmp_path, main_window: MainWindow) -> None:
     cfg_path = tmp_path / "sample.cfg"
     cfg_path.write_text(
         "[printer]\n"
@@ -54,10 +54,7 @@ def test_local_cfg_file_builds_form_and_updates_preview(qtbot, monkeypatch, tmp_
         encoding="utf-8",
     )
 
-    window = MainWindow()
-    qtbot.addWidget(window)
-    window.show()
-    qtbot.waitUntil(lambda: window.preset_combo.count() > 0)
+    window = main_window
 
     monkeypatch.setattr(
         QFileDialog,
@@ -76,7 +73,7 @@ def test_local_cfg_file_builds_form_and_updates_preview(qtbot, monkeypatch, tmp_
     assert "max_temp: 120" in window.file_preview.toPlainText()
 
 
-def test_refactor_current_cfg_updates_preview(qtbot, monkeypatch, tmp_path) -> None:
+def test_refactor_current_cfg_updates_preview(monkeypatch, tmp_path, main_window: MainWindow) -> None:
     cfg_path = tmp_path / "messy.cfg"
     cfg_path.write_text(
         " [ printer ] \n"
@@ -88,10 +85,7 @@ def test_refactor_current_cfg_updates_preview(qtbot, monkeypatch, tmp_path) -> N
         encoding="utf-8",
     )
 
-    window = MainWindow()
-    qtbot.addWidget(window)
-    window.show()
-    qtbot.waitUntil(lambda: window.preset_combo.count() > 0)
+    window = main_window
 
     monkeypatch.setattr(
         QFileDialog,
@@ -107,7 +101,7 @@ def test_refactor_current_cfg_updates_preview(qtbot, monkeypatch, tmp_path) -> N
     assert "max_temp: 280" in preview
 
 
-def test_validate_current_cfg_updates_status(qtbot, monkeypatch, tmp_path) -> None:
+def test_validate_current_cfg_updates_status(monkeypatch, tmp_path, main_window: MainWindow) -> None:
     cfg_path = tmp_path / "valid.cfg"
     cfg_path.write_text(
         "[printer]\n"
@@ -127,10 +121,7 @@ def test_validate_current_cfg_updates_status(qtbot, monkeypatch, tmp_path) -> No
         encoding="utf-8",
     )
 
-    window = MainWindow()
-    qtbot.addWidget(window)
-    window.show()
-    qtbot.waitUntil(lambda: window.preset_combo.count() > 0)
+    window = main_window
 
     monkeypatch.setattr(
         QFileDialog,
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from app.services import json_codec
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_codec_round_trips_with_and_without_orjson(monkeypatch, use_orjson) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(json_codec, "orjson", None)
+    elif json_codec.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    payload = {"b": [1, 2.5, None], "a": {"name": "Vorön", "enabled": True}}
+
+    compact = json_codec.dumps(payload)
+    assert isinstance(compact, bytes)
+    assert json_codec.loads(compact) == payload
+
+    pretty = json_codec.dumps(payload, indent=True, sort_keys=True)
+    assert pretty.decode("utf-8") == json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=False)
+    assert json_codec.loads(pretty.decode("utf-8")) == payload
+
+    with pytest.raises(json_codec.JSONDecodeError):
+        json_codec.loads(b"{not-json")
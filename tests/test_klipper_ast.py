@@ -1,6 +1,20 @@
 from __future__ import annotations
 
-from app.services.klipper_ast import parse_klipper_config, render_klipper_config
+from functools import lru_cache
+import io
+from typing import Callable, Iterator
+
+import pytest
+
+from app.services.klipper_ast import KlipperDocument, parse_klipper_config, render_klipper_config
+
+
+@pytest.fixture
+def parse_cached() -> Iterator[Callable[[str], KlipperDocument]]:
+    # Memoized for read-only comparisons within one test; never mutate the result.
+    memo = lru_cache(maxsize=None)(parse_klipper_config)
+    yield memo
+    memo.cache_clear()
 
 
 def test_parser_handles_sections_includes_and_multiline_values() -> None:
@@ -51,3 +65,24 @@ def test_render_roundtrips_semantic_content() -> None:
 
     assert reparsed.section_names() == parsed.section_names()
     assert reparsed.to_section_key_map() == parsed.to_section_key_map()
+
+
+def test_parser_accepts_streamed_lines(parse_cached) -> None:
+    source = (
+        "[printer]\n"
+        "kinematics: corexy\n"
+        "[gcode_macro TEST]\n"
+        "gcode:\n"
+        "  G28\n"
+    )
+
+    streamed = parse_klipper_config(io.StringIO(source))
+    assert streamed.section_names() == parse_cached(source).section_names()
+    assert streamed.to_section_key_map() == parse_cached(source).to_section_key_map()
+    assert streamed.has_trailing_newline is True
+
+    generated = parse_klipper_config(f"alpha_{index}: {index}" for index in range(900))
+    assert generated.section_names() == []
+    assert len(generated.preamble) == 900
+    assert generated.has_trailing_newline is False
+
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import json
+
+from app.services.manage_dir_cache import ManageDirCacheStore
+
+
+def test_manage_dir_cache_round_trip(tmp_path) -> None:
+    store = ManageDirCacheStore(storage_path=tmp_path / "cache" / "manage_dir_cache.json")
+    listing = {
+        "directory": "/home/pi/printer_data/config",
+        "entries": [
+            {"name": "printer.cfg", "path": "/home/pi/printer_data/config/printer.cfg", "type": "file"}
+        ],
+    }
+
+    assert store.load() == {}
+    store.save({"pi@printer.local:22:~/printer_data/config": listing})
+
+    assert store.load() == {"pi@printer.local:22:~/printer_data/config": listing}
+
+    store.clear()
+    assert store.load() == {}
+    store.clear()
+
+
+def test_manage_dir_cache_drops_expired_and_malformed_entries(tmp_path) -> None:
+    storage_path = tmp_path / "manage_dir_cache.json"
+    storage_path.write_text(
+        json.dumps(
+            {
+                "listings": {
+                    "old": {"saved_at": 0, "listing": {"entries": []}},
+                    "broken": {"saved_at": 9e12, "listing": "nope"},
+                    "fresh": {"saved_at": 9e12, "listing": {"entries": []}},
+                }
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    assert ManageDirCacheStore(storage_path=storage_path).load() == {"fresh": {"entries": []}}
+
+    storage_path.write_text("{not json", encoding="utf-8")
+    assert ManageDirCacheStore(storage_path=storage_path).load() == {}
@@ -1,17 +1,25 @@
 from __future__ import annotations
 
+import threading
+
+import pytest
 from PySide6.QtWidgets import QMessageBox
 
 import app.ui.main_window as main_window_module
+from app.services.manage_dir_cache import ManageDirCacheStore
 from app.ui.main_window import MainWindow
 
 
+pytestmark = pytest.mark.qt
+
+
 class FakeManageSSHService:
     def __init__(self) -> None:
         self.saved: tuple[str, str] | None = None
         self.restored: tuple[str, str, bool] | None = None
         self.downloaded: tuple[str, str] | None = None
         self.backup_count = 0
+        self.list_calls: list[str] = []
         self.directories = {
             "/home/pi/printer_data/config": [
                 {
@@ -49,6 +57,7 @@ class FakeManageSSHService:
         return value
 
     def list_directory(self, **kwargs):
+        self.list_calls.append(kwargs["remote_dir"])
         directory = self._expand(kwargs["remote_dir"])
         return {"directory": directory, "entries": list(self.directories.get(directory, []))}
 
@@ -90,6 +99,37 @@ def _walk_tree_items(tree_widget):
             stack.append(item.child(child_index))
 
 
+def _reset_manage_state(window: MainWindow) -> FakeManageSSHService:
+    # The module shares one MainWindow, so drop whatever the previous test
+    # left in the manage tab before driving it again.
+    window.manage_tree_poll_timer.stop()
+    window.manage_dir_cache.clear()
+    window.manage_dir_cache_stale.clear()
+    window.manage_validation_cache.clear()
+    window.manage_tree_overflow.clear()
+    window.manage_tree_params = None
+    window.manage_prefetch_pending = 0
+    window.manage_current_directory = None
+    window.manage_current_remote_file = None
+    window.manage_file_tree.clear()
+    window.manage_file_editor.clear()
+    window.manage_backup_combo.clear()
+    window.manage_log.clear()
+    window.manage_last_log_message = None
+    window.manage_log_repeat_count = 0
+    window.ssh_host_edit.clear()
+    window.manage_host_edit.clear()
+    window.manage_control_url_edit.clear()
+    window.manage_remote_dir_edit.setText("~/printer_data/config")
+    fake_service = FakeManageSSHService()
+    window.ssh_service = fake_service
+    return fake_service
+
+
+def _wait_for_manage_ops(qtbot, window: MainWindow) -> None:
+    qtbot.waitUntil(lambda: window.remote_pending_ops == 0)
+
+
 def _find_tree_item_by_path(window: MainWindow, remote_path: str):
     role = window._manage_tree_path_role()
     for item in _walk_tree_items(window.manage_file_tree):
@@ -99,11 +139,9 @@ def _find_tree_item_by_path(window: MainWindow, remote_path: str):
     return None
 
 
-def test_manage_printer_tab_file_edit_and_backup_flow(qtbot, monkeypatch, tmp_path) -> None:
-    window = MainWindow()
-    qtbot.addWidget(window)
-    window.show()
-    qtbot.waitUntil(lambda: window.preset_combo.count() > 0)
+def test_manage_printer_tab_file_edit_and_backup_flow(qtbot, main_window: MainWindow, monkeypatch, tmp_path) -> None:
+    window = main_window
+    _reset_manage_state(window)
 
     fake_service = FakeManageSSHService()
     window.ssh_service = fake_service
@@ -113,41 +151,46 @@ def test_manage_printer_tab_file_edit_and_backup_flow(qtbot, monkeypatch, tmp_pa
     window._use_ssh_host_for_manage()
 
     window._manage_refresh_files()
+    _wait_for_manage_ops(qtbot, window)
     assert window.manage_file_tree.topLevelItemCount() == 1
 
     printer_item = _find_tree_item_by_path(window, "/home/pi/printer_data/config/printer.cfg")
     assert printer_item is not None
     window.manage_file_tree.setCurrentItem(printer_item)
     window._manage_open_selected_file()
+    _wait_for_manage_ops(qtbot, window)
     assert "printer.cfg" in window.manage_current_file_label.text()
 
     window.manage_file_editor.setPlainText("updated file contents\n")
     window._manage_save_current_file()
+    _wait_for_manage_ops(qtbot, window)
     assert fake_service.saved is not None
     assert fake_service.saved[1] == "updated file contents\n"
 
     window._manage_create_backup()
+    _wait_for_manage_ops(qtbot, window)
     window._manage_refresh_backups()
+    _wait_for_manage_ops(qtbot, window)
     assert window.manage_backup_combo.count() == 2
 
     monkeypatch.setattr(QMessageBox, "question", lambda *_args, **_kwargs: QMessageBox.StandardButton.Yes)
     window.manage_backup_combo.setCurrentIndex(0)
     window._manage_restore_selected_backup()
+    _wait_for_manage_ops(qtbot, window)
     assert fake_service.restored is not None
     assert fake_service.restored[1].endswith("backup-20260101-000001")
 
     monkeypatch.setattr(window, "_desktop_backup_download_root", lambda: tmp_path)
     window._manage_download_selected_backup()
+    _wait_for_manage_ops(qtbot, window)
     assert fake_service.downloaded is not None
     assert fake_service.downloaded[0].endswith("backup-20260101-000001")
     assert str(tmp_path) in fake_service.downloaded[1]
 
 
-def test_manage_printer_can_explore_directories(qtbot) -> None:
-    window = MainWindow()
-    qtbot.addWidget(window)
-    window.show()
-    qtbot.waitUntil(lambda: window.preset_combo.count() > 0)
+def test_manage_printer_can_explore_directories(qtbot, main_window: MainWindow) -> None:
+    window = main_window
+    _reset_manage_state(window)
 
     fake_service = FakeManageSSHService()
     window.ssh_service = fake_service
@@ -157,27 +200,403 @@ def test_manage_printer_can_explore_directories(qtbot) -> None:
     window._use_ssh_host_for_manage()
 
     window._manage_refresh_files()
+    _wait_for_manage_ops(qtbot, window)
     assert "Tree root: /home/pi/printer_data/config" in window.manage_current_dir_label.text()
 
     extras_item = _find_tree_item_by_path(window, "/home/pi/printer_data/config/extras")
     assert extras_item is not None
     window.manage_file_tree.setCurrentItem(extras_item)
     window._manage_open_selected_file()
+    _wait_for_manage_ops(qtbot, window)
     assert "Tree root: /home/pi/printer_data/config/extras" in window.manage_current_dir_label.text()
 
     extras_file = _find_tree_item_by_path(window, "/home/pi/printer_data/config/extras/test.cfg")
     assert extras_file is not None
     window._manage_browse_up_directory()
+    _wait_for_manage_ops(qtbot, window)
     assert "Tree root: /home/pi/printer_data/config" in window.manage_current_dir_label.text()
     root_file_item = _find_tree_item_by_path(window, "/home/pi/printer_data/config/printer.cfg")
     assert root_file_item is not None
 
 
-def test_manage_control_url_resolution(qtbot) -> None:
-    window = MainWindow()
+def test_manage_directory_listings_are_cached_until_forced(qtbot, main_window: MainWindow) -> None:
+    window = main_window
+    _reset_manage_state(window)
+
+    fake_service = FakeManageSSHService()
+    window.ssh_service = fake_service
+
+    window.ssh_host_edit.setText("192.168.1.20")
+    window.ssh_username_edit.setText("pi")
+    window._use_ssh_host_for_manage()
+
+    window._manage_refresh_files()
+    _wait_for_manage_ops(qtbot, window)
+    window._manage_refresh_files()
+    _wait_for_manage_ops(qtbot, window)
+    assert fake_service.list_calls == ["~/printer_data/config"]
+
+    window.manage_refresh_files_btn.click()
+    _wait_for_manage_ops(qtbot, window)
+    assert len(fake_service.list_calls) == 2
+
+    printer_item = _find_tree_item_by_path(window, "/home/pi/printer_data/config/printer.cfg")
+    window.manage_file_tree.setCurrentItem(printer_item)
+    window._manage_open_selected_file()
+    _wait_for_manage_ops(qtbot, window)
+    window._manage_save_current_file()
+    _wait_for_manage_ops(qtbot, window)
+    window._manage_refresh_files(target_dir="/home/pi/printer_data/config")
+    _wait_for_manage_ops(qtbot, window)
+    assert len(fake_service.list_calls) == 3
+
+
+def test_manage_open_ignores_second_file_while_first_is_fetching(
+    qtbot, main_window: MainWindow
+) -> None:
+    window = main_window
+    _reset_manage_state(window)
+
+    fake_service = FakeManageSSHService()
+    window.ssh_service = fake_service
+
+    window.ssh_host_edit.setText("192.168.1.20")
+    window.ssh_username_edit.setText("pi")
+    window._use_ssh_host_for_manage()
+
+    window._manage_refresh_files()
+    _wait_for_manage_ops(qtbot, window)
+
+    release = threading.Event()
+    fetched: list[str] = []
+
+    def slow_fetch(**kwargs):
+        fetched.append(kwargs["remote_path"])
+        release.wait(5)
+        return f"# contents for {kwargs['remote_path']}\n"
+
+    fake_service.fetch_file = slow_fetch
+    window.manage_file_tree.setCurrentItem(
+        _find_tree_item_by_path(window, "/home/pi/printer_data/config/printer.cfg")
+    )
+    window._manage_open_selected_file()
+    window.manage_file_tree.setCurrentItem(
+        _find_tree_item_by_path(window, "/home/pi/printer_data/config/macros.cfg")
+    )
+    window._manage_open_selected_file()
+    release.set()
+    _wait_for_manage_ops(qtbot, window)
+
+    assert fetched == ["/home/pi/printer_data/config/printer.cfg"]
+    assert window.manage_current_remote_file == "/home/pi/printer_data/config/printer.cfg"
+    assert "manage_open" not in window.remote_ops_in_flight
+
+
+def test_shared_busy_widget_stays_disabled_until_last_op_finishes(
+    qtbot, main_window: MainWindow
+) -> None:
+    window = main_window
+    _reset_manage_state(window)
+    button = window.manage_open_file_btn
+    first = threading.Event()
+    second = threading.Event()
+
+    window._submit_remote_op(lambda: first.wait(5), None, busy_widgets=(button,))
+    window._submit_remote_op(lambda: second.wait(5), None, busy_widgets=(button,))
+    assert not button.isEnabled()
+
+    first.set()
+    qtbot.waitUntil(lambda: window.remote_pending_ops == 1)
+    assert not button.isEnabled()
+
+    second.set()
+    _wait_for_manage_ops(qtbot, window)
+    assert button.isEnabled()
+    assert button not in window.remote_busy_widget_counts
+
+
+def test_manage_folder_load_prefetches_subfolders(qtbot, main_window: MainWindow) -> None:
+    window = main_window
+    _reset_manage_state(window)
+
+    fake_service = FakeManageSSHService()
+    fake_service.directories["/home/pi/printer_data/config/extras"].append(
+        {
+            "name": "nested",
+            "path": "/home/pi/printer_data/config/extras/nested",
+            "type": "dir",
+        }
+    )
+    window.ssh_service = fake_service
+
+    window.ssh_host_edit.setText("192.168.1.20")
+    window.ssh_username_edit.setText("pi")
+    window._use_ssh_host_for_manage()
+
+    window._manage_refresh_files()
+    _wait_for_manage_ops(qtbot, window)
+    extras_item = _find_tree_item_by_path(window, "/home/pi/printer_data/config/extras")
+    window.manage_file_tree.setCurrentItem(extras_item)
+    window._manage_open_selected_file()
+    _wait_for_manage_ops(qtbot, window)
+    assert fake_service.list_calls[-1] == "/home/pi/printer_data/config/extras/nested"
+    assert window.manage_prefetch_pending == 0
+
+    call_count = len(fake_service.list_calls)
+    nested_item = _find_tree_item_by_path(window, "/home/pi/printer_data/config/extras/nested")
+    window.manage_file_tree.setCurrentItem(nested_item)
+    window._manage_open_selected_file()
+    _wait_for_manage_ops(qtbot, window)
+    assert len(fake_service.list_calls) == call_count
+
+
+def test_manage_refresh_keeps_unchanged_tree_items(qtbot, main_window: MainWindow) -> None:
+    window = main_window
+    _reset_manage_state(window)
+
+    fake_service = FakeManageSSHService()
+    window.ssh_service = fake_service
+
+    window.ssh_host_edit.setText("192.168.1.20")
+    window.ssh_username_edit.setText("pi")
+    window._use_ssh_host_for_manage()
+
+    window._manage_refresh_files()
+    _wait_for_manage_ops(qtbot, window)
+    extras_item = _find_tree_item_by_path(window, "/home/pi/printer_data/config/extras")
+    window.manage_file_tree.setCurrentItem(extras_item)
+    window._manage_open_selected_file()
+    _wait_for_manage_ops(qtbot, window)
+    assert extras_item.isExpanded()
+
+    fake_service.directories["/home/pi/printer_data/config"] = [
+        entry
+        for entry in fake_service.directories["/home/pi/printer_data/config"]
+        if entry["name"] != "macros.cfg"
+    ] + [
+        {
+            "name": "added.cfg",
+            "path": "/home/pi/printer_data/config/added.cfg",
+            "type": "file",
+        }
+    ]
+    window._manage_refresh_files(target_dir="/home/pi/printer_data/config", force=True)
+    _wait_for_manage_ops(qtbot, window)
+
+    assert _find_tree_item_by_path(window, "/home/pi/printer_data/config/extras") is extras_item
+    assert extras_item.isExpanded()
+    assert _find_tree_item_by_path(window, "/home/pi/printer_data/config/macros.cfg") is None
+    root_item = window.manage_file_tree.topLevelItem(0)
+    assert [root_item.child(index).text(0) for index in range(root_item.childCount())] == [
+        "extras",
+        "added.cfg",
+        "printer.cfg",
+    ]
+
+
+def test_manage_prefetch_of_persisted_listing_settles_pending_count(
+    qtbot, main_window: MainWindow
+) -> None:
+    window = main_window
+    _reset_manage_state(window)
+
+    fake_service = FakeManageSSHService()
+    window.ssh_service = fake_service
+
+    window.ssh_host_edit.setText("192.168.1.20")
+    window.ssh_username_edit.setText("pi")
+    window._use_ssh_host_for_manage()
+
+    window._manage_refresh_files()
+    _wait_for_manage_ops(qtbot, window)
+    params = window.manage_tree_params
+    extras_key = f"{window._manage_dir_cache_prefix(params)}/home/pi/printer_data/config/extras"
+    window.manage_dir_cache[extras_key] = (
+        0.0,
+        {"directory": "/home/pi/printer_data/config/extras", "entries": []},
+    )
+    window.manage_dir_cache_stale.add(extras_key)
+
+    root_item = window.manage_file_tree.topLevelItem(0)
+    window._manage_prefetch_child_dirs(root_item, fake_service, params)
+    _wait_for_manage_ops(qtbot, window)
+
+    assert window.manage_prefetch_pending == 0
+    assert extras_key not in window.manage_dir_cache_stale
+    assert window.manage_dir_cache[extras_key][1]["entries"] == (
+        fake_service.directories["/home/pi/printer_data/config/extras"]
+    )
+
+
+def test_manage_poll_updates_only_changed_visible_folders(qtbot, main_window: MainWindow, monkeypatch) -> None:
+    window = main_window
+    _reset_manage_state(window)
+
+    fake_service = FakeManageSSHService()
+    window.ssh_service = fake_service
+    monkeypatch.setattr(window, "isActiveWindow", lambda: True)
+
+    window.ssh_host_edit.setText("192.168.1.20")
+    window.ssh_username_edit.setText("pi")
+    window._use_ssh_host_for_manage()
+
+    window._manage_refresh_files()
+    _wait_for_manage_ops(qtbot, window)
+    assert window.manage_tree_poll_timer.isActive()
+    printer_item = _find_tree_item_by_path(window, "/home/pi/printer_data/config/printer.cfg")
+
+    window._manage_poll_visible_folders()
+    _wait_for_manage_ops(qtbot, window)
+    assert _find_tree_item_by_path(window, "/home/pi/printer_data/config/printer.cfg") is printer_item
+
+    fake_service.directories["/home/pi/printer_data/config"].append(
+        {
+            "name": "moonraker.conf",
+            "path": "/home/pi/printer_data/config/moonraker.conf",
+            "type": "file",
+        }
+    )
+    window._manage_poll_visible_folders()
+    _wait_for_manage_ops(qtbot, window)
+    assert _find_tree_item_by_path(window, "/home/pi/printer_data/config/moonraker.conf") is not None
+    assert _find_tree_item_by_path(window, "/home/pi/printer_data/config/printer.cfg") is printer_item
+    assert "Updated /home/pi/printer_data/config" in window.manage_log.toPlainText()
+
+
+def test_manage_poll_stops_when_printer_disconnects(qtbot, main_window: MainWindow, monkeypatch) -> None:
+    window = main_window
+    _reset_manage_state(window)
+
+    fake_service = FakeManageSSHService()
+    window.ssh_service = fake_service
+    monkeypatch.setattr(window, "isActiveWindow", lambda: True)
+
+    window.ssh_host_edit.setText("192.168.1.20")
+    window.ssh_username_edit.setText("pi")
+    window._use_ssh_host_for_manage()
+
+    window._manage_refresh_files()
+    _wait_for_manage_ops(qtbot, window)
+    assert window.manage_tree_poll_timer.isActive()
+
+    window._disconnect_printer()
+    assert not window.manage_tree_poll_timer.isActive()
+    assert window.manage_tree_params is None
+
+    calls_before = len(fake_service.list_calls)
+    window._manage_poll_visible_folders()
+    _wait_for_manage_ops(qtbot, window)
+    assert len(fake_service.list_calls) == calls_before
+    assert window.device_connected is False
+
+
+def test_manage_persisted_listings_show_immediately_then_revalidate(qtbot, tmp_path) -> None:
+    store = ManageDirCacheStore(storage_path=tmp_path / "manage_dir_cache.json")
+    fake_service = FakeManageSSHService()
+    store.save(
+        {
+            "pi@192.168.1.20:22:~/printer_data/config": {
+                "directory": "/home/pi/printer_data/config",
+                "entries": [
+                    {
+                        "name": "old.cfg",
+                        "path": "/home/pi/printer_data/config/old.cfg",
+                        "type": "file",
+                    }
+                ],
+            }
+        }
+    )
+
+    window = MainWindow(manage_dir_cache_store=store)
     qtbot.addWidget(window)
     window.show()
     qtbot.waitUntil(lambda: window.preset_combo.count() > 0)
+    window.ssh_service = fake_service
+
+    window.ssh_host_edit.setText("192.168.1.20")
+    window.ssh_username_edit.setText("pi")
+    window._use_ssh_host_for_manage()
+
+    window._manage_refresh_files()
+    assert _find_tree_item_by_path(window, "/home/pi/printer_data/config/old.cfg") is not None
+    _wait_for_manage_ops(qtbot, window)
+    assert fake_service.list_calls == ["~/printer_data/config"]
+    assert _find_tree_item_by_path(window, "/home/pi/printer_data/config/old.cfg") is None
+    assert _find_tree_item_by_path(window, "/home/pi/printer_data/config/printer.cfg") is not None
+
+    window.close()
+    persisted = store.load()
+    assert any(
+        entry["name"] == "printer.cfg"
+        for entry in persisted["pi@192.168.1.20:22:~/printer_data/config"]["entries"]
+    )
+
+    window.manage_clear_dir_cache_btn.click()
+    assert window.manage_dir_cache == {}
+    assert store.load() == {}
+
+
+def test_manage_large_folders_are_paged_into_the_tree(qtbot, main_window: MainWindow, monkeypatch) -> None:
+    window = main_window
+    _reset_manage_state(window)
+    monkeypatch.setattr(window, "MANAGE_TREE_PAGE_SIZE", 2)
+
+    fake_service = FakeManageSSHService()
+    fake_service.directories["/home/pi/printer_data/config"] = [
+        {
+            "name": f"part_{index}.cfg",
+            "path": f"/home/pi/printer_data/config/part_{index}.cfg",
+            "type": "file",
+        }
+        for index in range(5)
+    ]
+    window.ssh_service = fake_service
+
+    window.ssh_host_edit.setText("192.168.1.20")
+    window.ssh_username_edit.setText("pi")
+    window._use_ssh_host_for_manage()
+
+    window._manage_refresh_files()
+    _wait_for_manage_ops(qtbot, window)
+    root_item = window.manage_file_tree.topLevelItem(0)
+    assert root_item.childCount() == 3
+    more_item = root_item.child(2)
+    assert "3 more" in more_item.text(0)
+
+    window.manage_file_tree.setCurrentItem(more_item)
+    window._manage_open_selected_file()
+    assert [root_item.child(index).text(0) for index in range(root_item.childCount() - 1)] == [
+        "part_0.cfg",
+        "part_1.cfg",
+        "part_2.cfg",
+        "part_3.cfg",
+    ]
+    assert "1 more" in root_item.child(root_item.childCount() - 1).text(0)
+
+    window._manage_refresh_files(target_dir="/home/pi/printer_data/config", force=True)
+    _wait_for_manage_ops(qtbot, window)
+    assert root_item.childCount() == 5
+
+
+def test_manage_log_collapses_repeated_messages(main_window: MainWindow) -> None:
+    window = main_window
+    _reset_manage_state(window)
+
+    window._append_manage_log("Loaded 3 entries from /home/pi/printer_data/config.")
+    window._append_manage_log("Loaded 3 entries from /home/pi/printer_data/config.")
+    window._append_manage_log("Loaded 3 entries from /home/pi/printer_data/config.")
+    window._append_manage_log("Opened /home/pi/printer_data/config/printer.cfg.")
+
+    lines = window.manage_log.toPlainText().splitlines()
+    assert len(lines) == 2
+    assert lines[0].endswith("Loaded 3 entries from /home/pi/printer_data/config. (x3)")
+    assert lines[1].endswith("Opened /home/pi/printer_data/config/printer.cfg.")
+
+
+def test_manage_control_url_resolution(qtbot, main_window: MainWindow) -> None:
+    window = main_window
+    _reset_manage_state(window)
 
     window.manage_host_edit.setText("192.168.1.20")
     assert window._resolve_manage_control_url() == "http://192.168.1.20"
@@ -186,11 +605,9 @@ def test_manage_control_url_resolution(qtbot) -> None:
     assert window._resolve_manage_control_url() == "http://printer.local/mainsail"
 
 
-def test_manage_open_control_window_loads_embedded_view(qtbot, monkeypatch) -> None:
-    window = MainWindow()
-    qtbot.addWidget(window)
-    window.show()
-    qtbot.waitUntil(lambda: window.preset_combo.count() > 0)
+def test_manage_open_control_window_loads_embedded_view(qtbot, main_window: MainWindow, monkeypatch) -> None:
+    window = main_window
+    _reset_manage_state(window)
 
     loaded_urls: list[str] = []
     opened_urls: list[str] = []
@@ -215,11 +632,9 @@ def test_manage_open_control_window_loads_embedded_view(qtbot, monkeypatch) -> N
     assert window.app_state_store.snapshot().ui.active_route == "printers"
 
 
-def test_manage_open_control_window_falls_back_to_browser(qtbot, monkeypatch) -> None:
-    window = MainWindow()
-    qtbot.addWidget(window)
-    window.show()
-    qtbot.waitUntil(lambda: window.preset_combo.count() > 0)
+def test_manage_open_control_window_falls_back_to_browser(qtbot, main_window: MainWindow, monkeypatch) -> None:
+    window = main_window
+    _reset_manage_state(window)
 
     opened_urls: list[str] = []
 
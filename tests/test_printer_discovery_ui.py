@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+import pytest
+
 from app.services.printer_discovery import DiscoveredPrinter
 from app.ui.main_window import MainWindow
 
 
-def test_scan_populates_results_and_sets_host(qtbot, monkeypatch) -> None:
-    window = MainWindow()
-    qtbot.addWidget(window)
-    window.show()
-    qtbot.waitUntil(lambda: window.preset_combo.count() > 0)
+pytestmark = pytest.mark.qt
+
+
+def test_scan_populates_results_and_sets_host(main_window: MainWindow, monkeypatch) -> None:
+    window = main_window
     window._open_printer_discovery()
     assert window.printer_discovery_window is not None
     assert window.printer_discovery_window.isVisible()
@@ -349,3 +349,14 @@ def test_source_tree_layout_renders_from_section_map() -> None:
     assert "config/printer.cfg" in pack.files
     assert "config/nhk.cfg" in pack.files
     assert "[include nhk.cfg]" in pack.files["config/printer.cfg"]
+
+
+def test_renderer_uses_bytecode_cache_from_environment(tmp_path, monkeypatch) -> None:
+    cache_dir = tmp_path / "j2bc"
+    monkeypatch.setenv("KLIPPCONFIG_JINJA_BYTECODE_CACHE", str(cache_dir))
+    renderer = ConfigRenderService()
+    assert renderer.env.bytecode_cache is not None
+    assert cache_dir.is_dir()
+
+    monkeypatch.delenv("KLIPPCONFIG_JINJA_BYTECODE_CACHE")
+    assert ConfigRenderService().env.bytecode_cache is None
@@ -47,3 +47,40 @@ def test_default_storage_path_uses_ssh_directory() -> None:
     service = SavedConnectionService()
     expected = Path.home() / ".ssh" / "klippconfig" / "saved_connections.json"
     assert service.storage_path == expected
+
+
+def test_saved_connections_reuse_parsed_store_until_file_changes(tmp_path, monkeypatch) -> None:
+    storage_path = tmp_path / "saved_connections.json"
+    service = SavedConnectionService(storage_path=storage_path)
+    service.save("V2.4", {"host": "printer.local", "username": "pi"})
+
+    parses: list[int] = []
+    original_parse = service._parse_store
+
+    def counting_parse():  # noqa: ANN202
+        parses.append(1)
+        return original_parse()
+
+    monkeypatch.setattr(service, "_parse_store", counting_parse)
+
+    assert service.list_names() == ["V2.4"]
+    loaded = service.load("V2.4")
+    assert loaded is not None
+    loaded["host"] = "mutated"
+    assert service.load("V2.4")["host"] == "printer.local"
+    assert len(parses) == 1
+
+    other = SavedConnectionService(storage_path=storage_path)
+    other.save("Trident", {"host": "trident.local", "username": "pi"})
+    assert service.list_names() == ["Trident", "V2.4"]
+    assert len(parses) == 2
+
+
+def test_saved_connections_write_replaces_store_without_temp_leftovers(tmp_path) -> None:
+    storage_path = tmp_path / "saved_connections.json"
+    service = SavedConnectionService(storage_path=storage_path)
+    service.save("V2.4", {"host": "printer.local", "username": "pi"})
+    service.save("Trident", {"host": "trident.local", "username": "pi"})
+
+    assert [path.name for path in tmp_path.iterdir()] == ["saved_connections.json"]
+    assert SavedConnectionService(storage_path=storage_path).list_names() == ["Trident", "V2.4"]
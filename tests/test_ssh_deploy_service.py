@@ -1,18 +1,47 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import io
+import stat
+import subprocess
+import tarfile
+import threading
+import time
+from types import SimpleNamespace
+from typing import Iterator
+
 import pytest
 
+from app.domain.models import RenderedPack
 from app.services.ssh_deploy import SSHDeployError, SSHDeployService
 
 
+class _DummyTransport:
+    def __init__(self) -> None:
+        self.active = True
+        self.keepalive: int | None = None
+
+    def is_active(self) -> bool:
+        return self.active
+
+    def set_keepalive(self, interval: int) -> None:
+        self.keepalive = interval
+
+
 class _DummyClient:
     def __init__(self) -> None:
         self.closed = False
+        self.transport = _DummyTransport()
 
     def close(self) -> None:
         self.closed = True
+        self.transport.active = False
+
+    def get_transport(self) -> _DummyTransport:
+        return self.transport
 
 
 def test_run_remote_command_success(monkeypatch) -> None:
-    service = SSHDeployService.__new__(SSHDeployService)
+    service = SSHDeployService()
     client = _DummyClient()
     captured: dict[str, object] = {}
 
@@ -55,7 +84,11 @@ def test_run_remote_command_success(monkeypatch) -> None:
         "command": "sudo systemctl restart klipper",
         "timeout": 45.0,
     }
-    assert client.closed is True
+    assert client.closed is False
+    assert client.transport.keepalive == SSHDeployService.POOL_KEEPALIVE_SECONDS
+
+    service.run_remote_command(host="printer.local", port=22, username="pi", command="true")
+    assert service.get_pooled_client("printer.local", 22, "pi") is client
 
 
 def test_run_remote_command_rejects_empty_command() -> None:
@@ -70,7 +103,7 @@ def test_run_remote_command_rejects_empty_command() -> None:
 
 
 def test_run_remote_command_surfaces_command_failure(monkeypatch) -> None:
-    service = SSHDeployService.__new__(SSHDeployService)
+    service = SSHDeployService()
     client = _DummyClient()
 
     def fake_connect(*_args, **_kwargs):  # noqa: ANN001
@@ -90,4 +123,608 @@ def test_run_remote_command_surfaces_command_failure(monkeypatch) -> None:
             command="echo test",
         )
 
-    assert client.closed is True
+    # A failing command leaves the connection usable for other operations.
+    assert client.closed is False
+    assert len(service._pool) == 1
+
+
+def test_pooled_client_is_reused_until_transport_drops(monkeypatch) -> None:
+    service = SSHDeployService()
+    created: list[_DummyClient] = []
+
+    def fake_connect(host, port, username, password=None, key_path=None):  # noqa: ANN001
+        client = _DummyClient()
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(service, "connect", fake_connect)
+
+    first = service.get_pooled_client("printer.local", 22, "pi", "secret")
+    second = service.get_pooled_client("printer.local", 22, "pi", "secret")
+    assert first is second
+    assert len(created) == 1
+
+    first.transport.active = False
+    third = service.get_pooled_client("printer.local", 22, "pi", "secret")
+    assert third is not first
+    assert first.closed is True
+
+    service.close_pooled_clients()
+    assert third.closed is True
+    assert len(created) == 2
+
+
+def test_slow_connect_does_not_block_other_hosts_and_is_shared(monkeypatch) -> None:
+    service = SSHDeployService()
+    release = threading.Event()
+    connects: list[str] = []
+
+    def fake_connect(host, port, username, password=None, key_path=None):  # noqa: ANN001
+        connects.append(host)
+        if host == "slow.local":
+            release.wait(5)
+        return _DummyClient()
+
+    monkeypatch.setattr(service, "connect", fake_connect)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        slow = [pool.submit(service.get_pooled_client, "slow.local", 22, "pi") for _ in range(2)]
+        while "slow.local" not in connects:
+            time.sleep(0.001)
+        fast = service.get_pooled_client("fast.local", 22, "pi")
+        assert not any(future.done() for future in slow)
+        release.set()
+        slow_clients = [future.result(timeout=5) for future in slow]
+
+    assert fast is not slow_clients[0]
+    assert slow_clients[0] is slow_clients[1]
+    assert connects.count("slow.local") == 1
+    assert service._pool_connecting == {}
+
+
+def test_connect_requests_compression_and_toggle_drops_pool(monkeypatch) -> None:
+    service = SSHDeployService()
+    connect_kwargs: list[dict] = []
+
+    class _RecordingClient(_DummyClient):
+        def connect(self, **kwargs) -> None:  # noqa: ANN003
+            connect_kwargs.append(kwargs)
+
+    monkeypatch.setattr(service, "_create_client", _RecordingClient)
+
+    first = service.get_pooled_client("printer.local", 22, "pi", "secret")
+    assert connect_kwargs[-1]["compress"] is True
+
+    service.set_compression(True)
+    assert first.closed is False
+
+    service.set_compression(False)
+    assert first.closed is True
+    service.get_pooled_client("printer.local", 22, "pi", "secret")
+    assert connect_kwargs[-1]["compress"] is False
+
+
+def test_download_remote_files_uses_one_sftp_channel_per_worker(tmp_path) -> None:
+    service = SSHDeployService()
+
+    class _DummySFTP:
+        def __init__(self) -> None:
+            self.closed = False
+
+        def get(self, remote_path, local_path) -> None:  # noqa: ANN001
+            with open(local_path, "w", encoding="utf-8") as handle:
+                handle.write(remote_path)
+
+        def close(self) -> None:
+            self.closed = True
+
+    class _SFTPClient:
+        def __init__(self) -> None:
+            self.sessions: list[_DummySFTP] = []
+
+        def open_sftp(self) -> _DummySFTP:
+            session = _DummySFTP()
+            self.sessions.append(session)
+            return session
+
+    client = _SFTPClient()
+    files = [
+        (f"/backups/file_{index}.cfg", tmp_path / f"file_{index}.cfg", 100 if index % 4 else 200_000)
+        for index in range(40)
+    ]
+
+    service._download_remote_files(client, files, concurrency=4)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        f"file_{index}.cfg" for index in range(40)
+    )
+    assert (tmp_path / "file_0.cfg").read_text(encoding="utf-8") == "/backups/file_0.cfg"
+    assert 1 <= len(client.sessions) <= 4
+    assert all(session.closed for session in client.sessions)
+
+
+def test_fetch_file_decodes_multibyte_characters_across_chunks(monkeypatch) -> None:
+    service = SSHDeployService()
+    text = "# température ✓\n" * 50 + "# bad byte: "
+    payload = b"\xef\xbb\xbf" + text.encode("utf-8") + b"\xff"
+
+    class _Handle:
+        def __init__(self) -> None:
+            self.offset = 0
+            self.windows: list[tuple[int, int]] = []
+
+        def __enter__(self):  # noqa: ANN204
+            return self
+
+        def __exit__(self, *_exc) -> None:  # noqa: ANN002
+            return None
+
+        def stat(self) -> SimpleNamespace:
+            return SimpleNamespace(st_size=len(payload))
+
+        def readv(self, chunks: list[tuple[int, int]]) -> Iterator[bytes]:
+            for offset, length in chunks:
+                self.windows.append((offset, length))
+                self.offset = offset + length
+                yield payload[offset : offset + length]
+
+        def read(self, size: int) -> bytes:
+            chunk = payload[self.offset : self.offset + size]
+            self.offset += size
+            return chunk
+
+    handle = _Handle()
+
+    class _SFTP:
+        def get_channel(self) -> None:
+            return None
+
+        def close(self) -> None:
+            return None
+
+        def file(self, _path, _mode):  # noqa: ANN001, ANN202
+            return handle
+
+    class _Client(_DummyClient):
+        def open_sftp(self) -> _SFTP:
+            return _SFTP()
+
+    monkeypatch.setattr(service, "connect", lambda *_args, **_kwargs: _Client())
+    monkeypatch.setattr(service, "_expand_remote_path", lambda _client, path: path)
+    monkeypatch.setattr(service, "FETCH_CHUNK_BYTES", 7)
+
+    content = service.fetch_file(
+        host="printer.local",
+        port=22,
+        username="pi",
+        remote_path="/home/pi/printer.cfg",
+    )
+
+    assert len(handle.windows) > 1
+    assert all(length <= 7 for _offset, length in handle.windows)
+    assert content == text + "\ufffd"
+
+
+def test_sftp_channel_is_shared_across_operations_until_discarded(monkeypatch) -> None:
+    service = SSHDeployService()
+
+    class _Channel:
+        def __init__(self) -> None:
+            self.closed = False
+            self.timeout: float | None = None
+
+        def settimeout(self, timeout: float) -> None:
+            self.timeout = timeout
+
+    class _Handle:
+        def __init__(self, sftp, path: str) -> None:  # noqa: ANN001
+            self.sftp = sftp
+            self.path = path
+
+        def __enter__(self):  # noqa: ANN204
+            return self
+
+        def __exit__(self, *_exc) -> None:  # noqa: ANN002
+            return None
+
+        def stat(self) -> SimpleNamespace:
+            return SimpleNamespace(st_size=0)
+
+        def set_pipelined(self, _enabled: bool) -> None:
+            return None
+
+        def write(self, data: str) -> None:
+            self.sftp.files[self.path] = data.encode("utf-8")
+
+        def read(self, _size: int) -> bytes:
+            return self.sftp.files.pop(self.path, b"")
+
+    class _SFTP:
+        def __init__(self) -> None:
+            self.channel = _Channel()
+            self.files: dict[str, bytes] = {}
+
+        def get_channel(self) -> _Channel:
+            return self.channel
+
+        def close(self) -> None:
+            self.channel.closed = True
+
+        def file(self, path: str, _mode: str) -> _Handle:
+            return _Handle(self, path)
+
+    opened: list[_SFTP] = []
+
+    class _Client(_DummyClient):
+        def open_sftp(self) -> _SFTP:
+            sftp = _SFTP()
+            opened.append(sftp)
+            return sftp
+
+    monkeypatch.setattr(service, "connect", lambda *_args, **_kwargs: _Client())
+    monkeypatch.setattr(service, "_expand_remote_path", lambda _client, path: path)
+    monkeypatch.setattr(service, "ensure_remote_dir", lambda _client, _path: None)
+
+    service.write_file("printer.local", 22, "pi", "/cfg/printer.cfg", "[printer]\n")
+    assert service.fetch_file("printer.local", 22, "pi", "/cfg/printer.cfg") == "[printer]\n"
+    assert len(opened) == 1
+    assert opened[0].channel.timeout == service.SFTP_CHANNEL_TIMEOUT_SECONDS
+
+    service.close_pooled_clients()
+    assert opened[0].channel.closed is True
+    service.fetch_file("printer.local", 22, "pi", "/cfg/printer.cfg")
+    assert len(opened) == 2
+
+
+def test_shared_sftp_session_serves_one_operation_at_a_time(monkeypatch) -> None:
+    service = SSHDeployService()
+    state = {"active": 0, "overlaps": 0}
+    state_lock = threading.Lock()
+
+    def _enter() -> None:
+        with state_lock:
+            state["active"] += 1
+            if state["active"] > 1:
+                state["overlaps"] += 1
+        time.sleep(0.005)
+
+    def _leave() -> None:
+        with state_lock:
+            state["active"] -= 1
+
+    class _Channel:
+        closed = False
+
+        def settimeout(self, _timeout: float) -> None:
+            return None
+
+    class _Entry:
+        filename = "printer.cfg"
+        st_mode = stat.S_IFREG
+
+    class _Handle:
+        def __init__(self) -> None:
+            self.data = [b"[printer]\n"]
+
+        def __enter__(self):  # noqa: ANN204
+            _enter()
+            return self
+
+        def __exit__(self, *_exc) -> None:  # noqa: ANN002
+            _leave()
+
+        def stat(self) -> SimpleNamespace:
+            return SimpleNamespace(st_size=0)
+
+        def read(self, _size: int) -> bytes:
+            return self.data.pop() if self.data else b""
+
+    class _SFTP:
+        def get_channel(self) -> _Channel:
+            return _Channel()
+
+        def close(self) -> None:
+            return None
+
+        def listdir_attr(self, _path: str) -> list[_Entry]:
+            _enter()
+            _leave()
+            return [_Entry()]
+
+        def file(self, _path: str, _mode: str) -> _Handle:
+            return _Handle()
+
+    class _Client(_DummyClient):
+        def open_sftp(self) -> _SFTP:
+            return _SFTP()
+
+    monkeypatch.setattr(service, "connect", lambda *_args, **_kwargs: _Client())
+    monkeypatch.setattr(service, "_expand_remote_path", lambda _client, path: path)
+
+    def _list() -> object:
+        return service.list_directory("printer.local", 22, "pi", "/cfg")["entries"]
+
+    def _fetch() -> object:
+        return service.fetch_file("printer.local", 22, "pi", "/cfg/printer.cfg")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(_list if index % 2 else _fetch) for index in range(32)]
+        results = [future.result(timeout=10) for future in futures]
+
+    assert state["overlaps"] == 0
+    assert results.count("[printer]\n") == 16
+    assert len(service._pool) == 1
+
+
+def test_remote_errors_keep_pooled_client_but_transport_errors_evict_it(monkeypatch) -> None:
+    service = SSHDeployService()
+    failures: list[BaseException] = []
+
+    class _Channel:
+        closed = False
+
+        def settimeout(self, _timeout: float) -> None:
+            return None
+
+    class _SFTP:
+        def get_channel(self) -> _Channel:
+            return _Channel()
+
+        def close(self) -> None:
+            return None
+
+        def listdir_attr(self, _path: str) -> list:
+            raise failures.pop(0)
+
+    class _Client(_DummyClient):
+        def open_sftp(self) -> _SFTP:
+            return _SFTP()
+
+    created: list[_Client] = []
+
+    def fake_connect(*_args, **_kwargs):  # noqa: ANN002, ANN003, ANN202
+        client = _Client()
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(service, "connect", fake_connect)
+    monkeypatch.setattr(service, "_expand_remote_path", lambda _client, path: path)
+    monkeypatch.setattr(
+        service,
+        "run_command",
+        lambda _client, command, timeout=30.0: (_ for _ in ()).throw(
+            SSHDeployError(f"Remote command failed: {command} (exit 1)")
+        ),
+    )
+
+    failures.append(FileNotFoundError(2, "No such file"))
+    with pytest.raises(SSHDeployError):
+        service.list_directory("printer.local", 22, "pi", "/missing")
+    with pytest.raises(SSHDeployError):
+        service.list_backups("printer.local", 22, "pi")
+    assert len(created) == 1
+    assert created[0].closed is False
+    assert len(service._pool) == 1
+
+    failures.append(EOFError())
+    with pytest.raises(SSHDeployError):
+        service.list_directory("printer.local", 22, "pi", "/cfg")
+    assert created[0].closed is True
+    assert service._pool == {}
+
+
+def test_remote_home_is_resolved_once_per_client(monkeypatch) -> None:
+    service = SSHDeployService()
+    commands: list[str] = []
+
+    def fake_run_command(_client, command, timeout=30.0):  # noqa: ANN001
+        commands.append(command)
+        return "/home/pi"
+
+    monkeypatch.setattr(service, "run_command", fake_run_command)
+    client = _DummyClient()
+
+    assert service._expand_remote_path(client, "~/printer_data/config") == "/home/pi/printer_data/config"
+    assert service._expand_remote_path(client, "~") == "/home/pi"
+    assert len(commands) == 1
+
+    service.discard_pooled_client(client)
+    service._expand_remote_path(client, "~/printer_data")
+    assert len(commands) == 2
+
+
+def test_backup_and_write_runs_backup_then_write_in_one_command(monkeypatch, tmp_path) -> None:
+    service = SSHDeployService()
+    config_dir = tmp_path / "printer_data" / "config"
+    config_dir.mkdir(parents=True)
+    (config_dir / "printer.cfg").write_text("[printer]\nold: 1\n", encoding="utf-8")
+    commands: list[str] = []
+
+    class _Channel:
+        def __init__(self, owner: "_Session") -> None:
+            self.owner = owner
+
+        def shutdown_write(self) -> None:
+            self.owner.finish()
+
+        def recv_exit_status(self) -> int:
+            return self.owner.result.returncode
+
+    class _Stream:
+        def __init__(self, owner: "_Session", name: str) -> None:
+            self.owner = owner
+            self.name = name
+            self.channel = _Channel(owner)
+
+        def write(self, data: bytes) -> None:
+            self.owner.input += data
+
+        def read(self) -> bytes:
+            return getattr(self.owner.result, self.name)
+
+    class _Session:
+        def __init__(self, command: str) -> None:
+            self.command = command
+            self.input = b""
+            self.result: subprocess.CompletedProcess[bytes] | None = None
+
+        def finish(self) -> None:
+            self.result = subprocess.run(
+                ["/bin/sh", "-c", self.command],
+                input=self.input,
+                capture_output=True,
+                env={"HOME": str(tmp_path), "PATH": "/usr/bin:/bin"},
+                check=False,
+            )
+
+    class _Client(_DummyClient):
+        def exec_command(self, command, timeout=None):  # noqa: ANN001, ANN202
+            commands.append(command)
+            session = _Session(command)
+            return _Stream(session, "input"), _Stream(session, "stdout"), _Stream(session, "stderr")
+
+    monkeypatch.setattr(service, "connect", lambda *_args, **_kwargs: _Client())
+
+    backup_path, saved_path = service.backup_and_write(
+        host="printer.local",
+        port=22,
+        username="pi",
+        remote_dir="~/printer_data/config",
+        remote_path="~/printer_data/config/printer.cfg",
+        content="[printer]\nnew: 2\n",
+    )
+
+    assert len(commands) == 1
+    assert saved_path == str(config_dir / "printer.cfg")
+    assert (config_dir / "printer.cfg").read_text(encoding="utf-8") == "[printer]\nnew: 2\n"
+    assert backup_path.startswith(str(tmp_path / "klippconfig_backups" / "backup-"))
+    backed_up = tmp_path / "klippconfig_backups" / backup_path.rsplit("/", 1)[1] / "printer.cfg"
+    assert backed_up.read_text(encoding="utf-8") == "[printer]\nold: 1\n"
+
+
+class _BulkChannel:
+    def __init__(self, exit_code: int) -> None:
+        self.exit_code = exit_code
+        self.write_closed = False
+
+    def shutdown_write(self) -> None:
+        self.write_closed = True
+
+    def recv_exit_status(self) -> int:
+        return self.exit_code
+
+
+class _BulkStream:
+    def __init__(self, channel: _BulkChannel) -> None:
+        self.channel = channel
+        self.data = b""
+
+    def write(self, data: bytes) -> None:
+        self.data += data
+
+    def read(self) -> bytes:
+        return b""
+
+
+class _BulkClient(_DummyClient):
+    def __init__(self, exit_code: int = 0) -> None:
+        super().__init__()
+        self.channel = _BulkChannel(exit_code)
+        self.stdin = _BulkStream(self.channel)
+        self.commands: list[str] = []
+
+    def exec_command(self, command, timeout=None):  # noqa: ANN001, ANN202
+        self.commands.append(command)
+        return self.stdin, _BulkStream(self.channel), _BulkStream(self.channel)
+
+
+def test_upload_pack_bulk_streams_one_tar_archive() -> None:
+    service = SSHDeployService()
+    client = _BulkClient()
+    pack = RenderedPack(
+        files=OrderedDict([("printer.cfg", "[printer]\n"), ("macros/start.cfg", "# ✓\n")])
+    )
+
+    uploaded = service.upload_pack_bulk(client, pack, "/home/pi/printer_data/config")
+
+    assert len(client.commands) == 1
+    assert "tar xzf - -C '/home/pi/printer_data/config'" in client.commands[0]
+    assert client.channel.write_closed is True
+    with tarfile.open(fileobj=io.BytesIO(client.stdin.data), mode="r:gz") as archive:
+        assert archive.getnames() == ["printer.cfg", "macros/start.cfg"]
+        extracted = archive.extractfile("macros/start.cfg")
+        assert extracted is not None
+        assert extracted.read().decode("utf-8") == "# ✓\n"
+    assert uploaded == [
+        "/home/pi/printer_data/config/printer.cfg",
+        "/home/pi/printer_data/config/macros/start.cfg",
+    ]
+
+
+def test_upload_pack_bulk_falls_back_to_sftp_without_tar(monkeypatch) -> None:
+    service = SSHDeployService()
+    client = _BulkClient(exit_code=SSHDeployService.TAR_MISSING_EXIT_CODE)
+    pack = RenderedPack(files=OrderedDict([("printer.cfg", "[printer]\n")]))
+    monkeypatch.setattr(
+        service,
+        "upload_pack",
+        lambda _client, _pack, remote_dir: [f"{remote_dir}/printer.cfg"],
+    )
+
+    uploaded = service.upload_pack_bulk(client, pack, "/home/pi/config")
+
+    assert uploaded == ["/home/pi/config/printer.cfg"]
+
+
+def test_run_remote_command_streams_output_lines(monkeypatch) -> None:
+    payload = "● klipper.service\n   Active: active (running)\n".encode("utf-8")
+
+    class _StreamChannel:
+        def __init__(self) -> None:
+            self.offset = 0
+            self.command: str | None = None
+
+        def settimeout(self, _timeout: float) -> None:
+            return None
+
+        def exec_command(self, command: str) -> None:
+            self.command = command
+
+        def recv(self, _size: int) -> bytes:
+            # Split mid-character to exercise the incremental decoder.
+            chunk = payload[self.offset : self.offset + 2]
+            self.offset += 2
+            return chunk
+
+        def recv_exit_status(self) -> int:
+            return 0
+
+        def makefile_stderr(self, _mode: str) -> io.BytesIO:
+            return io.BytesIO(b"")
+
+    channel = _StreamChannel()
+
+    class _StreamTransport(_DummyTransport):
+        def open_session(self) -> _StreamChannel:
+            return channel
+
+    class _Client(_DummyClient):
+        def __init__(self) -> None:
+            super().__init__()
+            self.transport = _StreamTransport()
+
+    service = SSHDeployService()
+    monkeypatch.setattr(service, "connect", lambda *_args, **_kwargs: _Client())
+    lines: list[str] = []
+
+    output = service.run_remote_command(
+        host="printer.local",
+        port=22,
+        username="pi",
+        command="systemctl status klipper",
+        on_output=lines.append,
+    )
+
+    assert channel.command == "systemctl status klipper"
+    assert lines == ["● klipper.service", "   Active: active (running)"]
+    assert output == payload.decode("utf-8")
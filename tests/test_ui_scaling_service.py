@@ -6,6 +6,9 @@ from PySide6.QtCore import QSettings
 from app.services.ui_scaling import DEFAULT_MODE, UIScalingService
 
 
+pytestmark = pytest.mark.qt
+
+
 def _settings_file(tmp_path, name: str = "ui-scaling.ini") -> QSettings:
     return QSettings(str(tmp_path / name), QSettings.Format.IniFormat)
 
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import pytest
 from PySide6.QtCore import QSettings
 
 from app.services.ui_scaling import UIScalingService
 from app.ui.main_window import MainWindow
 
 
+pytestmark = pytest.mark.qt
+
+
 def _scaling_service(tmp_path, file_name: str = "ui-scale-menu.ini") -> UIScalingService:
     settings = QSettings(str(tmp_path / file_name), QSettings.Format.IniFormat)
     settings.clear()
@@ -2,6 +2,7 @@ import json
 from pathlib import Path
 import time
 
+import pytest
 from PySide6.QtCore import QSettings
 from PySide6.QtWidgets import QApplication, QGroupBox
 
@@ -10,6 +11,9 @@ from app.services.saved_connections import SavedConnectionService
 from app.services.ssh_deploy import SSHDeployError
 
 
+pytestmark = pytest.mark.qt
+
+
 class FakeConnectionService:
     def __init__(self, ok: bool, output: str, delay_seconds: float = 0.0) -> None:
         self.ok = ok
@@ -64,6 +68,14 @@ class FakeModifyWorkflowService:
         self.saved = (kwargs["remote_path"], kwargs["content"])
         return kwargs["remote_path"]
 
+    def backup_and_write(self, **kwargs):
+        backup_path = self.create_backup(
+            remote_dir=kwargs.get("remote_dir"),
+            backup_root=kwargs.get("backup_root"),
+        )
+        saved_path = self.write_file(remote_path=kwargs["remote_path"], content=kwargs["content"])
+        return backup_path, saved_path
+
     def run_remote_command(self, **kwargs):
         if self.fail_restart:
             raise SSHDeployError("restart failed")
@@ -92,6 +104,10 @@ def _select_default_voron_preset(window: MainWindow) -> None:
         window.preset_combo.setCurrentIndex(preset_index)
 
 
+def _wait_for_remote_ops(qtbot, window: MainWindow) -> None:
+    qtbot.waitUntil(lambda: window.remote_pending_ops == 0)
+
+
 def _temp_settings(tmp_path: Path, name: str = "ui_settings.ini") -> QSettings:
     settings = QSettings(str(tmp_path / name), QSettings.Format.IniFormat)
     settings.clear()
@@ -659,12 +675,14 @@ def test_footer_device_health_indicator_updates_from_ssh_connect(qtbot) -> None:
 
     window.ssh_service = FakeConnectionService(ok=True, output="ok")
     window.tools_connect_action.trigger()
+    _wait_for_remote_ops(qtbot, window)
     assert "Connected" in window.device_health_icon.toolTip()
     assert "Voron Lab" in window.manage_connected_printer_label.text()
     assert "Voron Lab" in window.modify_connected_printer_label.text()
 
     window.ssh_service = FakeConnectionService(ok=False, output="auth failed")
     window.tools_connect_action.trigger()
+    _wait_for_remote_ops(qtbot, window)
     assert "Disconnected" in window.device_health_icon.toolTip()
     assert "No active SSH connection." in window.manage_connected_printer_label.text()
     assert "No active SSH connection." in window.modify_connected_printer_label.text()
@@ -707,6 +725,7 @@ def test_console_moved_to_tools_window_and_removed_from_workflow_tabs(qtbot) ->
     window._append_ssh_log("ssh log line")
     window._append_manage_log("manage log line")
     window._append_modify_log("modify log line")
+    qtbot.waitUntil(lambda: "[MODIFY]" in window.console_activity_log.toPlainText())
     assert "ssh log line" in window.ssh_log.toPlainText()
     assert "manage log line" in window.manage_log.toPlainText()
     assert "modify log line" in window.modify_log.toPlainText()
@@ -743,13 +762,13 @@ def test_main_tab_routes_without_resetting_configuration(qtbot) -> None:
     assert window.about_window.isVisible()
 
 
-def test_main_tab_import_existing_machine_loads_review(qtbot, monkeypatch) -> None:
+def test_main_tab_import_existing_machine_loads_review(qtbot, monkeypatch, machine_sample_root) -> None:
     window = MainWindow()
     qtbot.addWidget(window)
     window.show()
     qtbot.waitUntil(lambda: window.preset_combo.count() > 0)
 
-    fixture_root = Path(__file__).resolve().parent / "fixtures" / "existing_machine_sample"
+    fixture_root = machine_sample_root
     monkeypatch.setattr(
         window,
         "_choose_import_source",
@@ -764,13 +783,13 @@ def test_main_tab_import_existing_machine_loads_review(qtbot, monkeypatch) -> No
     assert window.generated_file_list.count() > 0
 
 
-def test_import_apply_selected_updates_configuration_controls(qtbot, monkeypatch) -> None:
+def test_import_apply_selected_updates_configuration_controls(qtbot, monkeypatch, machine_sample_root) -> None:
     window = MainWindow()
     qtbot.addWidget(window)
     window.show()
     qtbot.waitUntil(lambda: window.preset_combo.count() > 0)
 
-    fixture_root = Path(__file__).resolve().parent / "fixtures" / "existing_machine_sample"
+    fixture_root = machine_sample_root
     monkeypatch.setattr(
         window,
         "_choose_import_source",
@@ -790,14 +809,14 @@ def test_import_apply_selected_updates_configuration_controls(qtbot, monkeypatch
     assert window.toolhead_canbus_uuid_edit.text() == "abcdef1234567890"
 
 
-def test_machine_profile_save_and_load_restores_import_state(qtbot, monkeypatch, tmp_path) -> None:
+def test_machine_profile_save_and_load_restores_import_state(qtbot, monkeypatch, tmp_path, machine_sample_root) -> None:
     window = MainWindow()
     window.saved_machine_profile_service.storage_path = tmp_path / "machine_profiles.json"
     qtbot.addWidget(window)
     window.show()
     qtbot.waitUntil(lambda: window.preset_combo.count() > 0)
 
-    fixture_root = Path(__file__).resolve().parent / "fixtures" / "existing_machine_sample"
+    fixture_root = machine_sample_root
     monkeypatch.setattr(
         window,
         "_choose_import_source",
@@ -833,26 +852,63 @@ def test_modify_existing_workflow_happy_path(qtbot) -> None:
     window.modify_remote_cfg_path_edit.setText("~/printer_data/config/printer.cfg")
 
     window._modify_connect()
+    _wait_for_remote_ops(qtbot, window)
     assert "Connected" in window.device_health_icon.toolTip()
-    assert "connected" in window.modify_log.toPlainText().lower()
+    qtbot.waitUntil(lambda: "connected" in window.modify_log.toPlainText().lower())
 
     window._modify_open_remote_cfg()
+    _wait_for_remote_ops(qtbot, window)
     assert "[printer]" in window.modify_editor.toPlainText()
 
     window._modify_refactor_current_file()
+    _wait_for_remote_ops(qtbot, window)
     assert "kinematics: corexy" in window.modify_editor.toPlainText()
 
     window._modify_validate_current_file()
+    _wait_for_remote_ops(qtbot, window)
     assert "validation passed" in window.modify_status_label.text().lower()
 
     window._modify_upload_current_file()
+    _wait_for_remote_ops(qtbot, window)
     assert fake_service.backup_calls
     assert fake_service.saved is not None
     assert fake_service.saved[0].endswith("printer.cfg")
 
     window._modify_test_restart()
+    _wait_for_remote_ops(qtbot, window)
     assert fake_service.command_calls
-    assert "restart ok" in window.modify_log.toPlainText().lower()
+    qtbot.waitUntil(lambda: "restart ok" in window.modify_log.toPlainText().lower())
+
+
+def test_modify_validate_reuses_report_for_unchanged_content(qtbot, monkeypatch) -> None:
+    window = MainWindow()
+    qtbot.addWidget(window)
+    window.show()
+    qtbot.waitUntil(lambda: window.preset_combo.count() > 0)
+
+    window.modify_remote_cfg_path_edit.setText("~/printer_data/config/printer.cfg")
+    window.modify_editor.setPlainText("[printer]\nkinematics: corexy\n")
+    calls: list[str] = []
+    original = window.firmware_tools_service.validate_cfg
+
+    def counting_validate(content, **kwargs):  # noqa: ANN001, ANN202
+        calls.append(content)
+        return original(content, **kwargs)
+
+    monkeypatch.setattr(window.firmware_tools_service, "validate_cfg", counting_validate)
+    monkeypatch.setattr(window, "_show_error", lambda *_args: None)
+    monkeypatch.setattr("app.ui.main_window.QMessageBox.warning", lambda *_args: None)
+
+    window._modify_validate_current_file()
+    _wait_for_remote_ops(qtbot, window)
+    window._modify_validate_current_file()
+    _wait_for_remote_ops(qtbot, window)
+    assert len(calls) == 1
+
+    window.modify_editor.setPlainText("[printer]\nkinematics: cartesian\n")
+    window._modify_validate_current_file()
+    _wait_for_remote_ops(qtbot, window)
+    assert len(calls) == 2
 
 
 def test_modify_existing_failure_paths_log_and_error(qtbot, monkeypatch) -> None:
@@ -872,24 +928,29 @@ def test_modify_existing_failure_paths_log_and_error(qtbot, monkeypatch) -> None
 
     fake_service.fail_fetch = True
     window._modify_open_remote_cfg()
+    _wait_for_remote_ops(qtbot, window)
     assert any("fetch failed" in message for _title, message in errors)
 
     fake_service.fail_fetch = False
     window._modify_open_remote_cfg()
+    _wait_for_remote_ops(qtbot, window)
     window.modify_editor.clear()
     window._modify_upload_current_file()
+    _wait_for_remote_ops(qtbot, window)
     assert any("empty" in message.lower() for _title, message in errors)
 
     window.modify_editor.setPlainText("[printer]\nkinematics: corexy\nmax_velocity: 250\n")
     fake_service.fail_write = True
     window._modify_upload_current_file()
+    _wait_for_remote_ops(qtbot, window)
     assert any("write failed" in message for _title, message in errors)
 
     fake_service.fail_write = False
     fake_service.fail_restart = True
     window._modify_test_restart()
+    _wait_for_remote_ops(qtbot, window)
     assert any("restart failed" in message for _title, message in errors)
-    assert "failed" in window.modify_log.toPlainText().lower()
+    qtbot.waitUntil(lambda: "failed" in window.modify_log.toPlainText().lower())
 
 
 def test_successful_ssh_connection_saves_named_profile(qtbot, tmp_path) -> None:
@@ -905,6 +966,7 @@ def test_successful_ssh_connection_saves_named_profile(qtbot, tmp_path) -> None:
     window.ssh_password_edit.setText("s3cr3t")
     window.ssh_service = FakeConnectionService(ok=True, output="ok")
     window._connect_ssh_to_host()
+    _wait_for_remote_ops(qtbot, window)
 
     names = [
         window.ssh_saved_connection_combo.itemText(index)
@@ -976,6 +1038,7 @@ def test_tools_connect_menu_connects_selected_saved_profile(qtbot, tmp_path) ->
         action for action in window.tools_connect_menu.actions() if action.text() == "Shop Printer"
     )
     profile_action.trigger()
+    _wait_for_remote_ops(qtbot, window)
 
     assert window.ssh_connection_name_edit.text() == "Shop Printer"
     assert window.ssh_host_edit.text() == "printer.local"
@@ -1280,6 +1343,7 @@ def test_explore_connected_config_directory_routes_to_manage_and_refreshes(qtbot
     window.ssh_username_edit.setText("pi")
     window.ssh_service = FakeConnectionService(ok=True, output="ok")
     window._connect_ssh_to_host()
+    _wait_for_remote_ops(qtbot, window)
     assert window.device_connected is True
 
     calls: list[str | None] = []
@@ -1384,7 +1448,8 @@ def test_left_nav_has_no_legacy_route(qtbot) -> None:
     window.show()
     qtbot.waitUntil(lambda: window.preset_combo.count() > 0)
 
-    labels = [window.left_nav_scaffold.item(index).text() for index in range(window.left_nav_scaffold.count())]
+    model = window.left_nav_scaffold.route_model
+    labels = [model.index(row).data() for row in range(model.rowCount())]
     assert "Legacy" not in labels
     assert "Home" in labels
     assert "Connect" not in labels
@@ -1512,3 +1577,34 @@ def test_machine_attribute_and_addon_detail_views_update_in_configuration(qtbot)
 
     assert window.machine_attr_mcu_view.toPlainText().strip() != ""
     assert "temporarily disabled" in window.addon_package_details_view.toPlainText().lower()
+
+
+def test_modify_open_prevalidates_loaded_file(qtbot, monkeypatch) -> None:
+    window = MainWindow()
+    qtbot.addWidget(window)
+    window.show()
+    qtbot.waitUntil(lambda: window.preset_combo.count() > 0)
+
+    fake_service = FakeModifyWorkflowService()
+    window.ssh_service = fake_service
+    window.ssh_host_edit.setText("192.168.1.20")
+    window.ssh_username_edit.setText("pi")
+    window.modify_remote_cfg_path_edit.setText("~/printer_data/config/printer.cfg")
+    calls: list[str] = []
+    original = window.firmware_tools_service.validate_cfg
+
+    def counting_validate(content, **kwargs):  # noqa: ANN001, ANN202
+        calls.append(content)
+        return original(content, **kwargs)
+
+    monkeypatch.setattr(window.firmware_tools_service, "validate_cfg", counting_validate)
+    monkeypatch.setattr(window, "_show_error", lambda *_args: None)
+    monkeypatch.setattr("app.ui.main_window.QMessageBox.warning", lambda *_args: None)
+
+    window._modify_open_remote_cfg()
+    _wait_for_remote_ops(qtbot, window)
+    assert calls == [window.modify_editor.toPlainText()]
+
+    window._modify_validate_current_file()
+    _wait_for_remote_ops(qtbot, window)
+    assert len(calls) == 1